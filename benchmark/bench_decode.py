@@ -0,0 +1,182 @@
+# -*- coding: utf-8 -*-
+"""Benchmark json decoding of responses by endpoint.
+
+Payloads are loaded from directory recorded by :class:`vlivepy.transport.RecordingTransport`.
+Without ``--records``, synthetic payloads shaped like VLIVE responses are used.
+
+    $ python benchmark/bench_decode.py --records records --repeat 200
+
+Each payload is decoded by ``Response.json()`` (previous path), stdlib json and orjson(if installed).
+Compressed size with gzip and brotli(if installed) is reported too.
+"""
+
+import argparse
+import base64
+import gzip
+import json
+import os
+import sys
+from collections import defaultdict
+from time import perf_counter
+
+from requests import Response
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from vlivepy import parser  # noqa: E402
+from vlivepy import variables as gv  # noqa: E402
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+
+def synthetic_payloads():
+    html = "<p>" + "VLIVE post body text " * 40 + "</p>"
+    video = {
+        "videoSeq": 123456, "videoType": "VOD", "title": "video title", "playCount": 123456,
+        "likeCount": 1234567, "commentCount": 1234, "thumb": "https://v-phinf.pstatic.net/thumb.jpg",
+        "expose": True, "screenOrientation": "HORIZONTAL", "willStartAt": 1610000000000,
+        "onAirStartAt": 1610000000000, "createdAt": 1610000000000, "playTime": 3600,
+        "channelCode": "F001", "channelName": "channel", "multinationalTitles": [
+            {"type": "TITLE", "locale": locale, "label": "title %s" % locale}
+            for locale in ("ko_KR", "en_US", "ja_JP", "zh_CN", "zh_TW")
+        ],
+    }
+    post = {
+        "code": 1000,
+        "result": {
+            "postId": "0-18396482", "title": "post title", "body": html * 20, "plainBody": "plain " * 500,
+            "contentType": "POST", "createdAt": 1610000000000, "commentCount": 1234, "emotionCount": 123456,
+            "author": {"memberId": "abc", "nickname": "nickname", "profileImageUrl": "https://a/b.png"},
+            "attachments": {"photo": {"p%d" % i: {"url": "https://phinf/%d.jpg" % i, "width": 1080,
+                                                  "height": 1920} for i in range(20)}},
+            "playlist": {"count": 30, "data": [dict(video, videoSeq=video["videoSeq"] + i) for i in range(30)]},
+            "smartEditorAsHtml": html * 50,
+        },
+    }
+    play_info = {
+        "meta": {"subject": "video", "cover": {"source": "https://cover.jpg"}},
+        "videos": {"list": [
+            {
+                "id": "video-%d" % i, "useP2P": False, "duration": 3600.0, "printDuration": "01:00:00",
+                "size": 1000000000 + i, "type": "HLS", "encodingOption": {
+                    "id": str(i), "name": "%dP" % height, "profile": "HIGH",
+                    "width": height * 16 // 9, "height": height, "isEncodingComplete": "true",
+                    "baseDisplayName": "%dp" % height,
+                },
+                "bitrate": {"video": height * 8.0, "audio": 128.0},
+                "source": "https://apis.naver.com/video/%d.mp4?key=%s" % (i, "k" * 200),
+            }
+            for i, height in enumerate((144, 240, 360, 480, 720, 1080, 1440, 2160) * 2)
+        ]},
+        "captions": {"list": [
+            {"language": lang, "country": "KR", "locale": lang, "label": lang, "source": "https://caption.vtt",
+             "type": "cp"}
+            for lang in ("ko", "en", "ja", "zh-CN", "zh-TW", "es", "vi", "th", "id")
+        ]},
+        "thumbnails": {"list": [{"time": float(i), "source": "https://thumb/%d.jpg" % i} for i in range(200)]},
+    }
+    board = {
+        "data": [
+            {"postId": "0-%d" % i, "title": "title %d" % i, "contentType": "POST", "createdAt": 1610000000000 - i,
+             "author": {"memberId": "m%d" % i, "nickname": "nickname %d" % i}, "commentCount": i,
+             "emotionCount": i * 10, "plainBody": "body " * 30}
+            for i in range(20)
+        ],
+        "paging": {"nextParams": {"limit": "20", "after": "abc"}},
+    }
+    comments = {
+        "data": [
+            {"commentId": "%d" % i, "body": "comment body " * 10, "createdAt": 1610000000000 - i,
+             "author": {"memberId": "m%d" % i, "nickname": "nickname %d" % i}, "commentCount": 0,
+             "emotionCount": i, "root": {"type": "POST", "data": {"postId": "0-18396482"}}, "parent": {}}
+            for i in range(100)
+        ],
+        "paging": {"nextParams": {"limit": "100", "after": "abc"}},
+    }
+
+    return {
+        "endpoint_post": [json.dumps(post).encode()],
+        "endpoint_vod_play_info": [json.dumps(play_info).encode()],
+        "endpoint_board_posts": [json.dumps(board).encode()],
+        "endpoint_post_comments": [json.dumps(comments).encode()],
+    }
+
+
+def recorded_payloads(directory):
+    payloads = defaultdict(list)
+    for name in sorted(os.listdir(directory)):
+        if not name.endswith(".json"):
+            continue
+        with open(os.path.join(directory, name), encoding="utf-8") as f:
+            record = json.load(f)
+        content = base64.b64decode(record['body'])
+        try:
+            json.loads(content)
+        except ValueError:
+            continue
+        payloads[record['endpoint'] or "request"].append(content)
+
+    return payloads
+
+
+def timed(func, payloads, repeat):
+    start = perf_counter()
+    for _ in range(repeat):
+        for content in payloads:
+            func(content)
+
+    return (perf_counter() - start) / (repeat * len(payloads)) * 1000
+
+
+def requests_json(content):
+    res = Response()
+    res._content = content
+    res.encoding = "utf-8"
+    return res.json()
+
+
+def stdlib_json(content):
+    gv.override_json_backend = "json"
+    return parser.json_loads(content)
+
+
+def hook_json(content):
+    gv.override_json_backend = "auto"
+    return parser.json_loads(content)
+
+
+def main():
+    arg_parser = argparse.ArgumentParser()
+    arg_parser.add_argument("--records", help="directory recorded by RecordingTransport")
+    arg_parser.add_argument("--repeat", type=int, default=200)
+    args = arg_parser.parse_args()
+
+    payloads = recorded_payloads(args.records) if args.records else synthetic_payloads()
+    result = {
+        "source": args.records or "synthetic",
+        "orjson": parser.orjson is not None,
+        "endpoints": {},
+    }
+    for endpoint, contents in sorted(payloads.items()):
+        size = sum(len(content) for content in contents) // len(contents)
+        item = {
+            "payloads": len(contents),
+            "bytes": size,
+            "gzip_bytes": sum(len(gzip.compress(content)) for content in contents) // len(contents),
+            "response_json_ms": round(timed(requests_json, contents, args.repeat), 4),
+            "stdlib_json_ms": round(timed(stdlib_json, contents, args.repeat), 4),
+            "hook_ms": round(timed(hook_json, contents, args.repeat), 4),
+        }
+        if brotli is not None:
+            item["brotli_bytes"] = sum(len(brotli.compress(content)) for content in contents) // len(contents)
+        item["speedup"] = round(item["response_json_ms"] / item["hook_ms"], 2)
+        result["endpoints"][endpoint] = item
+
+    print(json.dumps(result, indent=2))
+
+
+if __name__ == "__main__":
+    main()
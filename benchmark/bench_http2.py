@@ -0,0 +1,139 @@
+# -*- coding: utf-8 -*-
+"""Benchmark HTTP/2 multiplexed transport against pooled HTTP/1.1 session.
+
+Local TLS server negotiates h2 or http/1.1 with ALPN and answers every request after ``--latency`` ms,
+which stands in for round trip time to VLIVE. It counts accepted TCP connections.
+
+    $ python benchmark/bench_http2.py --requests 1000 --workers 64 --latency 20
+
+Requires :code:`openssl` command to generate certificate, and httpx with http2 support.
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import ssl
+import sys
+import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from time import perf_counter
+
+import h2.config
+import h2.connection
+import h2.events
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from bench_pool import make_certificate  # noqa: E402
+from vlivepy import pool, transport  # noqa: E402
+from vlivepy.ratelimit import configureRateLimit  # noqa: E402
+from vlivepy.router import rew_get  # noqa: E402
+
+BODY = json.dumps({"code": 1000, "result": {"postId": "0-00000000", "title": "benchmark"}}).encode()
+
+
+class _Protocol(asyncio.Protocol):
+    connections = 0
+    latency = 0.0
+
+    def connection_made(self, transport):
+        _Protocol.connections += 1
+        self.transport = transport
+        self.buffer = b""
+        self.h2 = None
+        if transport.get_extra_info("ssl_object").selected_alpn_protocol() == "h2":
+            self.h2 = h2.connection.H2Connection(config=h2.config.H2Configuration(client_side=False))
+            self.h2.initiate_connection()
+            self.transport.write(self.h2.data_to_send())
+
+    def data_received(self, data):
+        if self.h2 is not None:
+            for event in self.h2.receive_data(data):
+                if isinstance(event, h2.events.RequestReceived):
+                    asyncio.ensure_future(self.respond_h2(event.stream_id))
+            self.transport.write(self.h2.data_to_send())
+        else:
+            self.buffer += data
+            while b"\r\n\r\n" in self.buffer:
+                _, self.buffer = self.buffer.split(b"\r\n\r\n", 1)
+                asyncio.ensure_future(self.respond_http11())
+
+    async def respond_h2(self, stream_id):
+        await asyncio.sleep(self.latency)
+        self.h2.send_headers(stream_id, [
+            (":status", "200"), ("content-type", "application/json"), ("content-length", str(len(BODY)))
+        ])
+        self.h2.send_data(stream_id, BODY, end_stream=True)
+        self.transport.write(self.h2.data_to_send())
+
+    async def respond_http11(self):
+        await asyncio.sleep(self.latency)
+        self.transport.write(
+            b"HTTP/1.1 200 OK\r\nContent-Type: application/json\r\nContent-Length: %d\r\n\r\n" % len(BODY) + BODY
+        )
+
+
+def start_server(cert, key):
+    context = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
+    context.load_cert_chain(cert, key)
+    context.set_alpn_protocols(["h2", "http/1.1"])
+
+    loop = asyncio.new_event_loop()
+    server = loop.run_until_complete(loop.create_server(_Protocol, "127.0.0.1", 0, ssl=context))
+    threading.Thread(target=loop.run_forever, daemon=True).start()
+    return server.sockets[0].getsockname()[1]
+
+
+def run_case(name, url, cert, count, workers):
+    _Protocol.connections = 0
+
+    def fetch(i):
+        sr = rew_get(url, params={"i": i}, verify=cert, status=[200])
+        assert sr.success
+
+    start = perf_counter()
+    with ThreadPoolExecutor(workers) as executor:
+        list(executor.map(fetch, range(count)))
+    elapsed = perf_counter() - start
+
+    return {
+        "case": name,
+        "requests": count,
+        "workers": workers,
+        "seconds": round(elapsed, 4),
+        "requests_per_second": round(count / elapsed, 1),
+        "connections": _Protocol.connections,
+    }
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    arg_parser.add_argument("--requests", type=int, default=1000)
+    arg_parser.add_argument("--workers", type=int, default=64)
+    arg_parser.add_argument("--latency", type=float, default=20, help="server latency(ms)")
+    args = arg_parser.parse_args()
+
+    _Protocol.latency = args.latency / 1000
+    configureRateLimit({})
+
+    with tempfile.TemporaryDirectory() as directory:
+        cert, key = make_certificate(directory)
+        port = start_server(cert, key)
+        url = "https://localhost:%s/globalv-web/vam-web/post/v1.0/post-0-00000000" % port
+
+        results = [run_case("pooled HTTP/1.1 (SessionTransport)", url, cert, args.requests, args.workers)]
+        pool.closePool()
+
+        http2 = transport.HTTP2Transport(verify=cert)
+        transport.setTransport(http2)
+        results.append(run_case("multiplexed HTTP/2 (HTTP2Transport)", url, cert, args.requests, args.workers))
+        transport.setTransport(None)
+        http2.close()
+
+    print(json.dumps(results, indent=2))
+
+
+if __name__ == '__main__':
+    main()
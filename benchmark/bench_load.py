@@ -0,0 +1,218 @@
+# -*- coding: utf-8 -*-
+"""Load test vlivepy against local fake VLIVE server.
+
+Workers run scenarios with real client (router, pool, rate limiter, retry and circuit breaker)
+while :class:`fake_vlive.LocalTransport` sends every request to :class:`fake_vlive.FakeVLive`.
+Every HTTP attempt is measured with hooks.
+
+    $ python benchmark/bench_load.py --workers 32 --duration 10 --latency 30 --ratelimit-rate 0.01
+
+Scenarios: post, official_video, vod_play_info, live, board, comments, channel, upcoming, schedule.
+Rate limiter is disabled unless ``--rate-limit`` is given.
+"""
+
+import argparse
+import json
+import os
+import statistics
+import sys
+import threading
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from time import perf_counter
+from warnings import catch_warnings, simplefilter
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "tests"))
+
+from fake_vlive import FakeVLive, LocalTransport  # noqa: E402
+from vlivepy import board, channel, comment, connections, pool, schedule, transport, upcoming, video  # noqa: E402
+from vlivepy.hooks import addHook, removeHook  # noqa: E402
+from vlivepy.ratelimit import configureRateLimit  # noqa: E402
+from vlivepy.retry import RetryPolicy, configureRetry  # noqa: E402
+
+
+def _comments(i):
+    items = list(comment.getPostCommentsIter("0-%d" % i))
+    items.extend(comment.getPostStarCommentsIter("0-%d" % i))
+    items.extend(comment.getNestedCommentsIter(items[0].commentId))
+    comment.getCommentData(items[0].commentId)
+    return items
+
+
+def _channel(i):
+    code = "F%04d" % (i % 100)
+    return (channel.getChannelInfo(code, silent=True), channel.getGroupedBoards(code, silent=True),
+            connections.decode_channel_code(code))
+
+
+def _live(i):
+    seq = i * 2 + 1
+    return video.getLiveStatus(seq, silent=True), video.getLivePlayInfo(seq, silent=True)
+
+
+SCENARIOS = {
+    "post": lambda i: connections.getPostInfo("0-%d" % i, silent=True),
+    "official_video": lambda i: video.getOfficialVideoPost(i, silent=True),
+    "vod_play_info": lambda i: video.getVodPlayInfo(i * 2, silent=True),
+    "live": _live,
+    "board": lambda i: list(board.getBoardPostsIter("FD53B", 1 + i % 5)),
+    "comments": _comments,
+    "channel": _channel,
+    "upcoming": lambda i: upcoming.getUpcomingList(silent=True),
+    "schedule": lambda i: schedule.getScheduleData("s%d" % i, None, silent=True),
+}
+
+
+def percentile(values, q):
+    if not values:
+        return None
+    values = sorted(values)
+    return values[min(len(values) - 1, int(round(q * (len(values) - 1))))]
+
+
+def summarize(latencies):
+    return {
+        "p50_ms": round(percentile(latencies, 0.5) * 1000, 3) if latencies else None,
+        "p99_ms": round(percentile(latencies, 0.99) * 1000, 3) if latencies else None,
+        "mean_ms": round(statistics.mean(latencies) * 1000, 3) if latencies else None,
+    }
+
+
+class Recorder(object):
+    """Collect latency and status of every HTTP attempt with hooks."""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.latencies = []
+        self.statuses = Counter()
+        self.errors = Counter()
+
+    def after_response(self, info):
+        if info.cached:
+            return
+        with self.lock:
+            self.latencies.append(info.total)
+            self.statuses[info.status_code] += 1
+
+    def on_error(self, info):
+        with self.lock:
+            self.latencies.append(info.total)
+            self.errors[type(info.error).__name__] += 1
+
+    def __enter__(self):
+        addHook("after_response", self.after_response)
+        addHook("on_error", self.on_error)
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        removeHook("after_response", self.after_response)
+        removeHook("on_error", self.on_error)
+
+
+def run(scenarios, workers, duration):
+    deadline = perf_counter() + duration
+    counter = iter(range(1, 1 << 62))
+    counter_lock = threading.Lock()
+    op_latencies = {name: [] for name in scenarios}
+    op_failures = Counter()
+
+    def worker():
+        while perf_counter() < deadline:
+            with counter_lock:
+                i = next(counter)
+            name = scenarios[i % len(scenarios)]
+            started = perf_counter()
+            try:
+                with catch_warnings():
+                    simplefilter("ignore")
+                    result = SCENARIOS[name](i)
+                if result is None:
+                    op_failures[name] += 1
+            except Exception:
+                op_failures[name] += 1
+            op_latencies[name].append(perf_counter() - started)
+
+    with Recorder() as recorder:
+        started = perf_counter()
+        with ThreadPoolExecutor(workers) as executor:
+            for future in [executor.submit(worker) for _ in range(workers)]:
+                future.result()
+        elapsed = perf_counter() - started
+
+    requests_count = sum(recorder.statuses.values()) + sum(recorder.errors.values())
+    failed = sum(count for status, count in recorder.statuses.items() if status >= 429) + \
+        sum(recorder.errors.values())
+    operations = sum(len(values) for values in op_latencies.values())
+
+    return {
+        "seconds": round(elapsed, 3),
+        "requests": requests_count,
+        "requests_per_second": round(requests_count / elapsed, 1),
+        "error_rate": round(failed / requests_count, 4) if requests_count else 0.0,
+        "statuses": {str(status): count for status, count in sorted(recorder.statuses.items())},
+        "exceptions": dict(recorder.errors),
+        "request_latency": summarize(recorder.latencies),
+        "operations": operations,
+        "operations_per_second": round(operations / elapsed, 1),
+        "operation_failure_rate": round(sum(op_failures.values()) / operations, 4) if operations else 0.0,
+        "scenarios": {
+            name: dict(count=len(values), failures=op_failures[name], **summarize(values))
+            for name, values in op_latencies.items()
+        },
+    }
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    arg_parser.add_argument("--workers", type=int, default=16)
+    arg_parser.add_argument("--duration", type=float, default=10, help="seconds")
+    arg_parser.add_argument("--scenarios", default=",".join(SCENARIOS), help="comma separated scenarios")
+    arg_parser.add_argument("--latency", type=float, default=20, help="server latency(ms)")
+    arg_parser.add_argument("--jitter", type=float, default=10, help="max random latency added(ms)")
+    arg_parser.add_argument("--ratelimit-rate", type=float, default=0.0, help="ratio of 429 responses")
+    arg_parser.add_argument("--error-rate", type=float, default=0.0, help="ratio of 500 responses")
+    arg_parser.add_argument("--rate-limit", action="store_true", help="keep client rate limiter")
+    arg_parser.add_argument("--retry-backoff", type=float, default=0.05, help="base retry delay(seconds)")
+    arg_parser.add_argument("--output", help="write result json to file")
+    args = arg_parser.parse_args()
+
+    scenarios = args.scenarios.split(",")
+    for name in scenarios:
+        if name not in SCENARIOS:
+            arg_parser.error("unknown scenario: %s" % name)
+
+    if not args.rate_limit:
+        configureRateLimit({})
+    configureRetry(RetryPolicy(backoff=args.retry_backoff, backoff_max=1))
+    pool.configurePool(pool_size=args.workers)
+
+    fake = FakeVLive(latency=args.latency / 1000, jitter=args.jitter / 1000,
+                     ratelimit_rate=args.ratelimit_rate, error_rate=args.error_rate)
+    fake.start()
+    transport.setTransport(LocalTransport(fake.url))
+    try:
+        result = run(scenarios, args.workers, args.duration)
+    finally:
+        transport.setTransport(None)
+        fake.stop()
+
+    result = {
+        "workers": args.workers,
+        "latency_ms": args.latency,
+        "ratelimit_rate": args.ratelimit_rate,
+        "error_rate_injected": args.error_rate,
+        "rate_limit": args.rate_limit,
+        **result,
+        "server": {"%s %s" % key: count for key, count in sorted(fake.stats.items())},
+    }
+
+    text = json.dumps(result, indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(text + "\n")
+    print(text)
+
+
+if __name__ == "__main__":
+    main()
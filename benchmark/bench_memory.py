@@ -0,0 +1,199 @@
+# -*- coding: utf-8 -*-
+"""Profile memory of long-running iterators and objects they yield.
+
+Iteration runs against :class:`fake_vlive.FakeVLive` in process, or records of
+:class:`vlivepy.transport.RecordingTransport` with ``--records``.
+
+    $ python benchmark/bench_memory.py --items 100000
+    $ python benchmark/bench_memory.py --records records --post-id 0-18396482
+
+Two kinds of checks are reported as JSON:
+
+- ``iterators`` : Items are consumed and dropped. RSS and tracemalloc usage are sampled every ``--every`` items.
+  Growth of traced memory per 1000 items is reported, and it should stay near zero (leak).
+  Top allocation sites grown between first and last sample are listed.
+- ``objects`` : Items are kept in list. Traced memory per item is compared with :obj:`CEILINGS` (bloat).
+
+Exit code is 1 if any check exceeds its limit.
+"""
+
+import argparse
+import gc
+import json
+import os
+import platform
+import resource
+import sys
+import tracemalloc
+from time import perf_counter
+from warnings import catch_warnings, simplefilter
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "tests"))
+
+import vlivepy  # noqa: E402
+from fake_vlive import FakeVLive, InProcessTransport  # noqa: E402
+from vlivepy.board import getBoardPostsIter  # noqa: E402
+from vlivepy.comment import getPostCommentsIter  # noqa: E402
+from vlivepy.transport import ReplayTransport, useTransport  # noqa: E402
+
+# Max traced bytes per kept item, including response data referenced by the item
+CEILINGS = {
+    "Comment": 3072,
+    "BoardPostItem": 512,
+}
+
+# Max growth of traced bytes per 1000 dropped items
+LEAK_LIMIT = 16 * 1024
+
+
+def rss_bytes():
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError):
+        return None
+
+
+def peak_rss_bytes():
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+def slope(samples):
+    """Least squares slope of traced bytes by items, as bytes per 1000 items."""
+    if len(samples) < 2:
+        return 0.0
+    xs = [item['items'] for item in samples]
+    ys = [item['traced_bytes'] for item in samples]
+    mean_x = sum(xs) / len(xs)
+    mean_y = sum(ys) / len(ys)
+    var = sum((x - mean_x) ** 2 for x in xs)
+    if not var:
+        return 0.0
+    return sum((x - mean_x) * (y - mean_y) for x, y in zip(xs, ys)) / var * 1000
+
+
+def top_growth(first, last, limit=5):
+    # allocations of samples are not a leak
+    own = [tracemalloc.Filter(False, __file__), tracemalloc.Filter(False, tracemalloc.__file__)]
+    first = first.filter_traces(own)
+    last = last.filter_traces(own)
+    return [
+        {"site": str(stat.traceback[0]), "size_diff": stat.size_diff, "count_diff": stat.count_diff}
+        for stat in last.compare_to(first, "lineno")[:limit]
+        if stat.size_diff > 0
+    ]
+
+
+def profile_iterator(name, iterator, every):
+    gc.collect()
+    tracemalloc.start()
+    samples = []
+    first = None
+    count = 0
+    started = perf_counter()
+    for _ in iterator:
+        count += 1
+        if count % every == 0:
+            gc.collect()
+            current, peak = tracemalloc.get_traced_memory()
+            samples.append({"items": count, "traced_bytes": current, "traced_peak_bytes": peak,
+                            "rss_bytes": rss_bytes()})
+            if first is None:
+                first = tracemalloc.take_snapshot()
+    elapsed = perf_counter() - started
+    gc.collect()
+    last = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+
+    growth = slope(samples[1:])
+    return {
+        "iterator": name,
+        "items": count,
+        "seconds": round(elapsed, 3),
+        "items_per_second": round(count / elapsed, 1) if elapsed else None,
+        "samples": samples,
+        "traced_growth_per_1000_items": round(growth, 1),
+        "peak_rss_bytes": peak_rss_bytes(),
+        "top_growth": top_growth(first, last) if first is not None else [],
+        "leak": growth > LEAK_LIMIT,
+    }
+
+
+def profile_objects(name, iterator, count):
+    gc.collect()
+    tracemalloc.start()
+    base, _ = tracemalloc.get_traced_memory()
+    kept = []
+    for item in iterator:
+        kept.append(item)
+        if len(kept) >= count:
+            break
+    gc.collect()
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    # list of kept items is not counted
+    per_item = (current - base - sys.getsizeof(kept)) / len(kept) if kept else 0
+    return {
+        "object": name,
+        "items": len(kept),
+        "bytes_per_item": round(per_item, 1),
+        "peak_bytes_per_item": round((peak - base) / len(kept), 1) if kept else 0,
+        "ceiling": CEILINGS[name],
+        "exceeded": per_item > CEILINGS[name],
+    }
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    arg_parser.add_argument("--items", type=int, default=100000, help="items to iterate")
+    arg_parser.add_argument("--objects", type=int, default=10000, help="items to keep for per item check")
+    arg_parser.add_argument("--every", type=int, default=1000, help="sample every n items")
+    arg_parser.add_argument("--records", help="directory recorded by RecordingTransport")
+    arg_parser.add_argument("--post-id", default="0-18396482", help="post to iterate comments")
+    arg_parser.add_argument("--channel", default="FD53B", help="channel of board to iterate posts")
+    arg_parser.add_argument("--board", default="1", help="board to iterate posts")
+    arg_parser.add_argument("--output", help="write result json to file")
+    args = arg_parser.parse_args()
+
+    if args.records:
+        transport = ReplayTransport(args.records)
+    else:
+        transport = InProcessTransport(FakeVLive(
+            posts_per_board=max(args.items, args.objects), comments_per_post=max(args.items, args.objects)
+        ))
+
+    result = {
+        "vlivepy": vlivepy.__version__,
+        "python": platform.python_version(),
+        "source": args.records or "fake",
+        "iterators": [],
+        "objects": [],
+    }
+    with useTransport(transport), catch_warnings():
+        simplefilter("ignore")
+        result["iterators"].append(profile_iterator(
+            "getPostCommentsIter", getPostCommentsIter(args.post_id), args.every
+        ))
+        result["iterators"].append(profile_iterator(
+            "getBoardPostsIter", getBoardPostsIter(args.channel, args.board), args.every
+        ))
+        result["objects"].append(profile_objects("Comment", getPostCommentsIter(args.post_id), args.objects))
+        result["objects"].append(profile_objects(
+            "BoardPostItem", getBoardPostsIter(args.channel, args.board), args.objects
+        ))
+
+    text = json.dumps(result, indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(text + "\n")
+    print(text)
+
+    if any(item['leak'] for item in result['iterators']) or any(item['exceeded'] for item in result['objects']):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
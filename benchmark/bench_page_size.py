@@ -0,0 +1,92 @@
+# -*- coding: utf-8 -*-
+"""Measure requests and time of paging with each page size.
+
+Board posts and comments are iterated to the end against :class:`fake_vlive.FakeVLive` in process.
+Every request is counted with :class:`vlivepy.budget.RequestBudget`, including rejected probes of adaptive mode.
+
+    $ python benchmark/bench_page_size.py --posts 10000 --comments 10000 --latency 20 --max-page-size 50
+
+Modes are default page size of endpoint, fixed sizes of ``--sizes`` and ``adaptive``.
+Adaptive mode starts without accepted size, so its result includes cost of probing.
+"""
+
+import argparse
+import json
+import os
+import platform
+import sys
+from time import perf_counter
+from warnings import catch_warnings, simplefilter
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "tests"))
+
+import vlivepy  # noqa: E402
+from fake_vlive import FakeVLive, InProcessTransport  # noqa: E402
+from vlivepy.board import getBoardPostsIter  # noqa: E402
+from vlivepy.budget import RequestBudget  # noqa: E402
+from vlivepy.comment import getPostCommentsIter  # noqa: E402
+from vlivepy.paginator import resetAdaptivePageSizes  # noqa: E402
+from vlivepy.transport import useTransport  # noqa: E402
+
+ITERATORS = {
+    "getBoardPostsIter": lambda page_size: getBoardPostsIter("FD53B", 1, page_size=page_size),
+    "getPostCommentsIter": lambda page_size: getPostCommentsIter("0-18396481", page_size=page_size),
+}
+
+
+def measure(name, page_size):
+    resetAdaptivePageSizes()
+    with RequestBudget() as budget:
+        started = perf_counter()
+        items = sum(1 for _ in ITERATORS[name](page_size))
+        elapsed = perf_counter() - started
+
+    return {
+        "page_size": page_size if page_size is not None else "default",
+        "items": items,
+        "requests": budget.requests,
+        "rejected": sum(1 for item in budget.plan if item.status_code == 400),
+        "seconds": round(elapsed, 3),
+    }
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    arg_parser.add_argument("--posts", type=int, default=5000, help="posts of board")
+    arg_parser.add_argument("--comments", type=int, default=5000, help="comments of post")
+    arg_parser.add_argument("--latency", type=float, default=10, help="server latency(ms)")
+    arg_parser.add_argument("--max-page-size", type=int, default=50, help="largest page size server accepts")
+    arg_parser.add_argument("--sizes", default="20,50", help="comma separated fixed page sizes")
+    arg_parser.add_argument("--output", help="write result json to file")
+    args = arg_parser.parse_args()
+
+    fake = FakeVLive(latency=args.latency / 1000, posts_per_board=args.posts, comments_per_post=args.comments,
+                     max_page_size=args.max_page_size)
+    modes = [None] + [int(size) for size in args.sizes.split(",")] + ["adaptive"]
+
+    result = {
+        "vlivepy": vlivepy.__version__,
+        "python": platform.python_version(),
+        "latency_ms": args.latency,
+        "max_page_size": args.max_page_size,
+        "iterators": {},
+    }
+    with useTransport(InProcessTransport(fake)), catch_warnings():
+        simplefilter("ignore")
+        for name in ITERATORS:
+            runs = [measure(name, mode) for mode in modes]
+            base = runs[0]['requests']
+            for run in runs:
+                run['requests_saved'] = round(1 - run['requests'] / base, 4) if base else 0.0
+            result["iterators"][name] = runs
+
+    text = json.dumps(result, indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(text + "\n")
+    print(text)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,226 @@
+# -*- coding: utf-8 -*-
+"""Micro-benchmark parsing hot paths on bundled fixtures.
+
+Responses are served from ``tests/fixtures`` by :class:`FixtureTransport`, so it runs offline.
+Each case reports time and throughput, peak memory allocated by one operation and memory retained per operation.
+
+    $ python benchmark/bench_parsing.py --output result.json
+    $ python benchmark/bench_parsing.py --compare result.json --threshold 0.2
+
+With ``--compare``, cases slower than baseline by more than ``--threshold`` are reported and exit code is 1.
+"""
+
+import argparse
+import gc
+import json
+import os
+import platform
+import statistics
+import sys
+import tracemalloc
+from time import perf_counter
+from warnings import catch_warnings, simplefilter
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+import vlivepy  # noqa: E402
+from vlivepy import parser  # noqa: E402
+from vlivepy.board import getBoardPosts  # noqa: E402
+from vlivepy.cache import build_response  # noqa: E402
+from vlivepy.channel import getChannelInfo  # noqa: E402
+from vlivepy.comment import comment_parser  # noqa: E402
+from vlivepy.model import Post  # noqa: E402
+from vlivepy.transport import Transport, useTransport  # noqa: E402
+from vlivepy.upcoming import getUpcomingList  # noqa: E402
+
+FIXTURES = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "tests", "fixtures")
+
+# Fixture file served for each endpoint
+ENDPOINT_FIXTURES = {
+    "endpoint_board_posts": "board_posts.json",
+    "endpoint_post_comments": "post_comments.json",
+    "endpoint_post": "post.json",
+    "endpoint_fvideo_inkey": "fvideo_inkey.json",
+    "endpoint_vod_play_info": "vod_play_info.json",
+    "endpoint_upcoming": "upcoming.html",
+    "endpoint_channel_webpage": "channel.html",
+}
+
+
+def load_fixture(name):
+    with open(os.path.join(FIXTURES, name), "rb") as f:
+        return f.read()
+
+
+class FixtureTransport(Transport):
+    """Transport serving bundled fixture by endpoint name."""
+
+    uses_network = False
+
+    def __init__(self, fixtures=None):
+        self.contents = {
+            endpoint: load_fixture(name) for endpoint, name in (fixtures or ENDPOINT_FIXTURES).items()
+        }
+
+    def request(self, method, url, session, endpoint=None, identity="", **kwargs):
+        content = self.contents[endpoint]
+        content_type = "text/html" if content.lstrip().startswith(b"<") else "application/json"
+        return build_response(200, {"Content-Type": content_type}, url, content, "utf-8")
+
+
+def build_cases():
+    board = json.loads(load_fixture("board_posts.json"))
+    comments = json.loads(load_fixture("post_comments.json"))
+    membership = json.loads(load_fixture("membership.json"))
+    inkey = json.loads(load_fixture("fvideo_inkey.json"))
+    play_info = json.loads(load_fixture("vod_play_info.json"))
+    timestamps = [1610000000000 + i * 7 for i in range(1000)]
+    post = Post("0-18396482")
+
+    def stripper():
+        parser.response_json_stripper(inkey)
+        parser.response_json_stripper(board)
+        with catch_warnings():
+            simplefilter("ignore")
+            parser.response_json_stripper(membership)
+
+    def timestamp_parser():
+        for ts in timestamps:
+            parser.v_timestamp_parser(ts)
+
+    # name: (function, items per operation)
+    return {
+        "response_json_stripper": (stripper, 3),
+        "comment_parser": (lambda: comment_parser(comments['data']), len(comments['data'])),
+        "getBoardPosts": (lambda: getBoardPosts("FD53B", 1234), len(board['data'])),
+        "getUpcomingList": (getUpcomingList, 80),
+        "getChannelInfo": (lambda: getChannelInfo("FD53B"), 1),
+        "Post.formatted_body": (post.formatted_body, 1),
+        "max_res_from_play_info": (lambda: parser.max_res_from_play_info(play_info), len(play_info['videos']['list'])),
+        "v_timestamp_parser": (timestamp_parser, len(timestamps)),
+    }
+
+
+def autorange(func, target):
+    number = 1
+    while True:
+        start = perf_counter()
+        for _ in range(number):
+            func()
+        if perf_counter() - start >= target:
+            return number
+        number *= 2
+
+
+def measure_time(func, repeat, target):
+    number = autorange(func, target)
+    timings = []
+    for _ in range(repeat):
+        gc.collect()
+        start = perf_counter()
+        for _ in range(number):
+            func()
+        timings.append((perf_counter() - start) / number)
+
+    return number, timings
+
+
+def measure_memory(func, number):
+    gc.collect()
+    tracemalloc.start()
+    try:
+        func()
+        gc.collect()
+        tracemalloc.reset_peak()
+        base, _ = tracemalloc.get_traced_memory()
+        func()
+        _, peak = tracemalloc.get_traced_memory()
+
+        gc.collect()
+        base, _ = tracemalloc.get_traced_memory()
+        for _ in range(number):
+            func()
+        gc.collect()
+        current, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return peak - base, max(current - base, 0) / number
+
+
+def run(names, repeat, target):
+    results = {}
+    with useTransport(FixtureTransport()):
+        cases = build_cases()
+        for name, (func, items) in cases.items():
+            if names and name not in names:
+                continue
+            number, timings = measure_time(func, repeat, target)
+            median = statistics.median(timings)
+            peak, retained = measure_memory(func, min(number, 50))
+            results[name] = {
+                "items_per_op": items,
+                "loops": number,
+                "median_us": round(median * 1e6, 3),
+                "min_us": round(min(timings) * 1e6, 3),
+                "stdev_us": round(statistics.stdev(timings) * 1e6, 3) if len(timings) > 1 else 0.0,
+                "ops_per_sec": round(1 / median, 1),
+                "items_per_sec": round(items / median, 1),
+                "peak_alloc_bytes": peak,
+                "retained_bytes_per_op": round(retained, 1),
+            }
+
+    return results
+
+
+def compare(results, baseline, threshold):
+    regressions = []
+    for name, item in sorted(results.items()):
+        base = baseline['benchmarks'].get(name)
+        if base is None:
+            continue
+        ratio = item['median_us'] / base['median_us']
+        item['baseline_median_us'] = base['median_us']
+        item['ratio'] = round(ratio, 3)
+        if ratio > 1 + threshold:
+            regressions.append(name)
+
+    return regressions
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    arg_parser.add_argument("names", nargs="*", help="cases to run, defaults to every case")
+    arg_parser.add_argument("--repeat", type=int, default=7)
+    arg_parser.add_argument("--target", type=float, default=0.1, help="min seconds of one repeat")
+    arg_parser.add_argument("--output", help="write result json to file")
+    arg_parser.add_argument("--compare", help="baseline result json to compare")
+    arg_parser.add_argument("--threshold", type=float, default=0.2, help="allowed slowdown ratio")
+    args = arg_parser.parse_args()
+
+    result = {
+        "vlivepy": vlivepy.__version__,
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "orjson": parser.orjson is not None,
+        "benchmarks": run(args.names, args.repeat, args.target),
+    }
+
+    regressions = []
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            regressions = compare(result['benchmarks'], json.load(f), args.threshold)
+        result['regressions'] = regressions
+
+    text = json.dumps(result, indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(text + "\n")
+    print(text)
+
+    if regressions:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,115 @@
+# -*- coding: utf-8 -*-
+"""Benchmark pooled keep-alive session against per-request connection.
+
+Local HTTPS server with self-signed certificate stands in for VLIVE.
+It counts accepted TCP connections, so each new connection means one more TCP + TLS handshake.
+
+    $ python benchmark/bench_pool.py --requests 200
+
+Requires :code:`openssl` command to generate certificate.
+"""
+
+import argparse
+import json
+import os
+import ssl
+import subprocess
+import sys
+import tempfile
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from time import perf_counter
+
+import reqWrapper
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from vlivepy import pool  # noqa: E402
+from vlivepy.router import rew_get  # noqa: E402
+
+BODY = json.dumps({"code": 1000, "result": {"postId": "0-00000000", "title": "benchmark"}}).encode()
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+    connections = 0
+    lock = threading.Lock()
+
+    def setup(self):
+        with _Handler.lock:
+            _Handler.connections += 1
+        super().setup()
+
+    def do_GET(self):
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(BODY)))
+        self.end_headers()
+        self.wfile.write(BODY)
+
+    def log_message(self, *args):
+        pass
+
+
+def make_certificate(directory):
+    cert = os.path.join(directory, "cert.pem")
+    key = os.path.join(directory, "key.pem")
+    subprocess.run(
+        ["openssl", "req", "-x509", "-newkey", "rsa:2048", "-nodes", "-days", "1",
+         "-subj", "/CN=localhost", "-addext", "subjectAltName=DNS:localhost,IP:127.0.0.1",
+         "-keyout", key, "-out", cert],
+        check=True, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+    )
+    return cert, key
+
+
+def start_server(cert, key):
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    context = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
+    context.load_cert_chain(cert, key)
+    server.socket = context.wrap_socket(server.socket, server_side=True)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def run_case(name, func, count):
+    _Handler.connections = 0
+    start = perf_counter()
+    for _ in range(count):
+        sr = func()
+        assert sr.success
+    elapsed = perf_counter() - start
+    return {
+        "case": name,
+        "requests": count,
+        "seconds": round(elapsed, 4),
+        "ms_per_request": round(elapsed / count * 1000, 3),
+        "connections": _Handler.connections,
+    }
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    arg_parser.add_argument("--requests", type=int, default=200)
+    args = arg_parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        cert, key = make_certificate(directory)
+        server = start_server(cert, key)
+        url = "https://localhost:%s/globalv-web/vam-web/post/v1.0/post-0-00000000" % server.server_port
+
+        results = [
+            run_case("per-request connection (reqWrapper.get)",
+                     lambda: reqWrapper.get(url, verify=cert, status=[200]), args.requests),
+            run_case("pooled keep-alive (rew_get)",
+                     lambda: rew_get(url, verify=cert, status=[200]), args.requests),
+        ]
+        pool.closePool()
+        server.shutdown()
+
+    print(json.dumps(results, indent=2))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,130 @@
+# -*- coding: utf-8 -*-
+"""Measure allocation and time of data accessors for attachment-heavy posts.
+
+Post is loaded from :class:`fake_vlive.FakeVLive` in process with ``--photos`` photo attachments.
+Each accessor is measured in two modes:
+
+- ``readonly`` : Accessors of :class:`vlivepy.Post` returning frozen data as is.
+- ``copy`` : Accessors deep-copying data on every access, as before :mod:`vlivepy.frozen`.
+
+    $ python benchmark/bench_readonly.py --photos 200 --repeat 1000
+
+Allocated bytes are peak traced bytes of single access, including the result kept until it returns.
+Data is frozen once when post is loaded, and cost of it is reported as ``freeze``.
+"""
+
+import argparse
+import gc
+import json
+import os
+import platform
+import sys
+import tracemalloc
+from copy import deepcopy
+from time import perf_counter
+from warnings import catch_warnings, simplefilter
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "tests"))
+
+import vlivepy  # noqa: E402
+from fake_vlive import FakeVLive, InProcessTransport  # noqa: E402
+from vlivepy.frozen import freeze, thaw  # noqa: E402
+from vlivepy.model import Post  # noqa: E402
+from vlivepy.transport import useTransport  # noqa: E402
+
+
+class CopyingPost(Post):
+    """Post with accessors deep-copying plain data on every access."""
+
+    @property
+    def raw(self):
+        return deepcopy(self._data_cache)
+
+    @property
+    def attachments(self):
+        return deepcopy(self._data_cache['attachments'])
+
+    @property
+    def attachments_photo(self):
+        return deepcopy(self._data_cache['attachments'].get('photo', {}))
+
+    @property
+    def author(self):
+        return deepcopy(self._data_cache['author'])
+
+
+ACCESSORS = {
+    "raw": lambda post: post.raw,
+    "attachments": lambda post: post.attachments,
+    "attachments_photo": lambda post: post.attachments_photo,
+    "author": lambda post: post.author,
+    "formatted_body": lambda post: post.formatted_body(),
+}
+
+
+def allocated(access, post):
+    gc.collect()
+    tracemalloc.start()
+    base, _ = tracemalloc.get_traced_memory()
+    access(post)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return peak - base
+
+
+def measure(access, post, repeat):
+    access(post)
+    started = perf_counter()
+    for _ in range(repeat):
+        access(post)
+    elapsed = perf_counter() - started
+    return {
+        "allocated_bytes": allocated(access, post),
+        "us_per_access": round(elapsed / repeat * 1000000, 2),
+    }
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    arg_parser.add_argument("--photos", type=int, default=200, help="photo attachments of post")
+    arg_parser.add_argument("--repeat", type=int, default=1000, help="accesses to time")
+    arg_parser.add_argument("--output", help="write result json to file")
+    args = arg_parser.parse_args()
+
+    fake = FakeVLive(photos_per_post=args.photos)
+    with useTransport(InProcessTransport(fake)), catch_warnings():
+        simplefilter("ignore")
+        post = Post("0-1")
+
+    copying = CopyingPost("0-1", lazy=True)
+    copying._data_cache = thaw(post.raw)
+
+    result = {
+        "vlivepy": vlivepy.__version__,
+        "python": platform.python_version(),
+        "photos": args.photos,
+        "freeze": measure(freeze, copying._data_cache, max(1, args.repeat // 10)),
+        "accessors": {},
+    }
+    for name, access in ACCESSORS.items():
+        # formatted_body parses html, so it is repeated less
+        repeat = max(1, args.repeat // 100) if name == "formatted_body" else args.repeat
+        readonly = measure(access, post, repeat)
+        copy = measure(access, copying, repeat)
+        result["accessors"][name] = {
+            "readonly": readonly,
+            "copy": copy,
+            "allocation_saved": round(1 - readonly['allocated_bytes'] / copy['allocated_bytes'], 4)
+            if copy['allocated_bytes'] else 0.0,
+        }
+
+    text = json.dumps(result, indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(text + "\n")
+    print(text)
+
+
+if __name__ == "__main__":
+    main()
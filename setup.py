@@ -7,7 +7,7 @@ with open("README.md", "r", encoding="utf8") as fh:
 setup(
     name='vlivepy',
     version=vlivepy.__version__,
-    packages=['vlivepy'],
+    packages=['vlivepy', 'vlivepy.aio'],
     url='https://github.com/box-archived/vlive-py',
     license='MIT License',
     author='box-archived',
@@ -19,5 +19,10 @@ setup(
         'requests>=2.22',
         'reqWrapper>=0.2.1',
         'beautifulsoup4>=4.9.3'
-    ]
+    ],
+    extras_require={
+        'aio': ['httpx>=0.18'],
+        'http2': ['httpx[http2]>=0.18'],
+        'speedups': ['orjson>=3', 'brotli>=1'],
+    }
 )
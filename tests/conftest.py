@@ -0,0 +1,65 @@
+# -*- coding: utf-8 -*-
+
+import os
+import sys
+import warnings
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from fake_vlive import FakeVLive, InProcessTransport  # noqa: E402
+from vlivepy import variables as gv  # noqa: E402
+from vlivepy.paginator import resetAdaptivePageSizes  # noqa: E402
+from vlivepy.ratelimit import configureRateLimit  # noqa: E402
+from vlivepy.retry import RetryPolicy, configureRetry, resetCircuitBreakers  # noqa: E402
+from vlivepy.transport import useTransport  # noqa: E402
+
+
+@pytest.fixture(autouse=True)
+def clean_state():
+    # Retries without delay, and no state left by other tests
+    configureRetry(RetryPolicy(backoff=0))
+    resetCircuitBreakers()
+    resetAdaptivePageSizes()
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        yield
+    configureRetry()
+    resetCircuitBreakers()
+    resetAdaptivePageSizes()
+
+
+@pytest.fixture
+def fake():
+    """FakeVLive answering every sync request in process."""
+    server = FakeVLive(posts_per_board=45, comments_per_post=45)
+    with useTransport(InProcessTransport(server)):
+        yield server
+
+
+@pytest.fixture
+def aio_fake(monkeypatch):
+    """FakeVLive server answering every request of :mod:`vlivepy.aio`."""
+    httpx = pytest.importorskip("httpx")
+    import vlivepy.aio.router
+
+    server = FakeVLive(posts_per_board=45, comments_per_post=45)
+    server.start()
+    port = int(server.url.rsplit(":", 1)[1])
+
+    class Redirect(httpx.AsyncBaseTransport):
+        def __init__(self):
+            self.inner = httpx.AsyncHTTPTransport()
+
+        async def handle_async_request(self, request):
+            request.url = request.url.copy_with(scheme="http", host="127.0.0.1", port=port)
+            return await self.inner.handle_async_request(request)
+
+    # Client is made in each test, since it is bound to event loop of asyncio.run
+    monkeypatch.setattr(vlivepy.aio.router, "get_client", lambda: httpx.AsyncClient(transport=Redirect()))
+    limits = gv.override_rate_limits
+    configureRateLimit({})
+    yield server
+    configureRateLimit(limits)
+    server.stop()
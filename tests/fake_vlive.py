@@ -0,0 +1,502 @@
+# -*- coding: utf-8 -*-
+"""Local stand-in server of VLIVE for end-to-end and load testing.
+
+Every URL shape of :mod:`vlivepy.variables` is served with data shaped like VLIVE responses.
+:class:`LocalTransport` sends requests of vlivepy to the server, keeping path and query of original url,
+so rate limiter, retry and circuit breaker work as with VLIVE.
+
+    $ python tests/fake_vlive.py --port 8000 --latency 30 --ratelimit-rate 0.01
+
+Behaviors:
+
+- Board posts and comments are paged with ``paging.nextParams.after`` cursor.
+  ``limit`` larger than ``max_page_size`` answers 400.
+  Comments without ``limit`` are paged by 100, or by ``max_page_size`` if it is smaller.
+- Posts and schedules answer only fields listed in ``fields`` parameter.
+- Board posts are sorted by ``sortType`` (``LATEST`` or ``OLDEST``). Every 5th post is official video post.
+- Posts ``1-<seq>`` are official video posts of video ``<seq>``, same as answered by official video route.
+- Posts ``0-<id>`` with id ending with ``0``, and boards with id over 9000 are membership only.
+  They answer 403 with ``errorCode`` + ``data`` payload, which :func:`vlivepy.parser.response_json_stripper` warns on.
+- Official video posts with even seq are VOD and odd seq are live.
+- ``latency`` and ``jitter`` delay every response.
+- ``ratelimit_rate`` of requests answer 429 with ``Retry-After`` and ``error_rate`` of requests answer 500.
+"""
+
+import argparse
+import json
+import os
+import random
+import re
+import sys
+import threading
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from time import sleep
+from urllib.parse import parse_qs, urlsplit, urlunsplit
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from vlivepy.cache import build_response  # noqa: E402
+from vlivepy.transport import SessionTransport, Transport  # noqa: E402
+
+FIXTURES = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures")
+
+BASE_CREATED_AT = 1610000000000
+
+
+def _fixture(name):
+    with open(os.path.join(FIXTURES, name), encoding="utf-8") as f:
+        return f.read()
+
+
+def _author(seed):
+    return {"memberId": "%032x" % (seed * 2654435761 % (1 << 128)), "nickname": "fan_%d" % seed,
+            "profileImageUrl": "https://vlive-phinf.pstatic.net/profile_%d.jpg" % seed}
+
+
+def _cursor(offset):
+    return "cursor-%d" % offset
+
+
+def _offset(params):
+    after = params.get("after", "")
+    return int(after[len("cursor-"):]) if after.startswith("cursor-") else 0
+
+
+def _page(items, total, params, limit):
+    offset = _offset(params)
+    data = items(offset, min(limit, max(0, total - offset)))
+    paging = {}
+    if offset + limit < total:
+        paging["nextParams"] = {"limit": str(limit), "after": _cursor(offset + limit)}
+    return {"data": data, "paging": paging}
+
+
+def _parse_fields(fields):
+    # "a,b{c,d},e.limit(3)" -> {"a": None, "b": {"c": None, "d": None}, "e": None}
+    parsed = {}
+    depth = 0
+    token = ""
+    for char in fields + ",":
+        if char in "{(":
+            depth += 1
+        elif char in "})":
+            depth -= 1
+        if char == "," and depth == 0:
+            name, _, sub = token.partition("{")
+            name = name.split(".")[0].split("(")[0]
+            if name:
+                parsed[name] = _parse_fields(sub[:-1]) if sub else None
+            token = ""
+        else:
+            token += char
+    return parsed
+
+
+def _project(data, fields):
+    if not fields:
+        return data
+    projected = {}
+    for name, sub in fields.items():
+        if name in data:
+            projected[name] = _project(data[name], sub) if sub and isinstance(data[name], dict) else data[name]
+    return projected
+
+
+def _invalid_limit(limit):
+    return 400, {"errorCode": "common_400", "message": "Invalid limit: %d" % limit}
+
+
+def _membership(message, data):
+    return 403, {"errorCode": "common_403", "message": message, "data": data}
+
+
+class FakeVLive(object):
+    """Fake VLIVE server running in background thread.
+
+    Arguments:
+        latency (:class:`float`, optional) : Seconds to delay every response, defaults to 0.
+        jitter (:class:`float`, optional) : Max random seconds added to latency, defaults to 0.
+        ratelimit_rate (:class:`float`, optional) : Ratio of requests answering 429, defaults to 0.
+        error_rate (:class:`float`, optional) : Ratio of requests answering 500, defaults to 0.
+        posts_per_board (:class:`int`, optional) : Posts of each board, defaults to 200.
+        comments_per_post (:class:`int`, optional) : Comments of each post, defaults to 250.
+        max_page_size (:class:`int`, optional) : Largest ``limit`` of board and comment pages.
+            Larger limit is answered with 400, defaults to 100.
+        photos_per_post (:class:`int`, optional) : Photo attachments of each post, defaults to 1.
+        seed (:class:`int`, optional) : Random seed of fault injection, defaults to None.
+    """
+
+    def __init__(
+            self,
+            latency: float = 0,
+            jitter: float = 0,
+            ratelimit_rate: float = 0,
+            error_rate: float = 0,
+            posts_per_board: int = 200,
+            comments_per_post: int = 250,
+            max_page_size: int = 100,
+            photos_per_post: int = 1,
+            seed: int = None
+    ):
+        self.latency = latency
+        self.jitter = jitter
+        self.ratelimit_rate = ratelimit_rate
+        self.error_rate = error_rate
+        self.posts_per_board = posts_per_board
+        self.comments_per_post = comments_per_post
+        self.max_page_size = max_page_size
+        self.photos_per_post = photos_per_post
+        self.random = random.Random(seed)
+        self.stats = Counter()
+        self.lock = threading.Lock()
+        self.server = None
+        self.upcoming_html = _fixture("upcoming.html")
+        self.channel_html = _fixture("channel.html")
+        self.play_info = json.loads(_fixture("vod_play_info.json"))
+        self.routes = [
+            ("POST", r"/auth/email/login", self.auth),
+            ("GET", r"/auth/email/login", self.login_page),
+            ("GET", r"/home", self.home),
+            ("GET", r"/globalv-web/vam-web/post/v1\.0/post-(?P<post>[\w-]+)", self.post),
+            ("GET", r"/globalv-web/vam-web/post/v1\.0/officialVideoPost-(?P<seq>\d+)", self.official_video_post),
+            ("GET", r"/globalv-web/vam-web/post/v1\.0/board-(?P<board>\d+)/posts", self.board_posts),
+            ("GET", r"/globalv-web/vam-web/old/v3/live/(?P<seq>\d+)/playInfo", self.live_play_info),
+            ("GET", r"/globalv-web/vam-web/old/v2/live/(?P<seq>\d+)/status", self.live_status),
+            ("GET", r"/globalv-web/vam-web/video/v1\.0/vod/(?P<seq>\d+)/inkey", self.vod_inkey),
+            ("GET", r"/globalv-web/vam-web/fvideo/v1\.0/fvideo-(?P<fvideo>[\w-]+)/inKey", self.fvideo_inkey),
+            ("GET", r"/rmcnmv/rmcnmv/vod/play/v2\.0/(?P<vod>[\w-]+)", self.vod_play_info),
+            ("GET", r"/globalv-web/vam-web/comment/v1\.0/(?P<kind>post|comment)-(?P<srl>[\w-]+)"
+                    r"/(?P<postfix>comments|starComments)", self.comment_list),
+            ("GET", r"/globalv-web/vam-web/comment/v1\.0/comment-(?P<comment>[\w-]+)", self.comment_data),
+            ("GET", r"/globalv-web/vam-web/schedule/v1\.0/schedule-(?P<schedule>[\w-]+)", self.schedule),
+            ("GET", r"/vproxy/channelplus/decodeChannelCode", self.decode_channel_code),
+            ("GET", r"/globalv-web/vam-web/board/v1\.0/channel-(?P<channel>\w+)/groupedBoards", self.grouped_boards),
+            ("GET", r"/channel/(?P<channel>\w+)", self.channel_webpage),
+            ("GET", r"/upcoming", self.upcoming),
+        ]
+        self.routes = [(method, re.compile(pattern + "$"), func) for method, pattern, func in self.routes]
+
+    def __repr__(self):
+        return "<FakeVLive [%s]>" % (self.url if self.server else "stopped")
+
+    @property
+    def url(self) -> str:
+        return "http://127.0.0.1:%d" % self.server.server_address[1]
+
+    def start(self, port: int = 0) -> int:
+        """Start server in background thread and return port."""
+        fake = self
+
+        class Handler(_Handler):
+            server_fake = fake
+
+        self.server = ThreadingHTTPServer(("127.0.0.1", port), Handler)
+        self.server.daemon_threads = True
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        return self.server.server_address[1]
+
+    def stop(self) -> None:
+        if self.server is not None:
+            self.server.shutdown()
+            self.server.server_close()
+            self.server = None
+
+    def count(self, key) -> None:
+        with self.lock:
+            self.stats[key] += 1
+
+    def dispatch(self, method, path, params, body):
+        """Route request and return (status, headers, payload). Payload is dict for json or str for html."""
+        delay = self.latency + (self.random.uniform(0, self.jitter) if self.jitter else 0)
+        if delay:
+            sleep(delay)
+
+        for route_method, pattern, func in self.routes:
+            match = pattern.match(path)
+            if match and route_method == method:
+                name = func.__name__
+                break
+        else:
+            self.count(("unknown", 404))
+            return 404, {}, {"errorCode": "common_404", "message": "Not found"}
+
+        roll = self.random.random()
+        if roll < self.ratelimit_rate:
+            self.count((name, 429))
+            return 429, {"Retry-After": "1"}, {"errorCode": "common_429", "message": "Too many requests"}
+        elif roll < self.ratelimit_rate + self.error_rate:
+            self.count((name, 500))
+            return 500, {}, {"errorCode": "common_500", "message": "Internal server error"}
+
+        result = func(params=params, body=body, **match.groupdict())
+        status, payload = result[0], result[1]
+        headers = result[2] if len(result) > 2 else {}
+        self.count((name, status))
+        return status, headers, payload
+
+    # Routes
+    def auth(self, params, body):
+        form = parse_qs(body.decode())
+        if form.get("pwd", [""])[0] == "wrong":
+            return 302, "", {"Location": "/auth/email/login?error=1"}
+        return 302, "", {"Location": "/home", "Set-Cookie": "NEO_SES=fake-session; Path=/"}
+
+    def login_page(self, params, body):
+        return 200, "<html><body>Sign in</body></html>"
+
+    def home(self, params, body):
+        return 200, "<html><body>VLIVE</body></html>"
+
+    def _post_data(self, post_id, content_type="POST", video_seq=None):
+        seed = sum(map(ord, post_id))
+        data = {
+            "postId": post_id, "title": "Post %s" % post_id, "contentType": content_type,
+            "body": "Body of post %s\nsecond line%s" % (post_id, "".join(
+                "<v:attachment id=\"p%d\" type=\"photo\"></v:attachment>" % i
+                for i in range(1, self.photos_per_post + 1)
+            )),
+            "plainBody": "Body of post %s" % post_id, "createdAt": BASE_CREATED_AT - seed * 1000,
+            "author": _author(seed), "commentCount": self.comments_per_post, "emotionCount": seed * 10,
+            "channel": {"channelCode": "FD53B", "channelName": "Channel"}, "channelCode": "FD53B",
+            "attachments": {"photo": {
+                "p%d" % i: {"photoId": "p%d" % i, "url": "https://phinf/p%d.jpg" % i, "width": 1080, "height": 1350}
+                for i in range(1, self.photos_per_post + 1)
+            }, "video": {}},
+            "isCommentEnabled": True, "isHiddenFromStar": False, "isViewerBookmarked": False, "writtenIn": "ko",
+            "smartEditorAsHtml": "<div class=\"se-viewer\">%s</div>" % "".join(
+                "<p class=\"se-text-paragraph\"><span>Line %d of post %s</span></p>" % (i, post_id) for i in range(40)
+            ),
+        }
+        if video_seq is not None:
+            vod = int(video_seq) % 2 == 0
+            data["officialVideo"] = {
+                "videoSeq": int(video_seq), "type": "VOD" if vod else "LIVE", "title": "Video %s" % video_seq,
+                "playCount": seed, "likeCount": seed, "commentCount": seed, "thumb": "https://thumb.jpg",
+                "channelCode": "FD53B", "channelName": "Channel", "expose": True, "screenOrientation": "HORIZONTAL",
+                "willStartAt": BASE_CREATED_AT, "onAirStartAt": BASE_CREATED_AT, "createdAt": BASE_CREATED_AT,
+                "playTime": 600, "status": "ON_AIR" if not vod else "ENDED", "multinationalTitles": [],
+            }
+            if vod:
+                data["officialVideo"]["vodId"] = "VOD%012d" % int(video_seq)
+        return data
+
+    def post(self, post, params, body):
+        # "1-<seq>" is post of official video <seq>, same as official_video_post
+        if post.startswith("1-"):
+            return self.official_video_post(post[2:], params, body)
+        data = self._post_data(post)
+        if post.endswith("0"):
+            return _membership("Membership only\ncontent", {"postId": post, "title": data['title']})
+        return 200, _project(data, _parse_fields(params.get("fields", "")))
+
+    def official_video_post(self, seq, params, body):
+        data = self._post_data("1-%s" % seq, content_type="VIDEO", video_seq=seq)
+        return 200, _project(data, _parse_fields(params.get("fields", "")))
+
+    def board_posts(self, board, params, body):
+        latest = params.get("sortType", "LATEST") == "LATEST"
+
+        def item(number):
+            # Post <number> is created a minute before post <number - 1>
+            video = number % 5 == 0
+            return {
+                "postId": "%d-%d" % (1 if video else 0, int(board) * 100000 + number), "title": "Post %d" % number,
+                "author": {"nickname": "fan_%d" % number}, "contentType": "VIDEO" if video else "POST",
+                "createdAt": BASE_CREATED_AT - number * 60000,
+            }
+
+        def items(offset, count):
+            return [
+                item(offset + i if latest else self.posts_per_board - 1 - (offset + i)) for i in range(count)
+            ]
+
+        limit = int(params["limit"])
+        if limit > self.max_page_size:
+            return _invalid_limit(limit)
+        page = _page(items, self.posts_per_board, params, limit)
+        if int(board) > 9000:
+            return _membership("Membership only board", {"data": page['data'][:3], "paging": {}})
+        return 200, page
+
+    def live_play_info(self, seq, params, body):
+        if int(seq) % 2 == 0:
+            return 200, {"code": 2001, "message": "not live"}
+        return 200, {"code": 1000, "result": {"streamList": [{"serviceUrl": "https://live/%s.m3u8" % seq}],
+                                              "vpdid2": params.get("vpdid2")}}
+
+    def live_status(self, seq, params, body):
+        if int(seq) % 2 == 0:
+            return 200, {"code": 2001, "message": "not live"}
+        return 200, {"code": 1000, "result": {"status": "ON_AIR", "videoSeq": int(seq)}}
+
+    def vod_inkey(self, seq, params, body):
+        if int(seq) % 2 != 0:
+            return 403, {"errorCode": "common_403", "message": "not vod"}
+        return 200, {"inkey": "V1" + seq * 10, "vpdid2": "vpdid2-fake"}
+
+    def fvideo_inkey(self, fvideo, params, body):
+        return 200, {"code": 1000, "result": {"inKey": "V2" + fvideo * 5}}
+
+    def vod_play_info(self, vod, params, body):
+        return 200, self.play_info
+
+    def comment_list(self, kind, srl, postfix, params, body):
+        total = self.comments_per_post if postfix == "comments" else self.comments_per_post // 10
+        if kind == "comment":
+            total //= 10
+
+        def items(offset, count):
+            return [self._comment_data("%s-%d" % (srl, offset + i), kind, srl) for i in range(count)]
+
+        # Default page size is always accepted
+        limit = int(params.get("limit", 0))
+        if limit > self.max_page_size:
+            return _invalid_limit(limit)
+        return 200, _page(items, total, params, limit or min(100, self.max_page_size))
+
+    def _comment_data(self, comment_id, kind="post", srl="0-18396482"):
+        seed = sum(map(ord, comment_id))
+        parent = {"type": kind.upper(), "data": {"%sId" % kind: srl}}
+        return {
+            "commentId": comment_id, "body": "Comment %s" % comment_id, "sticker": [],
+            "createdAt": BASE_CREATED_AT - seed, "author": _author(seed), "commentCount": 0 if kind == "comment"
+            else seed % 3, "emotionCount": seed % 100, "isRestricted": False, "writtenIn": "en",
+            "parent": parent, "root": {"type": "POST", "data": {"postId": srl if kind == "post" else "0-18396482"}},
+        }
+
+    def comment_data(self, comment, params, body):
+        return 200, self._comment_data(comment)
+
+    def schedule(self, schedule, params, body):
+        return 200, _project({
+            "scheduleId": schedule, "title": "Schedule %s" % schedule, "description": "description",
+            "startAt": BASE_CREATED_AT, "endAt": BASE_CREATED_AT + 3600000, "timezoneId": "Asia/Seoul",
+            "type": "REGULAR", "author": _author(1), "channel": {"channelCode": "FD53B", "channelName": "Channel"},
+            "commentCount": 0, "emotionCount": 0, "commentWritable": True, "writtenIn": "ko", "url": "",
+            "postId": None, "videoSeq": None, "alarm": None, "location": None, "photos": [], "timeUsing": True,
+        }, _parse_fields(params.get("fields", "")))
+
+    def decode_channel_code(self, params, body):
+        code = params.get("channelCode", "")
+        return 200, {"result": {"channelSeq": sum(map(ord, code)) + 100}}
+
+    def grouped_boards(self, channel, params, body):
+        return 200, [{"groupTitle": "Star", "boards": [
+            {"boardId": i, "title": "Board %d" % i, "boardType": "STAR", "openType": "PUBLIC"} for i in range(1, 6)
+        ]}, {"groupTitle": "Membership", "boards": [
+            {"boardId": 9001, "title": "Membership", "boardType": "STAR", "openType": "MEMBERSHIP"}
+        ]}]
+
+    def channel_webpage(self, channel, params, body):
+        return 200, self.channel_html.replace('"channelCode": "FD53B"', '"channelCode": "%s"' % channel)
+
+    def upcoming(self, params, body):
+        return 200, self.upcoming_html
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+    server_fake: FakeVLive = None
+
+    def handle_request(self, method):
+        parsed = urlsplit(self.path)
+        params = {key: value[0] for key, value in parse_qs(parsed.query).items()}
+        length = int(self.headers.get("Content-Length") or 0)
+        body = self.rfile.read(length) if length else b""
+
+        status, headers, payload = self.server_fake.dispatch(method, parsed.path, params, body)
+        if isinstance(payload, str):
+            content = payload.encode()
+            content_type = "text/html; charset=utf-8"
+        else:
+            content = json.dumps(payload).encode()
+            content_type = "application/json; charset=utf-8"
+
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(content)))
+        for key, value in headers.items():
+            self.send_header(key, value)
+        self.end_headers()
+        self.wfile.write(content)
+
+    def do_GET(self):
+        self.handle_request("GET")
+
+    def do_POST(self):
+        self.handle_request("POST")
+
+    def log_message(self, *args):
+        pass
+
+
+class LocalTransport(SessionTransport):
+    """Transport sending every request to local server instead of VLIVE, keeping path and query."""
+
+    __slots__ = ['base']
+
+    def __init__(self, base: str):
+        self.base = urlsplit(base)
+
+    def __repr__(self):
+        return "<LocalTransport [%s]>" % urlunsplit(self.base)
+
+    def request(self, method, url, session, endpoint=None, identity="", **kwargs):
+        parsed = urlsplit(url)
+        url = urlunsplit((self.base.scheme, self.base.netloc, parsed.path, parsed.query, parsed.fragment))
+        return super().request(method, url, session, endpoint=endpoint, identity=identity, **kwargs)
+
+
+class InProcessTransport(Transport):
+    """Transport answering requests by :class:`FakeVLive` routes directly, without socket and server thread.
+    Redirects are not followed.
+    """
+
+    __slots__ = ['fake']
+
+    uses_network = False
+
+    def __init__(self, fake: FakeVLive):
+        self.fake = fake
+
+    def __repr__(self):
+        return "<InProcessTransport>"
+
+    def request(self, method, url, session, endpoint=None, identity="", **kwargs):
+        parsed = urlsplit(url)
+        params = {key: str(value) for key, value in (kwargs.get('params') or {}).items()}
+        params.update({key: value[0] for key, value in parse_qs(parsed.query).items()})
+        status, headers, payload = self.fake.dispatch(method.upper(), parsed.path, params, b"")
+        if isinstance(payload, str):
+            content = payload.encode()
+            headers = dict(headers, **{"Content-Type": "text/html; charset=utf-8"})
+        else:
+            content = json.dumps(payload).encode()
+            headers = dict(headers, **{"Content-Type": "application/json; charset=utf-8"})
+        return build_response(status, headers, url, content, "utf-8")
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    arg_parser.add_argument("--port", type=int, default=8000)
+    arg_parser.add_argument("--latency", type=float, default=0, help="latency(ms)")
+    arg_parser.add_argument("--jitter", type=float, default=0, help="max random latency added(ms)")
+    arg_parser.add_argument("--ratelimit-rate", type=float, default=0)
+    arg_parser.add_argument("--error-rate", type=float, default=0)
+    arg_parser.add_argument("--max-page-size", type=int, default=100)
+    args = arg_parser.parse_args()
+
+    fake = FakeVLive(latency=args.latency / 1000, jitter=args.jitter / 1000,
+                     ratelimit_rate=args.ratelimit_rate, error_rate=args.error_rate, max_page_size=args.max_page_size)
+    fake.start(args.port)
+    print("Serving fake VLIVE on %s. Use LocalTransport(%r) to send requests." % (fake.url, fake.url))
+    try:
+        threading.Event().wait()
+    except KeyboardInterrupt:
+        fake.stop()
+
+
+if __name__ == "__main__":
+    main()
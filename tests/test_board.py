@@ -0,0 +1,39 @@
+# -*- coding: utf-8 -*-
+
+import pytest
+
+from vlivepy.board import getBoardPostsIter, getChannelPostsIter
+from vlivepy.exception import APIServerResponseError
+
+
+def test_board_posts_follow_sort_type(fake):
+    latest = [item.created_at for item in getBoardPostsIter("FD53B", 1, latest=True)]
+    oldest = [item.created_at for item in getBoardPostsIter("FD53B", 1)]
+    assert len(latest) == 45
+    assert latest == sorted(latest, reverse=True)
+    assert oldest == latest[::-1]
+
+
+def test_video_post_of_board_is_official_video_post(fake):
+    videos = [item for item in getBoardPostsIter("FD53B", 1) if item.has_official_video]
+    assert videos
+    for item in videos:
+        assert item.content_type == "VIDEO" and item.post_id.startswith("1-")
+        assert item.to_object().post_id == item.post_id
+
+
+def test_channel_feed_skips_membership_board(fake):
+    feed = list(getChannelPostsIter("FD53B"))
+    # Board 1 - 5 of grouped boards. Membership board 9001 is skipped
+    assert len(feed) == 5 * 45
+    assert [item.created_at for item in feed] == sorted((item.created_at for item in feed), reverse=True)
+
+
+def test_channel_feed_of_oldest_first(fake):
+    feed = [item.created_at for item in getChannelPostsIter("FD53B", board_ids=[1, 2], latest=False)]
+    assert len(feed) == 2 * 45 and feed == sorted(feed)
+
+
+def test_channel_feed_raises_on_given_membership_board(fake):
+    with pytest.raises(APIServerResponseError):
+        list(getChannelPostsIter("FD53B", board_ids=[1, 9001]))
@@ -0,0 +1,122 @@
+# -*- coding: utf-8 -*-
+
+import asyncio
+
+import pytest
+
+import vlivepy.cache
+from vlivepy.budget import RequestBudget
+from vlivepy.cache import ResponseCache, build_response, disableCache, enableCache
+from vlivepy.connections import getPostInfo
+
+URL = "https://www.vlive.tv/post"
+
+
+def response(body: bytes):
+    return build_response(200, {"Content-Type": "application/json"}, URL, body, "utf-8")
+
+
+@pytest.fixture
+def cache(tmp_path):
+    response_cache = ResponseCache(str(tmp_path / "cache.sqlite"), max_size=1000, ttl={"post": 60, "*": 0})
+    yield response_cache
+    response_cache.close()
+
+
+def test_cached_response_is_same(cache):
+    cache.set("get", URL, response(b'{"a": 1}'), {"id": 1}, endpoint="post")
+    cached = cache.get("get", URL, {"id": 1}, endpoint="post")
+    assert cached.status_code == 200 and cached.json() == {"a": 1}
+    assert cache.get("get", URL, {"id": 2}, endpoint="post") is None
+
+
+def test_endpoint_without_ttl_is_not_cached(cache):
+    cache.set("get", URL, response(b"{}"), endpoint="play_info")
+    assert cache.get("get", URL, endpoint="play_info") is None
+    assert cache.size == 0
+
+
+def test_expired_response_is_miss(cache, monkeypatch):
+    now = 1000000.0
+    monkeypatch.setattr(vlivepy.cache, "time", lambda: now)
+    cache.set("get", URL, response(b"{}"), endpoint="post")
+
+    now += 59
+    assert cache.get("get", URL, endpoint="post") is not None
+    now += 2
+    assert cache.get("get", URL, endpoint="post") is None
+    assert cache.stats()["endpoints"]["post"] == {"hits": 1, "misses": 1, "hit_rate": 0.5}
+
+
+def test_least_recently_used_is_evicted(cache, monkeypatch):
+    now = 1000000.0
+    monkeypatch.setattr(vlivepy.cache, "time", lambda: now)
+    for index in range(3):
+        now += 1
+        cache.set("get", URL, response(b"x" * 300), {"id": index}, endpoint="post")
+
+    # id 0 is used recently, so id 1 is least recently used
+    now += 1
+    assert cache.get("get", URL, {"id": 0}, endpoint="post") is not None
+    now += 1
+    cache.set("get", URL, response(b"x" * 300), {"id": 3}, endpoint="post")
+
+    assert cache.size == 900
+    assert cache.get("get", URL, {"id": 1}, endpoint="post") is None
+    for index in (0, 2, 3):
+        assert cache.get("get", URL, {"id": index}, endpoint="post") is not None
+
+
+def test_response_larger_than_max_size_is_ignored(cache):
+    cache.set("get", URL, response(b"x" * 1001), endpoint="post")
+    assert cache.size == 0
+
+
+def test_router_serves_cached_response(fake, tmp_path):
+    enableCache(str(tmp_path / "cache.sqlite"))
+    try:
+        with RequestBudget() as budget:
+            first = getPostInfo("0-1")
+            second = getPostInfo("0-1")
+    finally:
+        disableCache()
+
+    assert first == second
+    assert budget.requests == 1 and budget.cached == 1
+
+
+def test_only_ok_response_is_cached(cache):
+    denied = build_response(403, {}, URL, b'{"errorCode": "common_403"}', "utf-8")
+    cache.set("get", URL, denied, endpoint="post")
+    assert cache.get("get", URL, endpoint="post") is None
+    assert cache.size == 0
+
+
+def test_router_does_not_replay_denied_response(fake, tmp_path):
+    enableCache(str(tmp_path / "cache.sqlite"))
+    try:
+        with RequestBudget() as budget:
+            # Membership only post answers 403
+            for _ in range(2):
+                getPostInfo("0-10", silent=True)
+    finally:
+        disableCache()
+
+    assert budget.requests == 2 and budget.cached == 0
+
+
+def test_aio_router_serves_cached_response(aio_fake, tmp_path):
+    from vlivepy.aio.connections import getPostInfo as aioGetPostInfo
+
+    async def main():
+        return [await aioGetPostInfo("0-1") for _ in range(2)]
+
+    enableCache(str(tmp_path / "cache.sqlite"))
+    try:
+        with RequestBudget() as budget:
+            first, second = asyncio.run(main())
+    finally:
+        disableCache()
+
+    assert first == second
+    assert budget.requests == 1 and budget.cached == 1
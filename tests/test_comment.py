@@ -0,0 +1,42 @@
+# -*- coding: utf-8 -*-
+
+import asyncio
+import threading
+from time import sleep
+
+from vlivepy import variables as gv
+from vlivepy.comment import getPostCommentTree
+
+
+def prefetch_threads():
+    return [thread for thread in threading.enumerate() if thread.name.startswith("vlivepy-prefetch-")]
+
+
+def test_stopped_comment_tree_stops_prefetch(fake, monkeypatch):
+    monkeypatch.setattr(gv, "override_prefetch_pages", 1)
+    fake.comments_per_post = 500
+    fake.max_page_size = 20
+
+    tree = getPostCommentTree("0-1")
+    next(tree)
+    assert prefetch_threads()
+    tree.close()
+    sleep(0.3)
+    assert not prefetch_threads()
+
+
+def test_aio_stopped_comment_tree_stops_prefetch(aio_fake, monkeypatch):
+    from vlivepy.aio.comment import getPostCommentTree as aioGetPostCommentTree
+
+    monkeypatch.setattr(gv, "override_prefetch_pages", 1)
+    aio_fake.comments_per_post = 500
+    aio_fake.max_page_size = 20
+
+    async def main():
+        tree = aioGetPostCommentTree("0-1")
+        await tree.__anext__()
+        await tree.aclose()
+        await asyncio.sleep(0.1)
+        return [task for task in asyncio.all_tasks() if task is not asyncio.current_task()]
+
+    assert asyncio.run(main()) == []
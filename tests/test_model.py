@@ -0,0 +1,140 @@
+# -*- coding: utf-8 -*-
+
+import asyncio
+
+import pytest
+
+from vlivepy.budget import RequestBudget
+from vlivepy.exception import ModelInitError
+from vlivepy.model import Channel, OfficialVideoPost, Post, loadModels
+from vlivepy.retry import RetryPolicy, configureRetry, resetCircuitBreakers
+
+
+@pytest.fixture
+def no_retry():
+    configureRetry(RetryPolicy(max_attempts=1, backoff=0))
+
+
+def test_lazy_object_loads_on_first_access(fake):
+    with RequestBudget() as budget:
+        post = Post("0-1", lazy=True)
+        assert budget.requests == 0 and not post.loaded
+
+        assert post.post_id == "0-1"
+        assert budget.requests == 0
+        assert post.title
+        post.title
+    assert budget.requests == 1 and post.loaded
+
+
+def test_load_models_loads_every_object(fake):
+    posts = [Post("0-%d" % index, lazy=True) for index in range(1, 6)]
+    with RequestBudget(all_threads=True) as budget:
+        assert loadModels(posts) == posts
+    assert budget.by_endpoint["endpoint_post"] == 5
+    assert all(post.loaded for post in posts)
+
+    with RequestBudget(all_threads=True) as budget:
+        loadModels(posts)
+    assert budget.requests == 0
+
+
+def test_load_models_leaves_failed_objects_unloaded(fake, no_retry):
+    fake.error_rate = 1.0
+    posts = loadModels([Post("0-%d" % index, lazy=True) for index in range(1, 5)])
+    assert not any(post.loaded for post in posts)
+    with pytest.raises(ModelInitError):
+        posts[0].title
+
+
+def test_failed_lazy_object_loads_once(fake, no_retry):
+    fake.error_rate = 1.0
+    post = Post("0-4", lazy=True)
+    with RequestBudget() as budget:
+        for _ in range(3):
+            with pytest.raises(ModelInitError):
+                post.title
+    assert budget.requests == 1
+
+    fake.error_rate = 0
+    resetCircuitBreakers()
+    post.refresh()
+    assert post.loaded and post.title
+
+
+def test_failed_eager_object_is_not_loaded_again(fake, no_retry):
+    fake.error_rate = 1.0
+    channel = Channel("FD53B")
+    with RequestBudget() as budget:
+        for _ in range(3):
+            with pytest.raises(ModelInitError):
+                channel.channel_name
+    assert budget.requests == 0
+
+
+def test_lazy_video_post_by_video_seq(fake):
+    post = OfficialVideoPost(12, lazy=True)
+    with RequestBudget() as budget:
+        assert post.post_id == "1-12"
+    assert budget.requests == 1 and not post.loaded
+
+    assert post == OfficialVideoPost("1-12", lazy=True)
+    assert post.video_seq == 12
+
+
+def test_aio_failed_object_stays_unloaded(aio_fake, no_retry):
+    from vlivepy.aio import model
+
+    async def main():
+        aio_fake.error_rate = 1.0
+        post = await model.Post("0-3")
+        failed = await model.loadModels([model.Post("0-%d" % index) for index in range(1, 5)])
+
+        aio_fake.error_rate = 0
+        resetCircuitBreakers()
+        loaded = await model.loadModels([model.Post("0-1"), model.OfficialVideoPost(12)])
+        return post, failed, loaded
+
+    post, failed, loaded = asyncio.run(main())
+    assert not post.loaded
+    assert not any(item.loaded for item in failed)
+    assert all(item.loaded for item in loaded) and loaded[1].post_id == "1-12"
+
+
+def test_video_post_with_failed_lookup_keeps_video_seq(fake, no_retry):
+    fake.error_rate = 1.0
+    with pytest.raises(ModelInitError):
+        OfficialVideoPost(4)
+
+    post = OfficialVideoPost(4, lazy=True)
+    with RequestBudget() as budget:
+        for _ in range(3):
+            with pytest.raises(ModelInitError):
+                post.post_id
+        with pytest.raises(ModelInitError):
+            post.title
+    assert budget.requests == 1
+    assert not post.loaded and "4" in repr(post)
+
+    posts = loadModels([OfficialVideoPost(seq, lazy=True) for seq in (4, 6)])
+    for item in posts:
+        with pytest.raises(ModelInitError):
+            item.target_id
+
+    fake.error_rate = 0
+    resetCircuitBreakers()
+    post.refresh()
+    assert post.loaded and post.post_id == "1-4"
+
+
+def test_aio_video_post_with_failed_lookup_keeps_video_seq(aio_fake, no_retry):
+    from vlivepy.aio import model
+
+    async def main():
+        aio_fake.error_rate = 1.0
+        return await model.OfficialVideoPost(4)
+
+    post = asyncio.run(main())
+    assert not post.loaded
+    with pytest.raises(ModelInitError):
+        post.post_id
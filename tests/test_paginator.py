@@ -0,0 +1,111 @@
+# -*- coding: utf-8 -*-
+
+import pytest
+
+from vlivepy import variables as gv
+from vlivepy.board import getBoardPosts, getBoardPostsIter
+from vlivepy.budget import RequestBudget
+from vlivepy.comment import getPostCommentsIter
+from vlivepy.exception import APIBadRequestError, APINetworkError
+from vlivepy.paginator import adaptive_page_sizes
+
+
+def test_prefetch_yields_same_items(fake):
+    assert [item.post_id for item in getBoardPostsIter("FD53B", 1, prefetch=2)] == \
+           [item.post_id for item in getBoardPostsIter("FD53B", 1, prefetch=0)]
+
+
+def test_prefetch_of_comments_yields_same_items(fake):
+    assert [item.commentId for item in getPostCommentsIter("0-1", prefetch=2)] == \
+           [item.commentId for item in getPostCommentsIter("0-1", prefetch=0)]
+
+
+def test_state_restore_resumes_exactly(fake):
+    expected = [item.post_id for item in getBoardPostsIter("FD53B", 1)]
+
+    pager = getBoardPostsIter("FD53B", 1)
+    head = [next(pager).post_id for _ in range(27)]
+    state = pager.state()
+    pager.close()
+    assert state['items'] == 27
+
+    restored = getBoardPostsIter("FD53B", 1).restore(state)
+    assert head + [item.post_id for item in restored] == expected
+    assert restored.done and restored.items == len(expected)
+
+
+def test_restore_rejects_other_iterator_and_started_pager(fake):
+    state = getPostCommentsIter("0-1").state()
+    with pytest.raises(ValueError):
+        getBoardPostsIter("FD53B", 1).restore(state)
+
+    pager = getPostCommentsIter("0-1")
+    next(pager)
+    with pytest.raises(RuntimeError):
+        pager.restore(state)
+
+
+def test_restore_with_smaller_page_size_skips_to_next_page(fake):
+    expected = [item.post_id for item in getBoardPostsIter("FD53B", 1)]
+
+    pager = getBoardPostsIter("FD53B", 1, page_size=20)
+    for _ in range(15):
+        next(pager)
+    state = pager.state()
+    pager.close()
+
+    restored = getBoardPostsIter("FD53B", 1, page_size=10).restore(state)
+    assert [item.post_id for item in restored] == expected[15:]
+
+
+def test_rejected_page_size_raises_bad_request(fake):
+    fake.max_page_size = 20
+    with pytest.raises(APIBadRequestError):
+        getBoardPosts("FD53B", 1, page_size=50)
+
+
+def test_adaptive_uses_larger_size_after_default_page(fake):
+    fake.max_page_size = 50
+    with RequestBudget() as budget:
+        assert len(list(getBoardPostsIter("FD53B", 1, page_size="adaptive"))) == 45
+    # Default page of 20, 100 is rejected once, then page of 50
+    assert [item.params.get("limit") for item in budget.plan] == [20, 100, 50]
+    assert adaptive_page_sizes("getBoardPostsIter") == [50, None]
+
+
+def test_adaptive_falls_back_to_default_on_rejection(fake):
+    fake.max_page_size = 20
+    with RequestBudget() as budget:
+        assert len(list(getBoardPostsIter("FD53B", 1, page_size="adaptive"))) == 45
+    # 100 and 50 are rejected once, then default pages of 20
+    assert budget.requests == 3 + 2
+    assert adaptive_page_sizes("getBoardPostsIter") == [None]
+
+
+def test_adaptive_is_not_worse_than_default(fake):
+    fake.max_page_size = 50
+    fake.comments_per_post = 500
+    with RequestBudget() as default:
+        list(getPostCommentsIter("0-1"))
+    with RequestBudget() as first:
+        list(getPostCommentsIter("0-1", page_size="adaptive"))
+    with RequestBudget() as second:
+        list(getPostCommentsIter("0-1", page_size="adaptive"))
+
+    # Only probe of 100 is more than default, and it isn't repeated
+    assert first.requests == default.requests + 1
+    assert second.requests == default.requests
+
+
+def test_adaptive_keeps_sizes_on_network_error(fake):
+    fake.error_rate = 1.0
+    with pytest.raises(APINetworkError) as info:
+        next(getBoardPostsIter("FD53B", 1, page_size="adaptive"))
+    assert not isinstance(info.value, APIBadRequestError)
+    assert adaptive_page_sizes("getBoardPostsIter") == sorted(gv.override_adaptive_page_sizes, reverse=True) + [None]
+
+
+def test_adaptive_with_empty_sizes_raises(fake, monkeypatch):
+    monkeypatch.setattr(gv, "override_adaptive_page_sizes", [])
+    with pytest.raises(ValueError):
+        next(getBoardPostsIter("FD53B", 1, page_size="adaptive"))
@@ -0,0 +1,122 @@
+# -*- coding: utf-8 -*-
+
+import asyncio
+
+import pytest
+
+import vlivepy.retry
+from vlivepy.budget import RequestBudget
+from vlivepy.connections import getPostInfo
+from vlivepy.exception import APINetworkError, APISignInFailedError
+from vlivepy.retry import CircuitBreaker, RetryPolicy, getCircuitBreaker
+from vlivepy.session import getUserSession
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(vlivepy.retry, "monotonic", lambda: now[0])
+    return now
+
+
+def test_breaker_opens_after_threshold(clock):
+    breaker = CircuitBreaker(failure_threshold=3, reset_timeout=30)
+    for _ in range(2):
+        breaker.record_failure()
+    assert breaker.state == "CLOSED" and breaker.allow()
+
+    breaker.record_failure()
+    assert breaker.state == "OPEN" and not breaker.allow()
+
+
+def test_breaker_allows_one_trial_when_half_open(clock):
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=30)
+    breaker.record_failure()
+    clock[0] += 30
+
+    assert breaker.state == "HALF_OPEN"
+    assert breaker.allow()
+    assert not breaker.allow()
+
+    breaker.record_success()
+    assert breaker.state == "CLOSED" and breaker.allow()
+
+
+def test_failed_trial_opens_again(clock):
+    breaker = CircuitBreaker(failure_threshold=5, reset_timeout=30)
+    for _ in range(5):
+        breaker.record_failure()
+    clock[0] += 30
+    assert breaker.allow()
+
+    breaker.record_failure()
+    assert breaker.state == "OPEN"
+    clock[0] += 29
+    assert not breaker.allow()
+
+
+def test_released_trial_allows_next_trial(clock):
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=30)
+    breaker.record_failure()
+    clock[0] += 30
+    assert breaker.allow()
+
+    breaker.release()
+    assert breaker.state == "HALF_OPEN" and breaker.allow()
+
+
+def test_policy_retries_only_idempotent_methods():
+    policy = RetryPolicy(max_attempts=5)
+    assert policy.attempts_for("get") == 5
+    assert policy.attempts_for("POST") == 1
+    assert RetryPolicy(max_attempts=5, retry_methods=["GET", "POST"]).attempts_for("post") == 5
+
+
+def test_transient_failure_is_retried(fake):
+    fake.error_rate = 1.0
+    with RequestBudget() as budget:
+        assert getPostInfo("0-1", silent=True) is None
+    assert budget.by_endpoint["endpoint_post"] == RetryPolicy().max_attempts
+
+
+def test_open_breaker_stops_requests(fake):
+    fake.error_rate = 1.0
+    breaker = getCircuitBreaker("endpoint_post")
+    for _ in range(breaker.failure_threshold):
+        breaker.record_failure()
+
+    with RequestBudget() as budget:
+        with pytest.raises(APINetworkError):
+            getPostInfo("0-1")
+    assert budget.requests == 0
+
+
+def test_sign_in_is_not_retried(fake):
+    fake.error_rate = 1.0
+    with RequestBudget() as budget:
+        with pytest.raises((APINetworkError, APISignInFailedError)):
+            getUserSession("user@example.com", "password")
+    assert budget.by_endpoint == {"endpoint_auth": 1}
+
+
+def test_failed_request_is_one_breaker_failure(fake):
+    fake.error_rate = 1.0
+    breaker = getCircuitBreaker("endpoint_post")
+    for _ in range(breaker.failure_threshold - 1):
+        assert getPostInfo("0-1", silent=True) is None
+    # Every retry of each request is sent, and the circuit is still closed
+    assert breaker.state == "CLOSED"
+
+    with RequestBudget() as budget:
+        assert getPostInfo("0-1", silent=True) is None
+    assert budget.requests == RetryPolicy().max_attempts
+    assert breaker.state == "OPEN"
+
+
+def test_aio_failed_request_is_one_breaker_failure(aio_fake):
+    from vlivepy.aio.connections import getPostInfo as aioGetPostInfo
+
+    aio_fake.error_rate = 1.0
+    breaker = getCircuitBreaker("endpoint_post")
+    assert asyncio.run(aioGetPostInfo("0-1", silent=True)) is None
+    assert breaker.state == "CLOSED"
@@ -0,0 +1,92 @@
+# -*- coding: utf-8 -*-
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from contextvars import copy_context
+from threading import Event
+from time import sleep
+
+import pytest
+
+from vlivepy.budget import RequestBudget
+from vlivepy.connections import getPostInfo
+from vlivepy.singleflight import AsyncSingleFlight, SingleFlight
+
+
+def test_concurrent_calls_are_coalesced():
+    flight = SingleFlight()
+    started = Event()
+    release = Event()
+    calls = []
+
+    def fn():
+        calls.append(1)
+        started.set()
+        release.wait(5)
+        return "result"
+
+    with ThreadPoolExecutor(4) as executor:
+        leader = executor.submit(flight.do, "key", fn)
+        started.wait(5)
+        followers = [executor.submit(flight.do, "key", fn) for _ in range(3)]
+        # Followers are waiting for leader
+        sleep(0.1)
+        release.set()
+        results = [leader.result()] + [future.result() for future in followers]
+
+    assert results == ["result"] * 4
+    assert len(calls) == 1
+
+
+def test_error_is_raised_to_every_caller():
+    flight = SingleFlight()
+    started = Event()
+    release = Event()
+
+    def fn():
+        started.set()
+        release.wait(5)
+        raise KeyError("failed")
+
+    with ThreadPoolExecutor(2) as executor:
+        leader = executor.submit(flight.do, "key", fn)
+        started.wait(5)
+        follower = executor.submit(flight.do, "key", fn)
+        release.set()
+        for future in (leader, follower):
+            with pytest.raises(KeyError):
+                future.result()
+
+
+def test_finished_call_is_not_kept():
+    flight = SingleFlight()
+    assert flight.do("key", lambda: 1) == 1
+    assert flight.do("key", lambda: 2) == 2
+
+
+def test_async_calls_are_coalesced():
+    flight = AsyncSingleFlight()
+    calls = []
+
+    async def fn():
+        calls.append(1)
+        await asyncio.sleep(0.05)
+        return "result"
+
+    async def main():
+        return await asyncio.gather(*[flight.do("key", fn) for _ in range(5)])
+
+    assert asyncio.run(main()) == ["result"] * 5
+    assert len(calls) == 1
+
+
+def test_router_coalesces_identical_requests(fake):
+    fake.latency = 0.1
+    with RequestBudget(all_threads=True) as budget:
+        with ThreadPoolExecutor(4) as executor:
+            # Every thread needs copy of context with transport
+            futures = [executor.submit(copy_context().run, getPostInfo, "0-1") for _ in range(4)]
+            results = [future.result() for future in futures]
+
+    assert all(result == results[0] for result in results)
+    assert budget.by_endpoint["endpoint_post"] < 4
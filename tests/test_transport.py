@@ -0,0 +1,51 @@
+# -*- coding: utf-8 -*-
+
+import os
+
+import pytest
+
+from fake_vlive import FakeVLive, InProcessTransport, LocalTransport
+from vlivepy.connections import getPostInfo
+from vlivepy.session import UserSession
+from vlivepy.transport import RecordingTransport, ReplayTransport, useTransport
+
+
+@pytest.fixture
+def local_fake():
+    server = FakeVLive()
+    server.start()
+    yield server
+    server.stop()
+
+
+def test_replay_serves_recorded_response(fake, tmp_path):
+    expected = getPostInfo("0-1")
+    with useTransport(RecordingTransport(str(tmp_path), InProcessTransport(fake))):
+        getPostInfo("0-1")
+
+    with useTransport(ReplayTransport(str(tmp_path))):
+        assert getPostInfo("0-1") == expected
+        # Not recorded
+        assert getPostInfo("0-2", silent=True) is None
+
+
+def test_records_are_kept_apart_by_session(local_fake, tmp_path):
+    with useTransport(LocalTransport(local_fake.url)):
+        member = UserSession("fan@example.com", "password")
+        other = UserSession("other@example.com", "password")
+
+    with useTransport(RecordingTransport(str(tmp_path), LocalTransport(local_fake.url))):
+        getPostInfo("0-1")
+        getPostInfo("0-1", session=member)
+    records = [name for name in os.listdir(str(tmp_path)) if name.startswith("endpoint_post-")]
+    assert len(records) == 2
+    for name in records:
+        with open(os.path.join(str(tmp_path), name), encoding="utf-8") as f:
+            assert "fan@example.com" not in f.read()
+
+    replay = ReplayTransport(str(tmp_path))
+    assert len(replay) == 2
+    with useTransport(replay):
+        assert getPostInfo("0-1")
+        assert getPostInfo("0-1", session=member)
+        assert getPostInfo("0-1", session=other, silent=True) is None
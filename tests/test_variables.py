@@ -0,0 +1,31 @@
+# -*- coding: utf-8 -*-
+
+import inspect
+
+import pytest
+
+from vlivepy import variables as gv
+from vlivepy.budget import RequestBudget
+from vlivepy.connections import getPostInfo
+
+ENDPOINTS = [
+    (name, function) for name, function in inspect.getmembers(gv, inspect.isfunction)
+    if name.startswith("endpoint_") and name != "endpoint_post_comment_template"
+]
+
+
+@pytest.mark.parametrize("name, function", ENDPOINTS)
+def test_endpoint_has_only_request_arguments(name, function):
+    arguments = ["1" for parameter in inspect.signature(function).parameters.values()
+                 if parameter.default is inspect.Parameter.empty]
+    # Result is passed to requests as is, e.g. reqWrapper.get(**gv.endpoint_post("0-1"))
+    assert set(function(*arguments)) <= {"url", "params", "data", "headers"}
+
+
+def test_field_profile_selects_fields(fake):
+    assert gv.endpoint_post("0-1", fields="minimal")["params"]["fields"] == gv.PostFieldProfiles["minimal"]
+    assert gv.endpoint_post("0-1", fields="postId,title")["params"]["fields"] == "postId,title"
+
+    with RequestBudget() as budget:
+        assert set(getPostInfo("0-1", fields="postId,title")) == {"postId", "title"}
+    assert budget.by_endpoint == {"endpoint_post": 1}
@@ -0,0 +1,23 @@
+# -*- coding: utf-8 -*-
+
+from .router import (
+    close_client,
+    get_client,
+)
+from .connections import (
+    postIdToVideoSeq,
+    videoSeqToPostId,
+    postTypeDetector,
+    decode_channel_code,
+)
+from .model import (
+    Channel,
+    Comment,
+    GroupedBoards,
+    OfficialVideoPost,
+    Post,
+    Schedule,
+    Upcoming,
+    OfficialVideoLive,
+    OfficialVideoVOD,
+)
@@ -0,0 +1,188 @@
+# -*- coding: utf-8 -*-
+
+import asyncio
+import heapq
+from typing import (
+    AsyncGenerator,
+    List,
+    Union,
+    Optional,
+)
+from .. import board
+from .. import variables as gv
+from ..exception import APIServerResponseError, auto_raise
+from ..parser import response_json_loader, response_json_stripper
+from ..session import UserSession
+from ..tracing import traced
+from .paginator import Paginator
+from ..router import network_error
+from .router import rew_get
+
+
+class BoardPostItem(board.BoardPostItem):
+    """Async version of :class:`vlivepy.board.BoardPostItem`.
+    :meth:`to_object` is coroutine and initializes :mod:`vlivepy.aio` objects.
+    """
+    __slots__ = []
+
+    async def to_object(
+            self,
+            lazy: bool = False
+    ):
+        """Initialize matched object from post_id
+
+        Arguments:
+            lazy (:class:`bool`, optional) : Return object without awaiting, defaults to False.
+                Use :func:`vlivepy.aio.model.loadModels` to load many objects at once.
+
+        Returns:
+            :class:`vlivepy.aio.Post`, if the post is normal post.
+            :class:`vlivepy.aio.OfficialVideoPost`, if the post is official video
+        """
+        from .model import OfficialVideoPost, Post
+
+        if self.content_type == "VIDEO":
+            target = OfficialVideoPost(self.post_id, session=self.session)
+        else:
+            target = Post(self.post_id, session=self.session)
+        return target if lazy else await target
+
+
+@traced
+async def getBoardPosts(
+        channel_code: str,
+        board_id: Union[str, int],
+        session: UserSession = None,
+        after: str = None,
+        latest: bool = False,
+        silent: bool = False,
+        raise_message: bool = False,
+        page_size: int = None,
+) -> Optional[dict]:
+    """Coroutine version of :func:`vlivepy.board.getBoardPosts`"""
+
+    # Make request
+    sr = await rew_get(**gv.endpoint_board_posts(channel_code, board_id, after=after, latest=latest,
+                                                 limit=page_size), endpoint="endpoint_board_posts",
+                       session=session, status=[200, 403])
+
+    if sr.success:
+        stripped_data = response_json_stripper(response_json_loader(sr.response),
+                                               silent=silent, raise_message=raise_message)
+        if 'data' in stripped_data:
+            parsed_data = []
+            for item in stripped_data['data']:
+                parsed_data.append(BoardPostItem(item, session))
+            stripped_data['data'] = parsed_data
+        return stripped_data
+    else:
+        auto_raise(network_error(sr), silent)
+
+    return None
+
+
+def getBoardPostsIter(
+        channel_code: str,
+        board_id: Union[str, int],
+        session: UserSession = None,
+        latest: bool = False,
+        after: str = None,
+        prefetch: int = None,
+        page_size: Union[int, str] = None
+) -> Paginator:
+    """Async generator version of :func:`vlivepy.board.getBoardPostsIter`"""
+
+    return Paginator(
+        "getBoardPostsIter",
+        lambda cursor, size: getBoardPosts(channel_code, board_id, session=session, latest=latest, after=cursor,
+                                           page_size=size, raise_message=True),
+        after,
+        prefetch,
+        page_size
+    )
+
+
+class BoardSync(board.BoardSync):
+    """Async iterable version of :class:`vlivepy.board.BoardSync`"""
+
+    __slots__ = []
+
+    def __iter__(self):
+        raise TypeError("Use 'async for' to iterate BoardSync")
+
+    async def __aiter__(self):
+        async for item in self._posts:
+            if self._reached(item):
+                await self._posts.aclose()
+                break
+            self._new(item)
+            yield item
+        self._finish()
+
+
+def getBoardPostsSince(
+        channel_code: str,
+        board_id: Union[str, int],
+        watermark: Union[str, float, dict] = None,
+        session: UserSession = None
+) -> BoardSync:
+    """Async iterable version of :func:`vlivepy.board.getBoardPostsSince`"""
+
+    return BoardSync(getBoardPostsIter(channel_code, board_id, session=session, latest=True, prefetch=0), watermark)
+
+
+async def getChannelPostsIter(
+        channel_code: str,
+        board_ids: List[Union[str, int]] = None,
+        session: UserSession = None,
+        latest: bool = True,
+        workers: int = None,
+        prefetch: int = None
+) -> AsyncGenerator:
+    """Async generator version of :func:`vlivepy.board.getChannelPostsIter`. First pages are loaded by tasks."""
+
+    # Default boards answering error (membership, paid) are skipped
+    skip_denied = board_ids is None
+    if board_ids is None:
+        from .model import GroupedBoards
+
+        board_ids = [board['boardId'] for board in (await GroupedBoards(channel_code, session=session)).boards()]
+    if not board_ids:
+        return
+
+    boards = [
+        getBoardPostsIter(channel_code, board_id, session=session, latest=latest, prefetch=prefetch)
+        for board_id in board_ids
+    ]
+    limit = asyncio.Semaphore(workers or len(boards))
+
+    async def first(posts):
+        async with limit:
+            return await posts.__anext__()
+
+    try:
+        firsts = await asyncio.gather(*[first(posts) for posts in boards], return_exceptions=True)
+        for item in firsts:
+            if isinstance(item, StopAsyncIteration) or (skip_denied and isinstance(item, APIServerResponseError)):
+                continue
+            if isinstance(item, Exception):
+                raise item
+
+        # Board index breaks tie of created_at, so posts of same time keep order of boards
+        heap = [
+            (board._merge_key(item, latest), index, item)
+            for index, item in enumerate(firsts) if not isinstance(item, Exception)
+        ]
+        heapq.heapify(heap)
+        while heap:
+            _, index, item = heap[0]
+            yield item
+            try:
+                item = await boards[index].__anext__()
+            except StopAsyncIteration:
+                heapq.heappop(heap)
+            else:
+                heapq.heapreplace(heap, (board._merge_key(item, latest), index, item))
+    finally:
+        for posts in boards:
+            await posts.aclose()
@@ -0,0 +1,61 @@
+# -*- coding: utf-8 -*-
+
+from typing import (
+    Optional
+)
+
+from .. import variables as gv
+from ..channel import channel_info_parser
+from ..exception import (
+    auto_raise,
+    APINetworkError,
+    APIJSONParesError
+)
+from ..parser import response_json_loader
+from ..session import UserSession
+from ..tracing import traced
+from .router import rew_get
+
+
+@traced
+async def getChannelInfo(
+        channel_code: str,
+        session: UserSession = None,
+        silent: bool = False
+) -> Optional[dict]:
+    """Coroutine version of :func:`vlivepy.channel.getChannelInfo`"""
+
+    # Make request
+    sr = await rew_get(**gv.endpoint_channel_webpage(channel_code), endpoint="endpoint_channel_webpage",
+                       session=session, status=[200])
+
+    if sr.success:
+        channel_info = channel_info_parser(sr.response.text)
+        if channel_info is not None:
+            return channel_info
+        else:
+            auto_raise(APIJSONParesError("Cannot find channel data from page"), silent)
+    else:
+        auto_raise(APINetworkError, silent)
+
+    return None
+
+
+@traced
+async def getGroupedBoards(
+        channel_code: str,
+        session: UserSession = None,
+        silent: bool = False
+) -> Optional[dict]:
+    """Coroutine version of :func:`vlivepy.channel.getGroupedBoards`"""
+
+    # Make request
+    sr = await rew_get(**gv.endpoint_channel_grouped_boards(channel_code), endpoint="endpoint_channel_grouped_boards",
+                       session=session, status=[200])
+
+    if sr.success:
+        return response_json_loader(sr.response)
+    else:
+        auto_raise(APINetworkError, silent)
+
+    return None
@@ -0,0 +1,268 @@
+# -*- coding: utf-8 -*-
+
+import asyncio
+from collections import deque
+from typing import (
+    AsyncGenerator,
+    Optional,
+    Union,
+)
+from .. import variables as gv
+from ..comment import CommentThread
+from ..exception import APINetworkError, auto_raise
+from ..parser import response_json_loader, response_json_stripper
+from ..session import UserSession
+from ..tracing import traced
+from .paginator import Paginator
+from ..router import network_error
+from .router import rew_get
+
+
+def comment_parser(
+        comment_list: list,
+        session: UserSession = None
+) -> list:
+    """Parse each comment json data to :class:`vlivepy.aio.Comment` object.
+
+    Arguments:
+        comment_list (:class:`list`) : Comment list to parse.
+        session (:class:`vlivepy.UserSession`, optional) : Session for loading data with permission, defaults to None.
+
+    Returns:
+        List of :class:`vlivepy.aio.Comment`
+    """
+
+    from .model import Comment
+    n_list = []
+    for comment_item in comment_list:
+        n_list.append(Comment(comment_item['commentId'], session=session, init_data=comment_item))
+
+    return n_list
+
+
+@traced
+async def getPostComments(
+        post_id: str,
+        session: UserSession = None,
+        after: str = None,
+        silent: bool = False,
+        raise_message: bool = False,
+        page_size: int = None,
+) -> Optional[dict]:
+    """Coroutine version of :func:`vlivepy.comment.getPostComments`"""
+
+    # Make request
+    sr = await rew_get(**gv.endpoint_post_comments(post_id, after, page_size), endpoint="endpoint_post_comments",
+                       session=session, status=[200, 403])
+
+    if sr.success:
+        stripped_data = response_json_stripper(response_json_loader(sr.response), silent=silent)
+        if 'data' in stripped_data:
+            stripped_data['data'] = comment_parser(stripped_data['data'], session=session)
+        return stripped_data
+    else:
+        auto_raise(network_error(sr), silent)
+
+    return None
+
+
+def getPostCommentsIter(
+        post_id: str,
+        session: UserSession = None,
+        after: str = None,
+        prefetch: int = None,
+        page_size: Union[int, str] = None
+) -> Paginator:
+    """Async generator version of :func:`vlivepy.comment.getPostCommentsIter`"""
+
+    return Paginator(
+        "getPostCommentsIter",
+        lambda cursor, size: getPostComments(post_id, session=session, after=cursor, page_size=size,
+                                             raise_message=True),
+        after,
+        prefetch,
+        page_size
+    )
+
+
+@traced
+async def getPostStarComments(
+        post_id: str,
+        session: UserSession = None,
+        after: str = None,
+        silent: bool = False,
+        raise_message: bool = False,
+        page_size: int = None,
+) -> Optional[dict]:
+    """Coroutine version of :func:`vlivepy.comment.getPostStarComments`"""
+
+    # Make request
+    sr = await rew_get(**gv.endpoint_post_star_comments(post_id, after, page_size),
+                       endpoint="endpoint_post_star_comments", session=session, status=[200, 403])
+
+    if sr.success:
+        stripped_data = response_json_stripper(response_json_loader(sr.response), silent=silent)
+        if 'data' in stripped_data:
+            stripped_data['data'] = comment_parser(stripped_data['data'], session=session)
+        return stripped_data
+    else:
+        auto_raise(network_error(sr), silent)
+
+    return None
+
+
+def getPostStarCommentsIter(
+        post_id: str,
+        session: UserSession = None,
+        after: str = None,
+        prefetch: int = None,
+        page_size: Union[int, str] = None
+) -> Paginator:
+    """Async generator version of :func:`vlivepy.comment.getPostStarCommentsIter`"""
+
+    return Paginator(
+        "getPostStarCommentsIter",
+        lambda cursor, size: getPostStarComments(post_id, session=session, after=cursor, page_size=size,
+                                                 raise_message=True),
+        after,
+        prefetch,
+        page_size
+    )
+
+
+@traced
+async def getCommentData(
+        comment_id: str,
+        session: UserSession = None,
+        silent: bool = False
+) -> Optional[dict]:
+    """Coroutine version of :func:`vlivepy.comment.getCommentData`"""
+
+    # Make request
+    sr = await rew_get(**gv.endpoint_comment_data(comment_id), endpoint="endpoint_comment_data",
+                       session=session, status=[200, 403])
+
+    if sr.success:
+        return response_json_stripper(response_json_loader(sr.response), silent=silent)
+    else:
+        auto_raise(APINetworkError, silent)
+
+    return None
+
+
+@traced
+async def getNestedComments(
+        comment_id: str,
+        session: UserSession = None,
+        after: str = None,
+        silent: bool = False,
+        raise_message: bool = False,
+        page_size: int = None,
+) -> Optional[dict]:
+    """Coroutine version of :func:`vlivepy.comment.getNestedComments`"""
+
+    # Make request
+    sr = await rew_get(**gv.endpoint_comment_nested(comment_id, after, page_size), endpoint="endpoint_comment_nested",
+                       session=session, status=[200, 403])
+
+    if sr.success:
+        stripped_data = response_json_stripper(response_json_loader(sr.response), silent=silent)
+        if 'data' in stripped_data:
+            stripped_data['data'] = comment_parser(stripped_data['data'], session=session)
+        return stripped_data
+    else:
+        auto_raise(network_error(sr), silent)
+
+    return None
+
+
+def getNestedCommentsIter(
+        comment_id: str,
+        session: UserSession = None,
+        after: str = None,
+        prefetch: int = None,
+        page_size: Union[int, str] = None
+) -> Paginator:
+    """Async generator version of :func:`vlivepy.comment.getNestedCommentsIter`"""
+
+    return Paginator(
+        "getNestedCommentsIter",
+        lambda cursor, size: getNestedComments(comment_id, session=session, after=cursor, page_size=size,
+                                               raise_message=True),
+        after,
+        prefetch,
+        page_size
+    )
+
+
+async def getPostCommentTree(
+        post_id: str,
+        session: UserSession = None,
+        workers: int = None,
+        order: str = "post",
+        flat: bool = False,
+        star: bool = False
+) -> AsyncGenerator:
+    """Async generator version of :func:`vlivepy.comment.getPostCommentTree`. Nested comments are loaded by tasks."""
+
+    if order not in ("post", "completed"):
+        raise ValueError("order must be 'post' or 'completed', not %r" % order)
+    if workers is None:
+        workers = gv.override_comment_workers
+
+    limit = asyncio.Semaphore(workers)
+
+    async def nested(comment_id):
+        async with limit:
+            return [item async for item in getNestedCommentsIter(comment_id, session=session)]
+
+    # Each entry is (comment, task). Task is None for comment without nested comment.
+    pending = deque()
+
+    async def finished(block):
+        threads = []
+        if order == "post":
+            while pending and (block or pending[0][1] is None or pending[0][1].done()):
+                comment, task = pending.popleft()
+                threads.append(CommentThread(comment, await task if task else []))
+                block = False
+        else:
+            if block:
+                await asyncio.wait([task for _, task in pending], return_when=asyncio.FIRST_COMPLETED)
+            for entry in [entry for entry in pending if entry[1].done()]:
+                pending.remove(entry)
+                threads.append(CommentThread(entry[0], entry[1].result()))
+        return threads
+
+    parents = (getPostStarCommentsIter if star else getPostCommentsIter)(post_id, session=session)
+    try:
+        while True:
+            threads = []
+            try:
+                comment = await parents.__anext__()
+            except StopAsyncIteration:
+                if not pending:
+                    break
+                threads = await finished(True)
+            else:
+                if comment.comment_count:
+                    pending.append((comment, asyncio.ensure_future(nested(comment.commentId))))
+                elif order == "post":
+                    pending.append((comment, None))
+                else:
+                    threads.append(CommentThread(comment, []))
+                # Parents are read ahead up to the limit while nested comments are loaded
+                threads.extend(await finished(len(pending) >= workers * 4))
+
+            for thread in threads:
+                if flat:
+                    for item in thread:
+                        yield item
+                else:
+                    yield thread
+    finally:
+        # Stop prefetch task of parents when consumer stops early or error is raised
+        await parents.aclose()
+        for _, task in pending:
+            if task is not None:
+                task.cancel()
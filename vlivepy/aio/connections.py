@@ -0,0 +1,106 @@
+# -*- coding: utf-8 -*-
+
+from typing import (
+    Optional,
+    Union
+)
+from .. import variables as gv
+from ..exception import (
+    auto_raise,
+    APINetworkError,
+    APIJSONParesError,
+)
+from ..parser import (
+    response_json_loader,
+    response_json_stripper,
+)
+from ..session import UserSession
+from ..tracing import traced
+from .router import rew_get
+
+
+@traced
+async def getPostInfo(
+        post_id: str,
+        session: UserSession = None,
+        silent: bool = False,
+        fields: str = "full"
+) -> Optional[dict]:
+    """Coroutine version of :func:`vlivepy.connections.getPostInfo`"""
+
+    sr = await rew_get(**gv.endpoint_post(post_id, fields), endpoint="endpoint_post",
+                       session=session, status=[200, 403])
+
+    if sr.success:
+        return response_json_stripper(response_json_loader(sr.response), silent=silent)
+    else:
+        auto_raise(APINetworkError, silent)
+
+    return None
+
+
+@traced
+async def postIdToVideoSeq(
+        post_id: str,
+        silent=False
+) -> Optional[str]:
+    """Coroutine version of :func:`vlivepy.postIdToVideoSeq`"""
+
+    post = await getPostInfo(post_id, silent=True, fields="minimal")
+
+    if post:
+        if 'officialVideo' in post:
+            return post['officialVideo']['videoSeq']
+        else:
+            auto_raise(APIJSONParesError("Post-%s is not official video post" % post_id), silent)
+
+    return None
+
+
+@traced
+async def videoSeqToPostId(
+        video_seq: Union[str, int],
+        silent=False
+) -> Optional[str]:
+    """Coroutine version of :func:`vlivepy.videoSeqToPostId`"""
+
+    from .video import getOfficialVideoPost
+
+    post = await getOfficialVideoPost(video_seq, silent=True, fields="minimal")
+
+    if post:
+        return post['postId']
+    else:
+        return None
+
+
+@traced
+async def postTypeDetector(post_id, silent=False):
+    """Coroutine version of :func:`vlivepy.postTypeDetector`"""
+
+    data = await getPostInfo(post_id, silent=True, fields="minimal")
+    if data is not None:
+        return data['contentType']
+
+    return None
+
+
+@traced
+async def decode_channel_code(
+        channel_code: str,
+        silent: bool = False
+) -> Optional[int]:
+    """Coroutine version of :func:`vlivepy.decode_channel_code`"""
+
+    sr = await rew_get(**gv.endpoint_decode_channel_code(channel_code), endpoint="endpoint_decode_channel_code",
+                       status=[200])
+
+    if sr.success:
+        if len(sr.response.text) > 0:
+            return response_json_loader(sr.response)['result']['channelSeq']
+        else:
+            auto_raise(ValueError("inappropriate ChannelCode"), silent)
+    else:
+        auto_raise(APINetworkError, silent)
+
+    return None
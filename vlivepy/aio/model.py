@@ -0,0 +1,525 @@
+# -*- coding: utf-8 -*-
+
+from __future__ import annotations
+
+import asyncio
+from functools import partial
+from time import time
+from typing import (
+    AsyncGenerator,
+    Callable,
+    List,
+    Optional,
+    Union,
+)
+from warnings import warn
+
+from .. import model
+from .. import variables as gv
+from ..exception import (
+    ModelRefreshWarning,
+    ModelInitError,
+    ModelInitWarning,
+)
+from ..frozen import freeze
+from ..session import UserSession
+from ..tracing import span
+from ..upcoming import UpcomingVideo
+from .channel import (
+    getChannelInfo,
+    getGroupedBoards,
+)
+from .comment import (
+    getCommentData,
+    getPostCommentsIter,
+    getPostStarCommentsIter,
+    getNestedCommentsIter,
+)
+from .connections import (
+    getPostInfo,
+    videoSeqToPostId,
+    decode_channel_code,
+)
+from .post import getFVideoPlayInfo
+from .schedule import getScheduleData
+from .upcoming import getUpcomingList
+from .video import (
+    getInkeyData,
+    getLivePlayInfo,
+    getLiveStatus,
+    getOfficialVideoData,
+    getVodPlayInfo
+)
+
+
+class DataModel(model.DataModel):
+    """This is the base object for async objects.
+    Every property is shared with :class:`vlivepy.model.DataModel`, but loading data is done by coroutine.
+
+    Objects are initialized by awaiting. Creating object without awaiting doesn't send any request.
+
+    .. code-block:: python
+
+        post = await vlivepy.aio.Post("0-12345678")
+
+    Arguments:
+        method (:class:`typing.Callable`) : coroutine function for loading data.
+        target_id (:class:`str`) : argument for `method`.
+        session (:class:`UserSession`, optional) : session for `method`, defaults to None.
+        init_data (:class:`dict`, optional) : set initial data instead of loading data, defaults to None.
+
+    Attributes:
+        session (:class:`UserSession`) : session for method
+    """
+
+    __slots__ = []
+
+    def __init__(
+            self,
+            method: Callable,
+            target_id: str,
+            session: Optional[UserSession] = None,
+            init_data: Optional[dict] = None
+    ):
+        self._method = method
+        self._target_id = target_id
+        self.session = session
+        self._data_cache = freeze(init_data)
+
+    def __await__(self):
+        return self._init_data().__await__()
+
+    async def _init_data(self):
+        if self._data_cache is None:
+            await self.refresh()
+        if self._data_cache is not None:
+            self._check_data()
+        return self
+
+    def _check_data(self) -> None:
+        pass
+
+    @property
+    def loaded(self) -> bool:
+        """True if data is loaded by awaiting.
+
+        :rtype: :class:`bool`
+        """
+        return self._data_cache is not None
+
+    async def refresh(self) -> None:
+        """Reload self data."""
+        with span("%s.refresh" % type(self).__name__, **{"vlivepy.target_id": self.target_id}):
+            res = await self._method(self._target_id, session=self.session, silent=True)
+        if res:
+            self._data_cache = freeze(res)
+        else:
+            warn("Failed to refresh %s" % self, ModelRefreshWarning)
+
+
+class Comment(DataModel, model.Comment):
+    """Async version of :class:`vlivepy.model.Comment`"""
+
+    def __init__(
+            self,
+            commentId: str,
+            session: Optional[UserSession] = None,
+            init_data: Optional[dict] = None
+    ):
+        super().__init__(getCommentData, commentId, session=session, init_data=init_data)
+
+    def getNestedCommentsIter(self) -> AsyncGenerator[Comment, None]:
+        """Get nested comments as async generator.
+
+        :rtype: :class:`AsyncGenerator[Comment, None]`
+        """
+        return getNestedCommentsIter(self.commentId, session=self.session)
+
+
+class OfficialVideoModel(DataModel, model.OfficialVideoModel):
+    """Async version of :class:`vlivepy.model.OfficialVideoModel`"""
+
+    def __init__(
+            self,
+            video_seq: Union[str, int],
+            session: Optional[UserSession] = None
+    ):
+        super().__init__(getOfficialVideoData, video_seq, session=session)
+
+
+class OfficialVideoLive(OfficialVideoModel, model.OfficialVideoLive):
+    """Async version of :class:`vlivepy.model.OfficialVideoLive`"""
+
+    def _check_data(self) -> None:
+        if self.video_type != "LIVE":
+            raise ValueError("OfficialVideo [%s] is not Live." % self.target_id)
+
+    async def getLivePlayInfo(self, silent=False):
+        """Get play info of live
+
+        Arguments:
+            silent (:class:`bool`, optional) : Return None instead of raising exception, defaults to False.
+
+        :rtype: :class:`dict`
+        """
+        return await getLivePlayInfo(self.video_seq, session=self.session, silent=silent)
+
+    async def getLiveStatus(self, silent=False):
+        """Get detailed status of live.
+
+        Arguments:
+            silent (:class:`bool`, optional) : Return None instead of raising exception, defaults to False.
+
+        :rtype: :class:`dict`
+        """
+        return await getLiveStatus(self.video_seq, silent=silent)
+
+
+class OfficialVideoVOD(OfficialVideoModel, model.OfficialVideoVOD):
+    """Async version of :class:`vlivepy.model.OfficialVideoVOD`"""
+
+    def __init__(
+            self,
+            video_seq: Union[str, int],
+            session: Optional[UserSession] = None
+    ):
+        super().__init__(str(video_seq), session=session)
+
+    def _check_data(self) -> None:
+        if self.video_type != "VOD":
+            raise ValueError("OfficialVideo [%s] is not VOD." % self.target_id)
+
+    async def recommended_videos(
+            self,
+            as_object: bool = False
+    ) -> list:
+        """Get recommended video list. Each object is loaded concurrently with `as_object`.
+
+        Arguments:
+            as_object (:class:`bool`, optional) : Init each item to :class:`OfficialVideoPost`, defaults to False.
+
+        :rtype: :class:`list`
+        """
+        if as_object:
+            return list(await asyncio.gather(*[
+                OfficialVideoPost(item['videoSeq']) for item in self._data_cache['recommendedVideos']
+            ]))
+        else:
+            return model.OfficialVideoVOD.recommended_videos(self)
+
+    async def getInkeyData(
+            self,
+            silent: bool = False
+    ) -> dict:
+        """Get InKey data of video
+
+        Arguments:
+            silent (:class:`bool`, optional) : Return None instead of raising exception, defaults to False.
+
+        :rtype: :class:`dict`
+        """
+        return await getInkeyData(self.video_seq, session=self.session, silent=silent)
+
+    async def getVodPlayInfo(
+            self,
+            silent: bool = False
+    ) -> dict:
+        """Get VOD play info of video
+
+        Arguments:
+            silent (:class:`bool`, optional) : Return None instead of raising exception, defaults to False.
+
+        :rtype: :class:`dict`
+        """
+        return await getVodPlayInfo(self.video_seq, self.vod_id, session=self.session, silent=silent)
+
+
+class PostModel(DataModel, model.PostModel):
+    """Async version of :class:`vlivepy.model.PostModel`"""
+
+    def __init__(
+            self,
+            post_id: str,
+            session: Optional[UserSession] = None,
+            fields: str = "full"
+    ):
+        super().__init__(partial(getPostInfo, fields=fields), post_id, session=session)
+
+    def getPostCommentsIter(self) -> AsyncGenerator[Comment, None]:
+        """Get Its comments as async generator
+
+        :rtype: :class:`AsyncGenerator[Comment, None]`
+        """
+        return getPostCommentsIter(self.post_id, session=self.session)
+
+    def getPostStarCommentsIter(self) -> AsyncGenerator[Comment, None]:
+        """Get Its star-comments as async generator
+
+        :rtype: :class:`AsyncGenerator[Comment, None]`
+        """
+        return getPostStarCommentsIter(self.post_id, session=self.session)
+
+
+class Post(PostModel, model.Post):
+    """Async version of :class:`vlivepy.model.Post`"""
+
+    def _check_data(self) -> None:
+        if self.content_type != "POST":
+            warn(ModelInitWarning("Post-%s may be a OfficialVideoPost, not a Post." % self.target_id))
+
+    async def formatted_body(self) -> str:
+        """Get contents of post with formatting attachments and styles as html.
+        Play info of each video attachments is loaded concurrently.
+
+        :rtype: :class:`str`
+        """
+        soup = self._body_soup()
+
+        # load play info of video attachments
+        video_attachments = self._body_video_attachments(soup)
+        play_info_list = await asyncio.gather(*[
+            getFVideoPlayInfo(
+                f_video_id=at_data['videoId'],
+                f_vod_id=at_data['uploadInfo']['videoId'],
+                session=self.session
+            ) for at_id, at_data in video_attachments
+        ])
+        play_infos = {}
+        for (at_id, at_data), play_info in zip(video_attachments, play_info_list):
+            play_infos[at_id] = play_info
+
+        return self._render_body(soup, play_infos)
+
+
+class OfficialVideoPost(PostModel, model.OfficialVideoPost):
+    """Async version of :class:`vlivepy.model.OfficialVideoPost`"""
+
+    def __init__(
+            self,
+            init_id: Union[str, int],
+            session: Optional[UserSession] = None,
+            fields: str = "full"
+    ):
+        # interpret number
+        if type(init_id) == int:
+            init_id = str(init_id)
+
+        super().__init__(init_id, session, fields)
+
+    async def _init_data(self):
+        # Case <videoSeq>. video_seq is kept if post isn't found
+        if "-" not in self._target_id:
+            post_id = await videoSeqToPostId(self._target_id)
+            if post_id is None:
+                warn("Failed to refresh %s" % self, ModelRefreshWarning)
+                return self
+            self._target_id = post_id
+        return await super()._init_data()
+
+    def _post_id(self) -> str:
+        # post id is found by awaiting
+        if "-" not in self._target_id:
+            raise ModelInitError("Failed to find post of video %s" % self._target_id)
+        return self._target_id
+
+    def _check_data(self) -> None:
+        if self.content_type != "VIDEO":
+            warn(ModelInitWarning("Post-%s may be a Post, not a OfficialVideoPost." % self.target_id))
+
+    async def official_video(self) -> Union[OfficialVideoVOD, OfficialVideoLive]:
+        """Generate :class:`OfficialVideoLive` or :class:`OfficialVideoVOD` object that paired to official video posts
+
+        :return: :class:`OfficialVideoVOD`, if the video is VOD.
+        :return: :class:`OfficialVideoLive`, if the video is Live.
+        """
+        if self.official_video_type == "LIVE":
+            return await OfficialVideoLive(self.video_seq, session=self.session)
+        elif self.official_video_type == "VOD":
+            return await OfficialVideoVOD(self.video_seq, session=self.session)
+        else:
+            raise ModelInitError("Unknown official video type. please report issue with self.raw")
+
+
+class Schedule(DataModel, model.Schedule):
+    """Async version of :class:`vlivepy.model.Schedule`"""
+
+    def __init__(
+            self,
+            schedule_id: str,
+            session: UserSession,
+            fields: str = "full"
+    ):
+        super().__init__(partial(getScheduleData, fields=fields), schedule_id, session=session)
+
+    async def official_video(self) -> Union[OfficialVideoVOD, OfficialVideoLive]:
+        """Generate :class:`OfficialVideoLive` or :class:`OfficialVideoVOD` object that paired to schedule
+
+        :return: :class:`OfficialVideoVOD`, if the video is VOD.
+        :return: :class:`OfficialVideoLive`, if the video is Live.
+        """
+        if self.official_video_type == "LIVE":
+            return await OfficialVideoLive(self.video_seq, session=self.session)
+        elif self.official_video_type == "VOD":
+            return await OfficialVideoVOD(self.video_seq, session=self.session)
+        else:
+            raise ModelInitError("Unknown official video type. please report issue with self.raw")
+
+
+class Upcoming(model.Upcoming):
+    """Async version of :class:`vlivepy.model.Upcoming`.
+    The object is initialized by awaiting, and :meth:`refresh`, :meth:`load` and :meth:`upcoming` are coroutines.
+    """
+
+    def __init__(
+            self,
+            refresh_rate: float = 5,
+            show_vod: bool = True,
+            show_upcoming_vod: bool = True,
+            show_upcoming_live: bool = True,
+            show_live: bool = True
+    ):
+        self.refresh_rate = refresh_rate
+        self.__cached_data = []
+        self.__cached_time = 0
+        self.show_live = show_live
+        self.show_vod = show_vod
+        self.show_upcoming_vod = show_upcoming_vod
+        self.show_upcoming_live = show_upcoming_live
+
+    def __await__(self):
+        return self._init_data().__await__()
+
+    async def _init_data(self):
+        await self.refresh(True)
+        return self
+
+    async def refresh(
+            self,
+            force: bool = False
+    ) -> None:
+        """Refresh self data
+
+        Arguments:
+            force (:class:`bool`, optional) : Force refresh with ignoring refresh rate, defaults to False.
+        """
+        distance = time() - self.__cached_time
+        if distance >= self.refresh_rate or force:
+            new_data = await self.load(date=None, silent=True,
+                                       show_vod=True, show_upcoming_vod=True,
+                                       show_live=True, show_upcoming_live=True)
+            if new_data is not None:
+                self.__cached_data = new_data
+                self.__cached_time = int(time())
+
+    async def load(
+            self,
+            date: Optional[str],
+            show_vod: Optional[bool] = None,
+            show_upcoming_vod: Optional[bool] = None,
+            show_upcoming_live: Optional[bool] = None,
+            show_live: Optional[bool] = None,
+            silent: Optional[bool] = False
+    ) -> Optional[List[UpcomingVideo]]:
+        """Coroutine version of :meth:`vlivepy.model.Upcoming.load`"""
+        if show_live is None:
+            show_live = self.show_live
+        if show_vod is None:
+            show_vod = self.show_vod
+        if show_upcoming_vod is None:
+            show_upcoming_vod = self.show_upcoming_vod
+        if show_upcoming_live is None:
+            show_upcoming_live = self.show_upcoming_live
+
+        upcomings = await getUpcomingList(date=date, silent=silent)
+
+        if upcomings is not None:
+            return self._filter(upcomings, show_vod, show_upcoming_vod, show_upcoming_live, show_live)
+        return None
+
+    async def upcoming(
+            self,
+            force=False,
+            show_vod: Optional[bool] = None,
+            show_upcoming_vod: Optional[bool] = None,
+            show_upcoming_live: Optional[bool] = None,
+            show_live: Optional[bool] = None
+    ) -> List[UpcomingVideo]:
+        """Coroutine version of :meth:`vlivepy.model.Upcoming.upcoming`"""
+        await self.refresh(force=force)
+        if show_live is None:
+            show_live = self.show_live
+        if show_vod is None:
+            show_vod = self.show_vod
+        if show_upcoming_vod is None:
+            show_upcoming_vod = self.show_upcoming_vod
+        if show_upcoming_live is None:
+            show_upcoming_live = self.show_upcoming_live
+
+        return self._filter(self.__cached_data, show_vod, show_upcoming_vod, show_upcoming_live, show_live)
+
+
+class GroupedBoards(DataModel, model.GroupedBoards):
+    """Async version of :class:`vlivepy.model.GroupedBoards`"""
+
+    def __init__(
+            self,
+            channel_code: str,
+            session: Optional[UserSession] = None
+    ):
+        super().__init__(getGroupedBoards, channel_code, session)
+
+
+class Channel(DataModel, model.Channel):
+    """Async version of :class:`vlivepy.model.Channel`"""
+
+    def __init__(
+            self,
+            channel_code: str,
+            session: Optional[UserSession] = None
+    ):
+        super().__init__(getChannelInfo, channel_code, session)
+
+    async def decode_channel_code(self) -> int:
+        """Decode channel code to unique channel seq
+
+        :rtype: :class:`int`
+        """
+        return await decode_channel_code(self.channel_code)
+
+    async def groupedBoards(self) -> GroupedBoards:
+        """Load grouped board list of the channel
+
+        :rtype: :class:`GroupedBoards`
+        """
+        return await GroupedBoards(self.channel_code, self.session)
+
+
+async def loadModels(
+        models: List[DataModel],
+        workers: int = None
+) -> List[DataModel]:
+    """Async version of :func:`vlivepy.model.loadModels`. Objects not awaited yet are awaited concurrently.
+
+    .. code-block:: python
+
+        posts = [await item.to_object(lazy=True) async for item in getBoardPostsIter("FD53B", 3140)]
+        await loadModels(posts)
+
+    Arguments:
+        models (:class:`List[DataModel]`) : Objects to load.
+        workers (:class:`int`, optional) : Max objects loading at once,
+            defaults to :obj:`vlivepy.variables.override_load_workers`.
+
+    Returns:
+        :class:`List[DataModel]`. `models` as list. Objects failed to load stay unloaded without raising exception.
+    """
+    models = list(models)
+    semaphore = asyncio.Semaphore(max(1, gv.override_load_workers if workers is None else workers))
+
+    async def load(item):
+        async with semaphore:
+            await item
+
+    # Failure of each object is left to the object
+    await asyncio.gather(*[load(item) for item in models if not item.loaded], return_exceptions=True)
+    return models
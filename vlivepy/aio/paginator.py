@@ -0,0 +1,125 @@
+# -*- coding: utf-8 -*-
+
+import asyncio
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Optional,
+    Union,
+)
+
+from .. import paginator
+from ..exception import APIBadRequestError
+
+
+class Paginator(paginator.Paginator):
+    """Async iterator version of :class:`vlivepy.paginator.Paginator`. Next pages are loaded by background task.
+
+    Position is saved and restored same as sync version.
+
+    .. code-block:: python
+
+        pager = getPostCommentsIter("0-18396482")
+        async for comment in pager:
+            save(pager.state())
+    """
+
+    __slots__ = []
+
+    def __init__(
+            self,
+            iterator: str,
+            fetch: Callable[[Optional[str], Optional[int]], Awaitable[Any]],
+            after: str = None,
+            prefetch: int = None,
+            page_size: Union[int, str] = None
+    ):
+        super().__init__(iterator, fetch, after, prefetch, page_size)
+
+    async def _load(self, after: Optional[str]):
+        if self.page_size != "adaptive":
+            return self._page(after, await self._fetch(after, self.page_size))
+
+        sizes = paginator.adaptive_page_sizes(self.iterator)
+        if paginator.default_page_size(self.iterator) is None:
+            # Larger sizes are tried only after size of server default is found
+            data = await self._fetch(after, None)
+            paginator.accept_default_page(self.iterator, data)
+            return self._page(after, data)
+
+        for size in sizes:
+            try:
+                data = await self._fetch(after, size)
+            except APIBadRequestError:
+                if size is None:
+                    raise
+                continue
+            paginator.accept_page_size(self.iterator, size)
+            return self._page(after, data)
+
+    async def _serial(self):
+        after = self._cursor
+        while True:
+            page = await self._load(after)
+            for item in self._consume(page):
+                yield item
+            after = page[2]
+            if not after:
+                break
+
+    async def _prefetched(self):
+        # Each entry is (page, exception). None marks the end.
+        pages = asyncio.Queue(maxsize=self.prefetch)
+
+        async def produce():
+            after = self._cursor
+            try:
+                while True:
+                    page = await self._load(after)
+                    await pages.put((page, None))
+                    after = page[2]
+                    if not after:
+                        break
+            except Exception as e:
+                await pages.put((None, e))
+            await pages.put(None)
+
+        task = asyncio.ensure_future(produce())
+        try:
+            while True:
+                entry = await pages.get()
+                if entry is None:
+                    return
+                page, error = entry
+                if error is not None:
+                    raise error
+                for item in self._consume(page):
+                    yield item
+        finally:
+            task.cancel()
+
+    async def _generate(self):
+        if self._done:
+            return
+        items = self._prefetched() if self.prefetch > 0 else self._serial()
+        async for item in items:
+            yield item
+        self._done = True
+
+    def __iter__(self):
+        raise TypeError("Use 'async for' to iterate %s" % self.iterator)
+
+    def __aiter__(self) -> AsyncIterator:
+        return self
+
+    async def __anext__(self):
+        if self._pages is None:
+            self._pages = self._generate()
+        return await self._pages.__anext__()
+
+    async def aclose(self) -> None:
+        """Stop iteration and background task of prefetch."""
+        if self._pages is not None:
+            await self._pages.aclose()
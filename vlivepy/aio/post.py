@@ -0,0 +1,53 @@
+# -*- coding: utf-8 -*-
+
+from typing import (
+    Optional,
+)
+
+from .. import variables as gv
+from ..exception import auto_raise, APINetworkError
+from ..parser import response_json_loader, response_json_stripper
+from ..session import UserSession
+from ..tracing import traced
+from .router import rew_get
+
+
+@traced
+async def getFVideoInkeyData(
+        f_video_id: str,
+        session: UserSession = None,
+        silent: bool = False
+) -> Optional[dict]:
+    """Coroutine version of :func:`vlivepy.post.getFVideoInkeyData`"""
+
+    # Make request
+    sr = await rew_get(**gv.endpoint_fvideo_inkey(f_video_id), endpoint="endpoint_fvideo_inkey",
+                       session=session, status=[200])
+
+    if sr.success:
+        return response_json_stripper(response_json_loader(sr.response), silent=silent)['inKey']
+    else:
+        auto_raise(APINetworkError, silent)
+
+    return None
+
+
+@traced
+async def getFVideoPlayInfo(
+        f_video_id: str,
+        f_vod_id: str,
+        session: UserSession = None,
+        silent: bool = False
+) -> Optional[dict]:
+    """Coroutine version of :func:`vlivepy.post.getFVideoPlayInfo`"""
+
+    inkey = await getFVideoInkeyData(f_video_id=f_video_id, session=session)
+    sr = await rew_get(**gv.endpoint_vod_play_info(f_vod_id, inkey), endpoint="endpoint_vod_play_info",
+                       session=session, status=[200, 403])
+
+    if sr.success:
+        return response_json_stripper(response_json_loader(sr.response), silent=silent)
+    else:
+        auto_raise(APINetworkError, silent=silent)
+
+    return None
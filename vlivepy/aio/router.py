@@ -0,0 +1,172 @@
+# -*- coding: utf-8 -*-
+
+import asyncio
+from functools import partial
+from time import perf_counter
+
+try:
+    import httpx
+except ImportError:
+    raise ImportError("vlivepy.aio requires httpx. Install it with `pip install vlivepy[aio]`")
+from reqWrapper import SafeResponse, StatusFilter
+
+from .. import variables as gv
+from ..cache import ResponseCache, getCache
+from ..hooks import RequestInfo, dispatch, dispatch_cached
+from ..ratelimit import getRateLimiter
+from ..retry import RetryPolicy, getCircuitBreaker, getRetryPolicy
+from ..router import FailedResponse
+from ..singleflight import AsyncSingleFlight
+
+# Shared async client options
+max_connections = 100
+max_keepalive_connections = 20
+timeout = 10
+
+_client = None
+_client_loop = None
+_flight = AsyncSingleFlight()
+
+
+def get_client() -> httpx.AsyncClient:
+    """Get shared :class:`httpx.AsyncClient` of running event loop.
+    The client is created at first use and re-created when the event loop is changed.
+
+    Returns:
+        :class:`httpx.AsyncClient`
+    """
+    global _client, _client_loop
+
+    loop = asyncio.get_running_loop()
+    if _client is None or _client.is_closed or _client_loop is not loop:
+        _client = httpx.AsyncClient(
+            limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_keepalive_connections
+            ),
+            timeout=timeout,
+            follow_redirects=True,
+        )
+        _client_loop = loop
+
+    return _client
+
+
+async def close_client() -> None:
+    """Close shared client and release its connections."""
+    global _client
+
+    if _client is not None:
+        await _client.aclose()
+        _client = None
+
+
+async def rew_get(
+        url,
+        session=None,
+        status=None,
+        endpoint: str = None,
+        retry_policy: RetryPolicy = None,
+        **kwargs
+) -> SafeResponse:
+    client = get_client()
+    params = kwargs.get('params')
+
+    # sqlite of cache is used in executor, not to block event loop
+    cache = getCache()
+    loop = asyncio.get_running_loop()
+    if cache is not None:
+        cached = await loop.run_in_executor(None, partial(cache.get, "get", url, params, session, endpoint))
+        if cached is not None:
+            dispatch_cached(url, params, endpoint, cached)
+            return SafeResponse(success=True, response=cached, session=client)
+
+    async def fetch():
+        sr = await _send(client, url, session, status, endpoint, retry_policy, **kwargs)
+        if cache is not None and sr.success:
+            await loop.run_in_executor(None, partial(cache.set, "get", url, sr.response, params, session, endpoint))
+        return sr
+
+    if gv.override_single_flight:
+        key = (ResponseCache.make_key("get", url, params, session), endpoint, repr(status))
+        return await _flight.do(key, fetch)
+    else:
+        return await fetch()
+
+
+async def _send(
+        client,
+        url,
+        session,
+        status,
+        endpoint,
+        retry_policy,
+        **kwargs
+) -> SafeResponse:
+    if status is None:
+        status = []
+    elif type(status) == int:
+        status = [status]
+    status = StatusFilter(status)
+
+    request = client.build_request("GET", url, **kwargs)
+    if session:
+        httpx.Cookies(session.session.cookies).set_cookie_header(request)
+
+    if retry_policy is None:
+        retry_policy = getRetryPolicy()
+    breaker = getCircuitBreaker(endpoint or request.url.host)
+    limiter = getRateLimiter()
+
+    if not breaker.allow():
+        return FailedResponse()
+
+    max_attempts = retry_policy.attempts_for("get")
+    attempt = 0
+    last_status = None
+    # Circuit breaker judges the call once after retries, not each attempt
+    healthy = None
+    while attempt < max_attempts:
+        attempt += 1
+        info = RequestInfo("get", url, kwargs.get('params'), endpoint, attempt)
+        info.wait = limiter.reserve(url)
+        if info.wait > 0:
+            await asyncio.sleep(info.wait)
+        dispatch("before_request", info)
+        retry_after = None
+        started = perf_counter()
+        try:
+            res = await client.send(request)
+        except Exception as e:
+            last_status = None
+            info.error = e
+            info.total = perf_counter() - started
+            dispatch("on_error", info)
+            if not (isinstance(e, httpx.TransportError) or retry_policy.is_retryable_exception(e)):
+                healthy = None
+                break
+            healthy = False
+        else:
+            last_status = res.status_code
+            info.set_response(res, perf_counter() - started)
+            dispatch("after_response", info)
+            if status.check(res.status_code):
+                breaker.record_success()
+                return SafeResponse(success=True, response=res, session=client)
+            elif not retry_policy.is_retryable_status(res.status_code):
+                healthy = True
+                break
+            healthy = False
+            retry_after = res.headers.get("Retry-After")
+
+        if attempt < max_attempts:
+            await asyncio.sleep(retry_policy.delay(attempt, retry_after))
+
+    if healthy is None:
+        breaker.release()
+    elif healthy:
+        breaker.record_success()
+    else:
+        breaker.record_failure()
+
+    return FailedResponse(last_status)
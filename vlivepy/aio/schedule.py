@@ -0,0 +1,32 @@
+# -*- coding: utf-8 -*-
+
+from typing import (
+    Optional
+)
+
+from .. import variables as gv
+from ..exception import auto_raise, APINetworkError
+from ..parser import response_json_loader, response_json_stripper
+from ..session import UserSession
+from ..tracing import traced
+from .router import rew_get
+
+
+@traced
+async def getScheduleData(
+        schedule_id: str,
+        session: UserSession,
+        silent: bool = False,
+        fields: str = "full"
+) -> Optional[dict]:
+    """Coroutine version of :func:`vlivepy.schedule.getScheduleData`"""
+
+    sr = await rew_get(**gv.endpoint_schedule_data(schedule_id, fields), endpoint="endpoint_schedule_data",
+                       session=session, status=[200, 403])
+
+    if sr.success:
+        return response_json_stripper(response_json_loader(sr.response), silent=silent)
+    else:
+        auto_raise(APINetworkError, silent)
+
+    return None
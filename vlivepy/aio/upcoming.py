@@ -0,0 +1,31 @@
+# -*- coding: utf-8 -*-
+
+from typing import (
+    List,
+    Optional,
+    Union
+)
+
+from .. import variables as gv
+from ..exception import auto_raise, APINetworkError
+from ..tracing import traced
+from ..upcoming import upcoming_list_parser, UpcomingVideo
+from .router import rew_get
+
+
+@traced
+async def getUpcomingList(
+        date: Union[str, int] = None,
+        silent: bool = False
+) -> Optional[List[UpcomingVideo]]:
+    """Coroutine version of :func:`vlivepy.upcoming.getUpcomingList`"""
+
+    # make request
+    sr = await rew_get(**gv.endpoint_upcoming(date), endpoint="endpoint_upcoming")
+
+    if sr.success:
+        return upcoming_list_parser(sr.response.text)
+    else:
+        auto_raise(APINetworkError, silent=silent)
+
+    return None
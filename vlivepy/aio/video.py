@@ -0,0 +1,195 @@
+# -*- coding: utf-8 -*-
+
+import asyncio
+from typing import (
+    Optional,
+    Union
+)
+
+from .. import variables as gv
+from ..exception import auto_raise, APINetworkError, APIJSONParesError, APIServerResponseError
+from ..parser import response_json_loader, response_json_stripper
+from ..session import UserSession
+from ..tracing import traced
+from .router import rew_get
+
+
+@traced
+async def getOfficialVideoPost(
+        video_seq: Union[str, int],
+        session: UserSession = None,
+        silent: bool = False,
+        fields: str = "full"
+) -> Optional[dict]:
+    """Coroutine version of :func:`vlivepy.video.getOfficialVideoPost`"""
+
+    sr = await rew_get(**gv.endpoint_official_video_post(video_seq, fields), endpoint="endpoint_official_video_post",
+                       session=session, status=[200, 403])
+
+    if sr.success:
+        return response_json_stripper(response_json_loader(sr.response), silent=silent)
+    else:
+        auto_raise(APINetworkError, silent)
+
+    return None
+
+
+@traced
+async def getLivePlayInfo(
+        video_seq: Union[str, int],
+        session: UserSession = None,
+        vpdid2: str = None,
+        silent: bool = False
+) -> Optional[dict]:
+    """Coroutine version of :func:`vlivepy.video.getLivePlayInfo`"""
+
+    # Get vpdid2, if session is valid
+    if session is not None and vpdid2 is None:
+        vpdid2 = await getVpdid2(session, silent=silent)
+
+    # Make request
+    sr = await rew_get(**gv.endpoint_live_play_info(video_seq, vpdid2), endpoint="endpoint_live_play_info",
+                       session=session, status=[200, 403])
+
+    if sr.success:
+        json_response = response_json_loader(sr.response)
+        if json_response['code'] != 1000:
+            auto_raise(
+                APIServerResponseError("Video-%s is not live or reserved live. It may be a VOD" % video_seq),
+                silent
+            )
+        else:
+            return response_json_stripper(json_response, silent=silent)
+    else:
+        auto_raise(APINetworkError, silent)
+
+    return None
+
+
+@traced
+async def getLiveStatus(
+        video_seq: Union[str, int],
+        silent: bool = False
+) -> Optional[dict]:
+    """Coroutine version of :func:`vlivepy.video.getLiveStatus`"""
+
+    # Make request
+    sr = await rew_get(**gv.endpoint_live_status(video_seq), endpoint="endpoint_live_status",
+                       status=[200])
+
+    if sr.success:
+        json_response = response_json_loader(sr.response)
+        if json_response['code'] != 1000:
+            auto_raise(
+                APIServerResponseError("Video-%s is not live or reserved live. It may be a VOD" % video_seq),
+                silent
+            )
+        else:
+            return response_json_stripper(json_response, silent=silent)
+    else:
+        auto_raise(APINetworkError, silent)
+
+    return None
+
+
+@traced
+async def getVodId(
+        video_seq: Union[str, int],
+        silent: bool = False
+) -> Optional[str]:
+    """Coroutine version of :func:`vlivepy.video.getVodId`"""
+
+    data = await getOfficialVideoPost(video_seq, silent=silent, fields="minimal")
+
+    if data is not None:
+        if 'officialVideo' in data:
+            if 'vodId' in data['officialVideo']:
+                return data['officialVideo']['vodId']
+            else:
+                auto_raise(APIJSONParesError("Given data is live data"), silent=silent)
+        else:
+            auto_raise(APIJSONParesError("Given data is post data"), silent=silent)
+
+    return None
+
+
+@traced
+async def getInkeyData(
+        video_seq: Union[str, int],
+        session: UserSession = None,
+        silent: bool = False
+) -> Optional[dict]:
+    """Coroutine version of :func:`vlivepy.video.getInkeyData`"""
+
+    # Make request
+    sr = await rew_get(**gv.endpoint_vod_inkey(video_seq), endpoint="endpoint_vod_inkey",
+                       session=session, status=[200, 403])
+
+    if sr.success:
+        if sr.status_code == 403:
+            auto_raise(APIServerResponseError("Video %s is not VOD" % video_seq), silent)
+        else:
+            return response_json_stripper(response_json_loader(sr.response), silent=silent)
+    else:
+        auto_raise(APINetworkError, silent)
+
+    return None
+
+
+@traced
+async def getVpdid2(
+        session: UserSession,
+        silent: bool = False
+) -> Optional[str]:
+    """Coroutine version of :func:`vlivepy.video.getVpdid2`"""
+
+    inkey = await getInkeyData("142851", session=session, silent=silent)
+    if inkey is None:
+        return None
+    else:
+        if 'vpdid2' not in inkey:
+            auto_raise(APIJSONParesError("Server didn't return vpdid2"), silent=silent)
+        return inkey['vpdid2']
+
+
+@traced
+async def getVodPlayInfo(
+        video_seq: Union[str, int],
+        vod_id: str = None,
+        session: UserSession = None,
+        silent: bool = False
+) -> Optional[dict]:
+    """Coroutine version of :func:`vlivepy.video.getVodPlayInfo`"""
+
+    if vod_id is None:
+        inkey_data, vod_id = await asyncio.gather(
+            getInkeyData(video_seq, session=session, silent=silent),
+            getVodId(video_seq)
+        )
+    else:
+        inkey_data = await getInkeyData(video_seq, session=session, silent=silent)
+    inkey = inkey_data['inkey']
+
+    # make request
+    sr = await rew_get(**gv.endpoint_vod_play_info(vod_id, inkey), endpoint="endpoint_vod_play_info",
+                       session=session, status=[200, 403])
+
+    if sr.success:
+        return response_json_stripper(response_json_loader(sr.response), silent=silent)
+    else:
+        auto_raise(APINetworkError, silent=silent)
+
+
+@traced
+async def getOfficialVideoData(
+        video_seq: Union[str, int],
+        session: UserSession = None,
+        silent: bool = False
+) -> Optional[dict]:
+    """Coroutine version of :func:`vlivepy.video.getOfficialVideoData`"""
+
+    ovp = await getOfficialVideoPost(video_seq, session=session, silent=silent)
+    if ovp:
+        return ovp['officialVideo']
+
+    return None
@@ -1,17 +1,24 @@
 # -*- coding: utf-8 -*-
 
+import heapq
+from concurrent.futures import ThreadPoolExecutor
+from contextvars import copy_context
 from warnings import catch_warnings
 from typing import (
     Generator,
+    Iterator,
+    List,
     Union,
     Optional,
 )
 from . import variables as gv
-from .exception import APINetworkError, auto_raise
-from .model import OfficialVideoPost, Post
-from .parser import response_json_stripper, next_page_checker, v_timestamp_parser
-from .router import rew_get
+from .exception import APIServerResponseError, auto_raise
+from .model import GroupedBoards, OfficialVideoPost, Post
+from .paginator import Paginator
+from .parser import response_json_loader, response_json_stripper, v_timestamp_parser
+from .router import network_error, rew_get
 from .session import UserSession
+from .tracing import traced
 
 
 class BoardPostItem(object):
@@ -103,19 +110,27 @@ class BoardPostItem(object):
         """
         return self.__content_type
 
-    def to_object(self) -> Union[Post, OfficialVideoPost]:
+    def to_object(
+            self,
+            lazy: bool = False
+    ) -> Union[Post, OfficialVideoPost]:
         """Initialize matched object from post_id
 
+        Arguments:
+            lazy (:class:`bool`, optional) : Defer loading data until first access, defaults to False.
+                Use :func:`vlivepy.model.loadModels` to load many objects at once.
+
         Returns:
             :class:`vlivepy.Post`, if the post is normal post.
             :class:`vlivepy.OfficialVideoPost`, if the post is official video
         """
         if self.__content_type == "VIDEO":
-            return OfficialVideoPost(self.post_id, session=self.session)
+            return OfficialVideoPost(self.post_id, session=self.session, lazy=lazy)
         else:
-            return Post(self.post_id, session=self.session)
+            return Post(self.post_id, session=self.session, lazy=lazy)
 
 
+@traced
 def getBoardPosts(
         channel_code: str,
         board_id: Union[str, int],
@@ -124,6 +139,7 @@ def getBoardPosts(
         latest: bool = False,
         silent: bool = False,
         raise_message: bool = False,
+        page_size: int = None,
 ) -> Optional[dict]:
     """Get board post from page
 
@@ -135,17 +151,20 @@ def getBoardPosts(
         latest (:class:`bool`, optional) : Load latest post first, defaults to False.
         silent (:class:`bool`, optional) : Return None instead of raising exception, defaults to False.
         raise_message (:class:`bool`, optional) : Raise exception instead of parser warning, defaults to False.
+        page_size (:class:`int`, optional) : Items per page, defaults to 20.
 
     Returns:
         :class:`dict`. Parsed json data.
     """
 
     # Make request
-    sr = rew_get(**gv.endpoint_board_posts(channel_code, board_id, after=after, latest=latest),
-                 wait=0.5, session=session, status=[200, 403])
+    sr = rew_get(**gv.endpoint_board_posts(channel_code, board_id, after=after, latest=latest,
+                                           limit=page_size), endpoint="endpoint_board_posts",
+                 session=session, status=[200, 403])
 
     if sr.success:
-        stripped_data = response_json_stripper(sr.response.json(), silent=silent, raise_message=raise_message)
+        stripped_data = response_json_stripper(response_json_loader(sr.response),
+                                               silent=silent, raise_message=raise_message)
         if 'data' in stripped_data:
             parsed_data = []
             for item in stripped_data['data']:
@@ -153,7 +172,7 @@ def getBoardPosts(
             stripped_data['data'] = parsed_data
         return stripped_data
     else:
-        auto_raise(APINetworkError, silent)
+        auto_raise(network_error(sr), silent)
 
     return None
 
@@ -162,27 +181,221 @@ def getBoardPostsIter(
         channel_code: str,
         board_id: Union[str, int],
         session: UserSession = None,
-        latest: bool = False
-) -> Generator[BoardPostItem, None, None]:
-    """Get board post as iterable (generator).
+        latest: bool = False,
+        after: str = None,
+        prefetch: int = None,
+        page_size: Union[int, str] = None
+) -> Paginator:
+    """Get board post as resumable iterable (:class:`vlivepy.paginator.Paginator`).
 
     Arguments:
         channel_code (:class:`str`) : Unique id of the channel which contains board.
         board_id (:class:`str`) : Unique id of the board to load.
         session (:class:`vlivepy.UserSession`, optional) : Session for loading data with permission, defaults to None.
         latest (:class:`str`, optional) : Load latest post first.
+        after (:class:`str`, optional) : Cursor of page to start, defaults to None (first page).
+        prefetch (:class:`int`, optional) : Max pages loaded ahead in background,
+            defaults to :obj:`vlivepy.variables.override_prefetch_pages`.
+        page_size (:class:`Union[int, str]`, optional) : Items per page or :code:`"adaptive"`,
+            defaults to :obj:`vlivepy.variables.override_page_size`.
+
+    Yields:
+        :class:`BoardPostItem`
+    """
+
+    return Paginator(
+        "getBoardPostsIter",
+        lambda cursor, size: getBoardPosts(channel_code, board_id, session=session, after=cursor, page_size=size,
+                                           latest=latest, raise_message=True),
+        after,
+        prefetch,
+        page_size
+    )
+
+
+class BoardSync(object):
+    """This is the iterable of new posts of board, from latest post to the high-water mark.
+    Paging stops as soon as the mark is reached, so refreshing active board costs a page.
+
+    Mark is reached at the post of `post_id` or the first post created at or before `created_at`.
+    :attr:`watermark` becomes the latest post after every new post is yielded,
+    so the mark isn't moved past posts which aren't consumed yet.
+
+    .. code-block:: python
+
+        sync = getBoardPostsSince("FD53B", 1234, load())
+        for post in sync:
+            mirror(post)
+        save(sync.watermark)
+
+    Arguments:
+        posts (:class:`vlivepy.paginator.Paginator`) : Posts of board from latest.
+        watermark (:class:`Union[str, float, dict]`, optional) : postId, created_at or :attr:`watermark`
+            of last sync. None loads every post.
+    """
+
+    __slots__ = ['__posts', '__watermark', '__latest', '__count']
+
+    def __init__(
+            self,
+            posts: Paginator,
+            watermark: Union[str, float, dict] = None
+    ):
+        if watermark is None or isinstance(watermark, dict):
+            watermark = dict(watermark or {})
+        elif isinstance(watermark, str):
+            watermark = {"post_id": watermark}
+        elif isinstance(watermark, (int, float)):
+            watermark = {"created_at": watermark}
+        else:
+            raise TypeError("watermark must be postId, created_at or dict, not %s" % type(watermark).__name__)
+
+        self.__posts = posts
+        self.__watermark = watermark
+        self.__latest = None
+        self.__count = 0
+
+    def __repr__(self):
+        return "<BoardSync [%s]>" % self.__watermark.get('post_id')
+
+    @property
+    def watermark(self) -> dict:
+        """High-water mark of the latest post as dict with ``post_id`` and ``created_at``.
+        Empty dict if no post is synced.
+
+        :rtype: :class:`dict`
+        """
+        return dict(self.__watermark)
+
+    @property
+    def count(self) -> int:
+        """Count of new posts yielded.
+
+        :rtype: :class:`int`
+        """
+        return self.__count
+
+    def _reached(self, item: BoardPostItem) -> bool:
+        if 'post_id' in self.__watermark and item.post_id == self.__watermark['post_id']:
+            return True
+        if 'created_at' in self.__watermark and item.created_at <= self.__watermark['created_at']:
+            return True
+        return False
+
+    def _new(self, item: BoardPostItem) -> None:
+        if self.__latest is None:
+            self.__latest = {"post_id": item.post_id, "created_at": item.created_at}
+        self.__count += 1
+
+    def _finish(self) -> None:
+        if self.__latest is not None:
+            self.__watermark = self.__latest
+            self.__latest = None
+
+    @property
+    def _posts(self):
+        return self.__posts
+
+    def __iter__(self) -> Iterator[BoardPostItem]:
+        for item in self.__posts:
+            if self._reached(item):
+                self.__posts.close()
+                break
+            self._new(item)
+            yield item
+        self._finish()
+
+
+def getBoardPostsSince(
+        channel_code: str,
+        board_id: Union[str, int],
+        watermark: Union[str, float, dict] = None,
+        session: UserSession = None
+) -> BoardSync:
+    """Get new posts of board since the high-water mark of last sync, from latest post.
+
+    Arguments:
+        channel_code (:class:`str`) : Unique id of the channel which contains board.
+        board_id (:class:`str`) : Unique id of the board to load.
+        watermark (:class:`Union[str, float, dict]`, optional) : postId, created_at or :attr:`BoardSync.watermark`
+            of last sync, defaults to None (every post).
+        session (:class:`vlivepy.UserSession`, optional) : Session for loading data with permission, defaults to None.
+
+    Returns:
+        :class:`BoardSync`. Iterable of new :class:`BoardPostItem`.
+    """
+
+    return BoardSync(getBoardPostsIter(channel_code, board_id, session=session, latest=True, prefetch=0), watermark)
+
+
+def _merge_key(item: BoardPostItem, latest: bool) -> float:
+    return -item.created_at if latest else item.created_at
+
+
+def getChannelPostsIter(
+        channel_code: str,
+        board_ids: List[Union[str, int]] = None,
+        session: UserSession = None,
+        latest: bool = True,
+        workers: int = None,
+        prefetch: int = None
+) -> Generator[BoardPostItem, None, None]:
+    """Get posts of every board in channel as one feed ordered by :attr:`BoardPostItem.created_at`.
+
+    First pages of boards are loaded concurrently by thread pool, and posts are merged with heap.
+    Next page of a board is loaded only when merged feed reaches the end of its current page.
+    With `prefetch`, it is loaded in background before that.
+
+    Arguments:
+        channel_code (:class:`str`) : Unique id of the channel.
+        board_ids (:class:`List[Union[str, int]]`, optional) : Boards to merge,
+            defaults to every board of :class:`vlivepy.model.GroupedBoards` that session can read.
+            Membership boards given here raise exception without session having permission.
+        session (:class:`vlivepy.UserSession`, optional) : Session for loading data with permission, defaults to None.
+        latest (:class:`bool`, optional) : Load latest post first, defaults to True.
+        workers (:class:`int`, optional) : Max boards loading first page at once, defaults to count of boards.
+        prefetch (:class:`int`, optional) : Max pages of each board loaded ahead in background,
+            defaults to :obj:`vlivepy.variables.override_prefetch_pages`.
 
     Yields:
         :class:`BoardPostItem`
     """
 
-    data = getBoardPosts(channel_code, board_id, session=session, latest=latest, raise_message=True)
-    after = next_page_checker(data)
-    for item in data['data']:
-        yield item
+    # Default boards answering error (membership, paid) are skipped
+    skip_denied = board_ids is None
+    if board_ids is None:
+        board_ids = [board['boardId'] for board in GroupedBoards(channel_code, session=session).boards()]
+    if not board_ids:
+        return
 
-    while after:
-        data = getBoardPosts(channel_code, board_id, session=session, after=after, latest=latest, raise_message=True)
-        after = next_page_checker(data)
-        for item in data['data']:
+    boards = [
+        getBoardPostsIter(channel_code, board_id, session=session, latest=latest, prefetch=prefetch)
+        for board_id in board_ids
+    ]
+    try:
+        with ThreadPoolExecutor(workers or len(boards), thread_name_prefix="vlivepy-boards") as executor:
+            # Every task needs its own copy of caller's context
+            futures = [executor.submit(copy_context().run, next, board, None) for board in boards]
+            firsts = []
+            for future in futures:
+                try:
+                    firsts.append(future.result())
+                except APIServerResponseError:
+                    if not skip_denied:
+                        raise
+                    firsts.append(None)
+
+        # Board index breaks tie of created_at, so posts of same time keep order of boards
+        heap = [(_merge_key(item, latest), index, item) for index, item in enumerate(firsts) if item is not None]
+        heapq.heapify(heap)
+        while heap:
+            _, index, item = heap[0]
             yield item
+            item = next(boards[index], None)
+            if item is None:
+                heapq.heappop(heap)
+            else:
+                heapq.heapreplace(heap, (_merge_key(item, latest), index, item))
+    finally:
+        for board in boards:
+            board.close()
@@ -0,0 +1,252 @@
+# -*- coding: utf-8 -*-
+
+from contextlib import contextmanager
+from contextvars import ContextVar
+from threading import Lock
+from typing import (
+    Dict,
+    List,
+    Tuple,
+)
+
+from .hooks import RequestInfo, addHook
+from .transport import OfflineTransport, ReplayTransport, useTransport
+
+
+class PlannedRequest(object):
+    """This is the object for one request recorded by :class:`RequestBudget`.
+
+    Attributes:
+        method (:class:`str`) : HTTP method.
+        url (:class:`str`) : Request url.
+        params (:class:`dict`) : Query parameters.
+        endpoint (:class:`str`) : Name of endpoint helper which built the request.
+        attempt (:class:`int`) : Attempt number starting from 1.
+        cached (:class:`bool`) : True if response is served from :mod:`vlivepy.cache`.
+        status_code (:class:`int`) : Status code of response. None on error.
+        error (:class:`str`) : Exception raised while sending request. None on response.
+    """
+
+    __slots__ = ['method', 'url', 'params', 'endpoint', 'attempt', 'cached', 'status_code', 'error']
+
+    def __init__(self, info: RequestInfo):
+        self.method = info.method
+        self.url = info.url
+        self.params = dict(info.params) if info.params else None
+        self.endpoint = info.endpoint
+        self.attempt = info.attempt
+        self.cached = info.cached
+        self.status_code = info.status_code
+        self.error = "%s: %s" % (type(info.error).__name__, info.error) if info.error is not None else None
+
+    def __repr__(self):
+        return "<PlannedRequest [%s %s]>" % (self.method, self.endpoint or self.url)
+
+    def to_dict(self) -> dict:
+        """Convert to dict.
+
+        :rtype: :class:`dict`
+        """
+        return {key: getattr(self, key) for key in self.__slots__}
+
+
+class RequestBudget(object):
+    """Count requests by endpoint inside `with` block.
+
+    .. code-block:: python
+
+        with RequestBudget() as budget:
+            post = Post("0-18396482")
+            comments = list(post.getPostCommentsIter())
+
+        print(budget.requests, budget.by_endpoint)
+        # 3 {'endpoint_post': 1, 'endpoint_post_comments': 2}
+
+    Only requests of current thread(or task) are counted by default. Requests of other threads are
+    counted too if ``all_threads`` is True. Budgets can be nested and every active budget counts the request.
+
+    Arguments:
+        limit (:class:`int`, optional) : Expected max count of requests sent to server.
+            :attr:`exceeded` is True if more requests are sent. Defaults to None (no limit).
+        all_threads (:class:`bool`, optional) : Count requests of every thread, defaults to False.
+
+    Attributes:
+        plan (:class:`List[PlannedRequest]`) : Every request (including cached one) in sent order.
+    """
+
+    __slots__ = ['limit', 'all_threads', 'plan', '__lock', '__token']
+
+    def __init__(
+            self,
+            limit: int = None,
+            all_threads: bool = False
+    ):
+        self.limit = limit
+        self.all_threads = all_threads
+        self.plan: List[PlannedRequest] = []
+        self.__lock = Lock()
+        self.__token = None
+
+    def __repr__(self):
+        return "<RequestBudget [%d requests, %d cached]>" % (self.requests, self.cached)
+
+    def __enter__(self):
+        _register()
+        if self.all_threads:
+            with _global_lock:
+                _global_budgets.append(self)
+        else:
+            self.__token = _budgets.set(_budgets.get() + (self,))
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        if self.all_threads:
+            with _global_lock:
+                _global_budgets.remove(self)
+        else:
+            _budgets.reset(self.__token)
+            self.__token = None
+
+    def record(self, info: RequestInfo) -> None:
+        """Record finished request."""
+        item = PlannedRequest(info)
+        with self.__lock:
+            self.plan.append(item)
+
+    @property
+    def requests(self) -> int:
+        """Count of requests sent to server (including retried and failed attempts).
+
+        :rtype: :class:`int`
+        """
+        return sum(1 for item in self.plan if not item.cached)
+
+    @property
+    def cached(self) -> int:
+        """Count of responses served from cache.
+
+        :rtype: :class:`int`
+        """
+        return sum(1 for item in self.plan if item.cached)
+
+    @property
+    def errors(self) -> int:
+        """Count of requests failed with exception.
+
+        :rtype: :class:`int`
+        """
+        return sum(1 for item in self.plan if item.error is not None)
+
+    @property
+    def by_endpoint(self) -> Dict[str, int]:
+        """Count of requests sent to server by endpoint.
+
+        :rtype: :class:`Dict[str, int]`
+        """
+        return self.__count(False)
+
+    @property
+    def cached_by_endpoint(self) -> Dict[str, int]:
+        """Count of responses served from cache by endpoint.
+
+        :rtype: :class:`Dict[str, int]`
+        """
+        return self.__count(True)
+
+    @property
+    def exceeded(self) -> bool:
+        """True if more requests than :attr:`limit` are sent.
+
+        :rtype: :class:`bool`
+        """
+        return self.limit is not None and self.requests > self.limit
+
+    def __count(self, cached: bool) -> Dict[str, int]:
+        result = {}
+        for item in list(self.plan):
+            if item.cached == cached:
+                key = item.endpoint or ""
+                result[key] = result.get(key, 0) + 1
+        return result
+
+    def summary(self) -> dict:
+        """Summary of counts and plan. It is json serializable and can be compared in regression tests.
+
+        :rtype: :class:`dict`
+        """
+        return {
+            "requests": self.requests,
+            "cached": self.cached,
+            "errors": self.errors,
+            "by_endpoint": self.by_endpoint,
+            "cached_by_endpoint": self.cached_by_endpoint,
+            "plan": [item.to_dict() for item in self.plan],
+        }
+
+
+_budgets: ContextVar[Tuple[RequestBudget, ...]] = ContextVar("vlivepy_budgets", default=())
+_global_lock = Lock()
+_global_budgets: List[RequestBudget] = []
+_registered = False
+
+
+def _record(info: RequestInfo) -> None:
+    budgets = _budgets.get()
+    if _global_budgets:
+        with _global_lock:
+            budgets = budgets + tuple(_global_budgets)
+    for budget in budgets:
+        budget.record(info)
+
+
+def _register() -> None:
+    global _registered
+
+    with _global_lock:
+        if not _registered:
+            _registered = True
+            addHook("after_response", _record)
+            addHook("on_error", _record)
+
+
+@contextmanager
+def dryRun(
+        directory: str = None,
+        limit: int = None
+):
+    """Run `with` block without network and record request plan.
+    Responses are served from :mod:`vlivepy.cache` and records of :class:`vlivepy.transport.ReplayTransport`.
+    Request missing from both fails with :class:`vlivepy.exception.ReplayMissError`, which is recorded as error.
+
+    .. code-block:: python
+
+        with dryRun("records") as budget:
+            posts = list(getBoardPostsIter("FD53B", 1234))
+
+        assert budget.summary()["by_endpoint"] == {"endpoint_board_posts": 5}
+
+    The transport is changed for current thread(or task) only. :mod:`vlivepy.aio` functions use their own client,
+    so they are counted but not isolated from network.
+
+    Arguments:
+        directory (:class:`str`, optional) : Directory recorded by :class:`vlivepy.transport.RecordingTransport`.
+            Only cache is used if it is None. Defaults to None.
+        limit (:class:`int`, optional) : Expected max count of requests, defaults to None.
+
+    Yields:
+        :class:`RequestBudget`
+    """
+    transport = ReplayTransport(directory) if directory is not None else OfflineTransport()
+    with useTransport(transport):
+        with RequestBudget(limit) as budget:
+            yield budget
+
+
+def currentBudgets() -> Tuple[RequestBudget, ...]:
+    """Get active budgets of current thread(or task).
+
+    Returns:
+        :class:`Tuple[RequestBudget, ...]`
+    """
+    return _budgets.get()
+
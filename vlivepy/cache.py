@@ -0,0 +1,304 @@
+# -*- coding: utf-8 -*-
+
+import json
+import os
+import sqlite3
+from hashlib import sha1
+from threading import Lock
+from time import time
+from typing import (
+    Dict,
+    Optional,
+)
+
+from requests import Response
+from requests.structures import CaseInsensitiveDict
+
+from . import variables as gv
+
+
+def build_response(
+        status_code: int,
+        headers: dict,
+        url: str,
+        content: bytes,
+        encoding: Optional[str] = None
+) -> Response:
+    """Build :class:`requests.Response` from stored data.
+
+    Arguments:
+        status_code (:class:`int`) : Status code of response.
+        headers (:class:`dict`) : Headers of response.
+        url (:class:`str`) : Final url of response.
+        content (:class:`bytes`) : Body of response.
+        encoding (:class:`str`, optional) : Encoding of body, defaults to None.
+
+    Returns:
+        :class:`requests.Response`
+    """
+    res = Response()
+    res.status_code = status_code
+    res.headers = CaseInsensitiveDict(headers)
+    res.url = url
+    res._content = content
+    res.encoding = encoding
+
+    return res
+
+
+def session_identity(session) -> str:
+    """Get identity of :class:`vlivepy.UserSession` for cache key. Empty string for anonymous request."""
+    if session:
+        return session.email
+    else:
+        return ""
+
+
+class ResponseCache(object):
+    """On-disk response cache with TTL by endpoint and LRU eviction.
+
+    Responses are keyed by url, params and session identity, and stored in sqlite database.
+    Each endpoint has its own TTL. Endpoints with TTL 0 (e.g play info with one-time key) are never cached.
+    When total size of bodies exceeds :obj:`max_size`, least recently used responses are evicted.
+
+    Arguments:
+        path (:class:`str`) : Path of database file.
+        max_size (:class:`int`, optional) : Max total bytes of cached bodies,
+            defaults to :obj:`vlivepy.variables.override_cache_max_size`.
+        ttl (:class:`dict`, optional) : TTL(seconds) by endpoint name. ``"*"`` is used for other endpoints,
+            defaults to :obj:`vlivepy.variables.override_cache_ttl`.
+    """
+
+    __slots__ = ['path', 'max_size', 'ttl', '__conn', '__lock', '__size', '__stats']
+
+    def __init__(
+            self,
+            path: str,
+            max_size: int = None,
+            ttl: Dict[str, float] = None
+    ):
+        self.path = path
+        self.max_size = gv.override_cache_max_size if max_size is None else max_size
+        self.ttl = dict(gv.override_cache_ttl if ttl is None else ttl)
+        self.__lock = Lock()
+        self.__stats: Dict[str, Dict[str, int]] = {}
+
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        self.__conn = sqlite3.connect(path, check_same_thread=False)
+        self.__conn.execute(
+            "CREATE TABLE IF NOT EXISTS response ("
+            "key TEXT PRIMARY KEY, endpoint TEXT, status INTEGER, headers TEXT, url TEXT, "
+            "content BLOB, encoding TEXT, size INTEGER, created REAL, accessed REAL)"
+        )
+        self.__conn.commit()
+        self.__size = self.__conn.execute("SELECT COALESCE(SUM(size), 0) FROM response").fetchone()[0]
+
+    def __repr__(self):
+        return "<ResponseCache [%s]>" % self.path
+
+    def ttl_of(
+            self,
+            endpoint: Optional[str]
+    ) -> float:
+        """Get TTL(seconds) of the endpoint. 0 means not cached."""
+        if endpoint in self.ttl:
+            return self.ttl[endpoint]
+        else:
+            return self.ttl.get("*", 0)
+
+    @staticmethod
+    def make_key(
+            method: str,
+            url: str,
+            params: Optional[dict],
+            session=None
+    ) -> str:
+        """Make cache key from request."""
+        raw = json.dumps(
+            [method.upper(), url, sorted((params or {}).items()), session_identity(session)],
+            default=str
+        )
+        return sha1(raw.encode()).hexdigest()
+
+    def __count(self, endpoint, field):
+        stat = self.__stats.setdefault(endpoint or "", {"hits": 0, "misses": 0})
+        stat[field] += 1
+
+    def get(
+            self,
+            method: str,
+            url: str,
+            params: Optional[dict] = None,
+            session=None,
+            endpoint: str = None
+    ) -> Optional[Response]:
+        """Load cached response.
+
+        Returns:
+            :class:`requests.Response`. None if the response is not cached, expired or the endpoint is not cacheable.
+        """
+        ttl = self.ttl_of(endpoint)
+        if ttl <= 0:
+            return None
+
+        key = self.make_key(method, url, params, session)
+        now = time()
+        with self.__lock:
+            row = self.__conn.execute(
+                "SELECT status, headers, url, content, encoding, created FROM response WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None or now - row[5] > ttl:
+                self.__count(endpoint, "misses")
+                return None
+
+            self.__conn.execute("UPDATE response SET accessed = ? WHERE key = ?", (now, key))
+            self.__conn.commit()
+            self.__count(endpoint, "hits")
+
+        return build_response(row[0], json.loads(row[1]), row[2], row[3], row[4])
+
+    def set(
+            self,
+            method: str,
+            url: str,
+            response,
+            params: Optional[dict] = None,
+            session=None,
+            endpoint: str = None
+    ) -> None:
+        """Store response. Only response with status 200 is stored, so error like permission denied isn't replayed.
+        Response of not cacheable endpoint is ignored.
+
+        Arguments:
+            response (:class:`requests.Response`) : Response to store.
+        """
+        if self.ttl_of(endpoint) <= 0 or response.status_code != 200:
+            return
+
+        key = self.make_key(method, url, params, session)
+        content = response.content
+        size = len(content)
+        if size > self.max_size:
+            return
+
+        now = time()
+        with self.__lock:
+            old = self.__conn.execute("SELECT size FROM response WHERE key = ?", (key,)).fetchone()
+            if old is not None:
+                self.__size -= old[0]
+            self.__conn.execute(
+                "INSERT OR REPLACE INTO response VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (key, endpoint, response.status_code, json.dumps(dict(response.headers)), str(response.url),
+                 content, response.encoding, size, now, now)
+            )
+            self.__size += size
+            self.__evict()
+            self.__conn.commit()
+
+    def __evict(self):
+        if self.__size <= self.max_size:
+            return
+
+        expired = []
+        for key, size in self.__conn.execute("SELECT key, size FROM response ORDER BY accessed"):
+            expired.append((key,))
+            self.__size -= size
+            if self.__size <= self.max_size:
+                break
+        self.__conn.executemany("DELETE FROM response WHERE key = ?", expired)
+
+    @property
+    def size(self) -> int:
+        """Total bytes of cached bodies.
+
+        :rtype: :class:`int`
+        """
+        return self.__size
+
+    def stats(self) -> dict:
+        """Get hit/miss count and hit rate of total and each endpoint.
+
+        :rtype: :class:`dict`
+        """
+        with self.__lock:
+            by_endpoint = {key: dict(value) for key, value in self.__stats.items()}
+
+        hits = sum(item['hits'] for item in by_endpoint.values())
+        misses = sum(item['misses'] for item in by_endpoint.values())
+        for item in by_endpoint.values():
+            item['hit_rate'] = item['hits'] / (item['hits'] + item['misses'])
+
+        return {
+            "hits": hits,
+            "misses": misses,
+            "hit_rate": hits / (hits + misses) if hits + misses else 0.0,
+            "size": self.__size,
+            "endpoints": by_endpoint,
+        }
+
+    def clear(self) -> None:
+        """Delete every cached response and reset stats."""
+        with self.__lock:
+            self.__conn.execute("DELETE FROM response")
+            self.__conn.commit()
+            self.__size = 0
+            self.__stats.clear()
+
+    def close(self) -> None:
+        """Close database."""
+        with self.__lock:
+            self.__conn.close()
+
+
+_cache: Optional[ResponseCache] = None
+
+
+def getCache() -> Optional[ResponseCache]:
+    """Get enabled response cache.
+
+    Returns:
+        :class:`ResponseCache`. None if cache is disabled.
+    """
+    return _cache
+
+
+def enableCache(
+        path: str = None,
+        max_size: int = None,
+        ttl: Dict[str, float] = None
+) -> ResponseCache:
+    """Enable response cache for every request.
+
+    Arguments:
+        path (:class:`str`, optional) : Path of database file,
+            defaults to :obj:`vlivepy.variables.override_cache_path`.
+        max_size (:class:`int`, optional) : Max total bytes of cached bodies,
+            defaults to :obj:`vlivepy.variables.override_cache_max_size`.
+        ttl (:class:`dict`, optional) : TTL(seconds) by endpoint name,
+            defaults to :obj:`vlivepy.variables.override_cache_ttl`.
+
+    Returns:
+        :class:`ResponseCache`
+    """
+    global _cache
+
+    if path is None:
+        path = os.path.expanduser(gv.override_cache_path)
+
+    old_cache = _cache
+    _cache = ResponseCache(path, max_size=max_size, ttl=ttl)
+    if old_cache is not None:
+        old_cache.close()
+
+    return _cache
+
+
+def disableCache() -> None:
+    """Disable response cache. Cached data is kept on disk."""
+    global _cache
+
+    old_cache = _cache
+    _cache = None
+    if old_cache is not None:
+        old_cache.close()
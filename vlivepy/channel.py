@@ -1,6 +1,5 @@
 # -*- coding: utf-8 -*-
 
-import json
 from typing import (
     Optional
 )
@@ -13,10 +12,34 @@ from .exception import (
     APINetworkError,
     APIJSONParesError
 )
+from .parser import json_loads, response_json_loader
 from .router import rew_get
 from .session import UserSession
+from .tracing import traced
 
 
+def channel_info_parser(
+        html: str
+) -> Optional[dict]:
+    """Parse channel data from ``__PRELOADED_STATE__`` script of channel webpage.
+
+    Arguments:
+        html (:class:`str`) : Html text of channel webpage.
+
+    Returns:
+        :class:`dict`. Parsed channel data. This returns None if the page doesn't have channel data
+    """
+
+    soup = BeautifulSoup(html, "html.parser")
+    for item in soup.find_all("script"):
+        if "__PRELOADED_STATE__" in str(item):
+            script: str = item.contents[0].split("function")[0]
+            return json_loads(script[script.find("{"): -1])['channel']['channel']
+
+    return None
+
+
+@traced
 def getChannelInfo(
         channel_code: str,
         session: UserSession = None,
@@ -34,15 +57,13 @@ def getChannelInfo(
     """
 
     # Make request
-    sr = rew_get(**gv.endpoint_channel_webpage(channel_code),
-                 wait=0.5, session=session, status=[200])
+    sr = rew_get(**gv.endpoint_channel_webpage(channel_code), endpoint="endpoint_channel_webpage",
+                 session=session, status=[200])
 
     if sr.success:
-        soup = BeautifulSoup(sr.response.text, "html.parser")
-        for item in soup.find_all("script"):
-            if "__PRELOADED_STATE__" in str(item):
-                script: str = item.contents[0].split("function")[0]
-                return json.loads(script[script.find("{"): -1])['channel']['channel']
+        channel_info = channel_info_parser(sr.response.text)
+        if channel_info is not None:
+            return channel_info
         else:
             auto_raise(APIJSONParesError("Cannot find channel data from page"), silent)
     else:
@@ -51,6 +72,7 @@ def getChannelInfo(
     return None
 
 
+@traced
 def getGroupedBoards(
         channel_code: str,
         session: UserSession = None,
@@ -68,11 +90,11 @@ def getGroupedBoards(
     """
 
     # Make request
-    sr = rew_get(**gv.endpoint_channel_grouped_boards(channel_code),
-                 wait=0.5, session=session, status=[200])
+    sr = rew_get(**gv.endpoint_channel_grouped_boards(channel_code), endpoint="endpoint_channel_grouped_boards",
+                 session=session, status=[200])
 
     if sr.success:
-        return sr.response.json()
+        return response_json_loader(sr.response)
     else:
         auto_raise(APINetworkError, silent)
 
@@ -1,14 +1,20 @@
 # -*- coding: utf-8 -*-
 
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from contextvars import copy_context
 from typing import (
     Generator,
     Optional,
+    Union,
 )
 from . import variables as gv
 from .exception import APINetworkError, auto_raise
-from .parser import response_json_stripper, next_page_checker
-from .router import rew_get
+from .paginator import Paginator
+from .parser import response_json_loader, response_json_stripper
+from .router import network_error, rew_get
 from .session import UserSession
+from .tracing import traced
 
 
 def comment_parser(
@@ -33,12 +39,14 @@ def comment_parser(
     return n_list
 
 
+@traced
 def getPostComments(
         post_id: str,
         session: UserSession = None,
         after: str = None,
         silent: bool = False,
         raise_message: bool = False,
+        page_size: int = None,
 ) -> Optional[dict]:
     """Get comments of the post.
 
@@ -48,60 +56,69 @@ def getPostComments(
         after (:class:`str`, optional) : After parameter to load another page, defaults to None.
         silent (:class:`bool`, optional) : Return None instead of raising exception, defaults to False.
         raise_message (:class:`bool`, optional) : Raise exception instead of warning, defaults to False.
+        page_size (:class:`int`, optional) : Items per page, defaults to server default.
 
     Returns:
         :class:`dict`. Parsed json data.
     """
 
     # Make request
-    sr = rew_get(**gv.endpoint_post_comments(post_id, after),
-                 wait=0.5, session=session, status=[200, 403])
+    sr = rew_get(**gv.endpoint_post_comments(post_id, after, page_size), endpoint="endpoint_post_comments",
+                 session=session, status=[200, 403])
 
     if sr.success:
-        stripped_data = response_json_stripper(sr.response.json(), silent=silent)
+        stripped_data = response_json_stripper(response_json_loader(sr.response), silent=silent)
         if 'data' in stripped_data:
             stripped_data['data'] = comment_parser(stripped_data['data'], session=session)
         return stripped_data
     else:
-        auto_raise(APINetworkError, silent)
+        auto_raise(network_error(sr), silent)
 
     return None
 
 
 def getPostCommentsIter(
         post_id: str,
-        session: UserSession = None
-):
-    """Get comments of post as iterable (generator).
+        session: UserSession = None,
+        after: str = None,
+        prefetch: int = None,
+        page_size: Union[int, str] = None
+) -> Paginator:
+    """Get comments of post as resumable iterable (:class:`vlivepy.paginator.Paginator`).
 
     Arguments:
         post_id (:class:`str`) : Unique id of the post to load comment.
         session (:class:`vlivepy.UserSession`, optional) : Session for loading data with permission, defaults to None.
+        after (:class:`str`, optional) : Cursor of page to start, defaults to None (first page).
+        prefetch (:class:`int`, optional) : Max pages loaded ahead in background,
+            defaults to :obj:`vlivepy.variables.override_prefetch_pages`.
+        page_size (:class:`Union[int, str]`, optional) : Items per page or :code:`"adaptive"`,
+            defaults to :obj:`vlivepy.variables.override_page_size`.
 
-    :rtype: Generator[vlivepy.Comment, None, None]
+    :rtype: :class:`vlivepy.paginator.Paginator`
 
     Yields:
         :class:`vlivepy.Comment`
     """
 
-    data = getPostComments(post_id, session=session, raise_message=True)
-    after = next_page_checker(data)
-    for item in data['data']:
-        yield item
-
-    while after:
-        data = getPostComments(post_id, session=session, after=after, raise_message=True)
-        after = next_page_checker(data)
-        for item in data['data']:
-            yield item
+    return Paginator(
+        "getPostCommentsIter",
+        lambda cursor, size: getPostComments(post_id, session=session, after=cursor, page_size=size,
+                                             raise_message=True),
+        after,
+        prefetch,
+        page_size
+    )
 
 
+@traced
 def getPostStarComments(
         post_id: str,
         session: UserSession = None,
         after: str = None,
         silent: bool = False,
         raise_message: bool = False,
+        page_size: int = None,
 ) -> Optional[dict]:
     """Get star comments of the post.
 
@@ -111,55 +128,63 @@ def getPostStarComments(
         after (:class:`str`, optional) : After parameter to load another page, defaults to None.
         silent (:class:`bool`, optional) : Return None instead of raising exception, defaults to False.
         raise_message (:class:`bool`, optional) : Raise exception instead of warning, defaults to False.
+        page_size (:class:`int`, optional) : Items per page, defaults to server default.
 
     Returns:
         :class:`dict`. Parsed json data.
     """
 
     # Make request
-    sr = rew_get(**gv.endpoint_post_star_comments(post_id, after),
-                 wait=0.5, session=session, status=[200, 403])
+    sr = rew_get(**gv.endpoint_post_star_comments(post_id, after, page_size),
+                 endpoint="endpoint_post_star_comments", session=session, status=[200, 403])
 
     if sr.success:
-        stripped_data = response_json_stripper(sr.response.json(), silent=silent)
+        stripped_data = response_json_stripper(response_json_loader(sr.response), silent=silent)
         if 'data' in stripped_data:
             stripped_data['data'] = comment_parser(stripped_data['data'], session=session)
         return stripped_data
     else:
-        auto_raise(APINetworkError, silent)
+        auto_raise(network_error(sr), silent)
 
     return None
 
 
 def getPostStarCommentsIter(
         post_id: str,
-        session: UserSession = None
-):
-    """Get star comments of post as iterable (generator).
+        session: UserSession = None,
+        after: str = None,
+        prefetch: int = None,
+        page_size: Union[int, str] = None
+) -> Paginator:
+    """Get star comments of post as resumable iterable (:class:`vlivepy.paginator.Paginator`).
 
     Arguments:
         post_id (:class:`str`) : Unique id of the post to load star comment.
         session (:class:`vlivepy.UserSession`, optional) : Session for loading data with permission, defaults to None.
         raise_message (:class:`bool`, optional) : Raise exception instead of warning, defaults to False.
+        after (:class:`str`, optional) : Cursor of page to start, defaults to None (first page).
+        prefetch (:class:`int`, optional) : Max pages loaded ahead in background,
+            defaults to :obj:`vlivepy.variables.override_prefetch_pages`.
+        page_size (:class:`Union[int, str]`, optional) : Items per page or :code:`"adaptive"`,
+            defaults to :obj:`vlivepy.variables.override_page_size`.
 
-    :rtype: Generator[vlivepy.Comment, None, None]
+    :rtype: :class:`vlivepy.paginator.Paginator`
 
     Yields:
         :class:`vlivepy.Comment`
     """
 
-    data = getPostStarComments(post_id, session=session, raise_message=True)
-    after = next_page_checker(data)
-    for item in data['data']:
-        yield item
-
-    while after:
-        data = getPostStarComments(post_id, session=session, after=after, raise_message=True)
-        after = next_page_checker(data)
-        for item in data['data']:
-            yield item
+    return Paginator(
+        "getPostStarCommentsIter",
+        lambda cursor, size: getPostStarComments(post_id, session=session, after=cursor, page_size=size,
+                                                 raise_message=True),
+        after,
+        prefetch,
+        page_size
+    )
 
 
+@traced
 def getCommentData(
         comment_id: str,
         session: UserSession = None,
@@ -177,23 +202,25 @@ def getCommentData(
     """
 
     # Make request
-    sr = rew_get(**gv.endpoint_comment_data(comment_id),
-                 wait=0.5, session=session, status=[200, 403])
+    sr = rew_get(**gv.endpoint_comment_data(comment_id), endpoint="endpoint_comment_data",
+                 session=session, status=[200, 403])
 
     if sr.success:
-        return response_json_stripper(sr.response.json(), silent=silent)
+        return response_json_stripper(response_json_loader(sr.response), silent=silent)
     else:
         auto_raise(APINetworkError, silent)
 
     return None
 
 
+@traced
 def getNestedComments(
         comment_id: str,
         session: UserSession = None,
         after: str = None,
         silent: bool = False,
         raise_message: bool = False,
+        page_size: int = None,
 ) -> Optional[dict]:
     """Get nested comments of the comment.
 
@@ -203,49 +230,174 @@ def getNestedComments(
         after (:class:`str`, optional) : After parameter to load another page, defaults to None.
         silent (:class:`bool`, optional) : Return None instead of raising exception, defaults to False.
         raise_message (:class:`bool`, optional) : Raise exception instead of warning, defaults to False.
+        page_size (:class:`int`, optional) : Items per page, defaults to server default.
 
     Returns:
         :class:`dict`. Parsed json data.
     """
 
     # Make request
-    sr = rew_get(**gv.endpoint_comment_nested(comment_id, after),
-                 wait=0.5, session=session, status=[200, 403])
+    sr = rew_get(**gv.endpoint_comment_nested(comment_id, after, page_size), endpoint="endpoint_comment_nested",
+                 session=session, status=[200, 403])
 
     if sr.success:
-        stripped_data = response_json_stripper(sr.response.json(), silent=silent)
+        stripped_data = response_json_stripper(response_json_loader(sr.response), silent=silent)
         if 'data' in stripped_data:
             stripped_data['data'] = comment_parser(stripped_data['data'], session=session)
         return stripped_data
     else:
-        auto_raise(APINetworkError, silent)
+        auto_raise(network_error(sr), silent)
 
     return None
 
 
 def getNestedCommentsIter(
         comment_id: str,
-        session: UserSession = None
-):
-    """Get nested comments of the comment as iterable (generator).
+        session: UserSession = None,
+        after: str = None,
+        prefetch: int = None,
+        page_size: Union[int, str] = None
+) -> Paginator:
+    """Get nested comments of the comment as resumable iterable (:class:`vlivepy.paginator.Paginator`).
 
     Arguments:
         comment_id (:class:`str`) : Unique id of the comment to load nested comment.
         session (:class:`vlivepy.UserSession`, optional) : Session for loading data with permission, defaults to None.
+        after (:class:`str`, optional) : Cursor of page to start, defaults to None (first page).
+        prefetch (:class:`int`, optional) : Max pages loaded ahead in background,
+            defaults to :obj:`vlivepy.variables.override_prefetch_pages`.
+        page_size (:class:`Union[int, str]`, optional) : Items per page or :code:`"adaptive"`,
+            defaults to :obj:`vlivepy.variables.override_page_size`.
 
-    :rtype: Generator[vlivepy.Comment, None, None]
+    :rtype: :class:`vlivepy.paginator.Paginator`
 
     Yields:
         :class:`vlivepy.Comment`
     """
 
-    data = getNestedComments(comment_id, session=session, raise_message=True)
-    after = next_page_checker(data)
-    for item in data['data']:
-        yield item
+    return Paginator(
+        "getNestedCommentsIter",
+        lambda cursor, size: getNestedComments(comment_id, session=session, after=cursor, page_size=size,
+                                               raise_message=True),
+        after,
+        prefetch,
+        page_size
+    )
+
+
+class CommentThread(object):
+    """This is the object represents a top-level comment with its nested comments.
+    Iterating it yields the comment and then its nested comments.
+
+    Arguments:
+        comment (:class:`vlivepy.Comment`) : Top-level comment.
+        replies (:class:`list`) : Nested comments of the comment.
+
+    Attributes:
+        comment (:class:`vlivepy.Comment`) : Top-level comment.
+        replies (:class:`list`) : Nested comments of the comment.
+    """
+
+    __slots__ = ['comment', 'replies']
+
+    def __init__(
+            self,
+            comment,
+            replies: list
+    ):
+        self.comment = comment
+        self.replies = replies
+
+    def __repr__(self):
+        return "<CommentThread [%s] (%d replies)>" % (self.comment.commentId, len(self.replies))
+
+    def __iter__(self):
+        yield self.comment
+        yield from self.replies
+
+
+def _nested_list(comment_id, session):
+    return list(getNestedCommentsIter(comment_id, session=session))
+
+
+def _crawl_threads(parents, session, workers, ordered):
+    # Each entry is (comment, future). Future is None for comment without nested comment.
+    pending = deque()
+    executor = ThreadPoolExecutor(workers, thread_name_prefix="vlivepy-comments")
+
+    def finished(block):
+        if ordered:
+            while pending and (block or pending[0][1] is None or pending[0][1].done()):
+                comment, future = pending.popleft()
+                yield CommentThread(comment, future.result() if future else [])
+                block = False
+        else:
+            if block:
+                wait([future for _, future in pending], return_when=FIRST_COMPLETED)
+            for entry in [entry for entry in pending if entry[1].done()]:
+                pending.remove(entry)
+                yield CommentThread(entry[0], entry[1].result())
+
+    try:
+        for comment in parents:
+            if comment.comment_count:
+                # Every task needs its own copy of context
+                future = executor.submit(copy_context().run, _nested_list, comment.commentId, session)
+            elif ordered:
+                future = None
+            else:
+                yield CommentThread(comment, [])
+                continue
+
+            pending.append((comment, future))
+            # Parents are read ahead up to the limit while nested comments are loaded
+            yield from finished(len(pending) >= workers * 4)
+
+        while pending:
+            yield from finished(True)
+    finally:
+        parents.close()
+        for _, future in pending:
+            if future is not None:
+                future.cancel()
+        executor.shutdown(wait=False)
+
+
+def getPostCommentTree(
+        post_id: str,
+        session: UserSession = None,
+        workers: int = None,
+        order: str = "post",
+        flat: bool = False,
+        star: bool = False
+) -> Generator:
+    """Get comments of post with their nested comments.
+    Nested comments of comments with :attr:`vlivepy.Comment.comment_count` are loaded concurrently by thread pool.
+
+    Arguments:
+        post_id (:class:`str`) : Unique id of the post to load comment.
+        session (:class:`vlivepy.UserSession`, optional) : Session for loading data with permission, defaults to None.
+        workers (:class:`int`, optional) : Max comments loading nested comments at once,
+            defaults to :obj:`vlivepy.variables.override_comment_workers`.
+        order (:class:`str`, optional) : :code:`"post"` keeps order of comments in the post.
+            :code:`"completed"` yields each comment as soon as its nested comments are loaded.
+            Defaults to :code:`"post"`.
+        flat (:class:`bool`, optional) : Yield each comment followed by its nested comments
+            instead of :class:`CommentThread`, defaults to False.
+        star (:class:`bool`, optional) : Load star comments instead of comments, defaults to False.
+
+    Yields:
+        :class:`CommentThread`, or :class:`vlivepy.Comment` with `flat`
+    """
 
-    while after:
-        data = getNestedComments(comment_id, session=session, after=after, raise_message=True)
-        after = next_page_checker(data)
-        for item in data['data']:
-            yield item
+    if order not in ("post", "completed"):
+        raise ValueError("order must be 'post' or 'completed', not %r" % order)
+    if workers is None:
+        workers = gv.override_comment_workers
+
+    parents = (getPostStarCommentsIter if star else getPostCommentsIter)(post_id, session=session)
+    for thread in _crawl_threads(parents, session, workers, order == "post"):
+        if flat:
+            yield from thread
+        else:
+            yield thread
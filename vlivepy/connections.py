@@ -11,16 +11,20 @@ from .exception import (
     APIJSONParesError,
 )
 from .parser import (
+    response_json_loader,
     response_json_stripper,
 )
 from .router import rew_get
 from .session import UserSession
+from .tracing import traced
 
 
+@traced
 def getPostInfo(
         post_id: str,
         session: UserSession = None,
-        silent: bool = False
+        silent: bool = False,
+        fields: str = "full"
 ) -> Optional[dict]:
     """Get detailed post data.
 
@@ -28,22 +32,25 @@ def getPostInfo(
         post_id (:class:`str`) : Unique id of the post to load data.
         session (:class:`vlivepy.UserSession`, optional) : Session for loading data with permission, defaults to None.
         silent (:class:`bool`, optional) : Return None instead of raising exception, defaults to False.
+        fields (:class:`str`, optional) : Field profile ("minimal", "listing" or "full") or comma separated fields,
+            defaults to "full".
 
     Returns:
         :class:`dict`. Parsed json data
     """
 
-    sr = rew_get(**gv.endpoint_post(post_id),
-                 wait=0.5, session=session, status=[200, 403])
+    sr = rew_get(**gv.endpoint_post(post_id, fields), endpoint="endpoint_post",
+                 session=session, status=[200, 403])
 
     if sr.success:
-        return response_json_stripper(sr.response.json(), silent=silent)
+        return response_json_stripper(response_json_loader(sr.response), silent=silent)
     else:
         auto_raise(APINetworkError, silent)
 
     return None
 
 
+@traced
 def postIdToVideoSeq(
         post_id: str,
         silent=False
@@ -58,7 +65,7 @@ def postIdToVideoSeq(
         :class:`str`. Paired videoSeq id of the post.
     """
 
-    post = getPostInfo(post_id, silent=True)
+    post = getPostInfo(post_id, silent=True, fields="minimal")
 
     if post:
         if 'officialVideo' in post:
@@ -69,6 +76,7 @@ def postIdToVideoSeq(
     return None
 
 
+@traced
 def videoSeqToPostId(
         video_seq: Union[str, int],
         silent=False
@@ -85,7 +93,7 @@ def videoSeqToPostId(
 
     from .video import getOfficialVideoPost
 
-    post = getOfficialVideoPost(video_seq, silent=True)
+    post = getOfficialVideoPost(video_seq, silent=True, fields="minimal")
 
     if post:
         return post['postId']
@@ -93,6 +101,7 @@ def videoSeqToPostId(
         return None
 
 
+@traced
 def postTypeDetector(post_id, silent=False):
     """Check type of the post
 
@@ -104,13 +113,14 @@ def postTypeDetector(post_id, silent=False):
         :class:`str`. “POST” if the post is normal Post. “VIDEO” if the post is OfficialVideoPost
     """
 
-    data = getPostInfo(post_id, silent=True)
+    data = getPostInfo(post_id, silent=True, fields="minimal")
     if data is not None:
         return data['contentType']
 
     return None
 
 
+@traced
 def decode_channel_code(
         channel_code: str,
         silent: bool = False
@@ -125,12 +135,12 @@ def decode_channel_code(
         :class:`int`. Decoded channel code as channel seq.
     """
 
-    sr = rew_get(**gv.endpoint_decode_channel_code(channel_code),
-                 wait=0.5, status=[200])
+    sr = rew_get(**gv.endpoint_decode_channel_code(channel_code), endpoint="endpoint_decode_channel_code",
+                 status=[200])
 
     if sr.success:
         if len(sr.response.text) > 0:
-            return sr.response.json()['result']['channelSeq']
+            return response_json_loader(sr.response)['result']['channelSeq']
         else:
             auto_raise(ValueError("inappropriate ChannelCode"), silent)
     else:
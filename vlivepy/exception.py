@@ -15,6 +15,10 @@ class APINetworkError(APIError):
     """ Failed to load API request """
 
 
+class APIBadRequestError(APINetworkError):
+    """ Server rejected request parameters with status 400 """
+
+
 class APIJSONParesError(APIError):
     """ Failed to parse target """
 
@@ -27,6 +31,10 @@ class APIServerResponseError(APIError):
     """ Warning if server response only error"""
 
 
+class ReplayMissError(APIError):
+    """ Request is not recorded in replay transport """
+
+
 class ModelError(Exception):
     """ Common Model Error """
 
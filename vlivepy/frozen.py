@@ -0,0 +1,107 @@
+# -*- coding: utf-8 -*-
+
+from typing import Any
+
+
+def _readonly(self, *args, **kwargs):
+    raise TypeError("%s is read-only. Use vlivepy.frozen.thaw() for mutable copy" % type(self).__name__)
+
+
+class FrozenDict(dict):
+    """Read-only :class:`dict` made by :func:`freeze`.
+
+    Every method changing items raises :class:`TypeError`. Values are frozen too, so it is safe to share
+    without copying. It is still :class:`dict`, so it can be dumped with :mod:`json` or pickled as is.
+    """
+
+    __slots__ = []
+
+    __setitem__ = _readonly
+    __delitem__ = _readonly
+    __ior__ = _readonly
+    clear = _readonly
+    pop = _readonly
+    popitem = _readonly
+    setdefault = _readonly
+    update = _readonly
+
+    def __repr__(self):
+        return "FrozenDict(%s)" % dict.__repr__(self)
+
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
+
+    def __reduce__(self):
+        return FrozenDict, (dict(self),)
+
+
+class FrozenList(list):
+    """Read-only :class:`list` made by :func:`freeze`.
+
+    Every method changing items raises :class:`TypeError`, same as :class:`FrozenDict`.
+    """
+
+    __slots__ = []
+
+    __setitem__ = _readonly
+    __delitem__ = _readonly
+    __iadd__ = _readonly
+    __imul__ = _readonly
+    append = _readonly
+    clear = _readonly
+    extend = _readonly
+    insert = _readonly
+    pop = _readonly
+    remove = _readonly
+    reverse = _readonly
+    sort = _readonly
+
+    def __repr__(self):
+        return "FrozenList(%s)" % list.__repr__(self)
+
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
+
+    def __reduce__(self):
+        return FrozenList, (list(self),)
+
+
+def freeze(data: Any) -> Any:
+    """Make read-only snapshot of parsed json data.
+    :class:`dict` becomes :class:`FrozenDict` and :class:`list` becomes :class:`FrozenList` recursively.
+    Frozen data is returned as is.
+
+    Arguments:
+        data (:class:`Any`) : Parsed json data.
+
+    Returns:
+        :class:`Any`. Frozen snapshot of `data`.
+    """
+    data_type = type(data)
+    if data_type is dict:
+        return FrozenDict({key: freeze(value) for key, value in data.items()})
+    elif data_type is list or data_type is tuple:
+        return FrozenList([freeze(value) for value in data])
+    return data
+
+
+def thaw(data: Any) -> Any:
+    """Make mutable deep copy of frozen data.
+
+    Arguments:
+        data (:class:`Any`) : Data made by :func:`freeze`.
+
+    Returns:
+        :class:`Any`. Copy made of :class:`dict` and :class:`list`.
+    """
+    if isinstance(data, dict):
+        return {key: thaw(value) for key, value in data.items()}
+    elif isinstance(data, (list, tuple)):
+        return [thaw(value) for value in data]
+    return data
@@ -0,0 +1,191 @@
+# -*- coding: utf-8 -*-
+
+from threading import Lock
+from typing import (
+    Callable,
+    Dict,
+    Optional,
+    Tuple,
+)
+from warnings import warn
+
+# Hook events
+HookEvents = ("before_request", "after_response", "on_error")
+
+
+class RequestInfo(object):
+    """This is the object passed to hooks. It describes one attempt of a request.
+
+    Attributes:
+        method (:class:`str`) : HTTP method.
+        url (:class:`str`) : Request url.
+        params (:class:`dict`) : Query parameters.
+        endpoint (:class:`str`) : Name of endpoint helper which built the request (e.g. endpoint_post_comments).
+        attempt (:class:`int`) : Attempt number starting from 1. Larger number means retry.
+        cached (:class:`bool`) : True if response is served from :mod:`vlivepy.cache`.
+        status_code (:class:`int`) : Status code of response. None before response or on error.
+        bytes (:class:`int`) : Size of response body. None before response or on error.
+        error (:class:`Exception`) : Exception raised while sending request. Only set for ``on_error``.
+        wait (:class:`float`) : Seconds waited for rate limiter before sending.
+        ttfb (:class:`float`) : Seconds from sending request until response header is parsed.
+            None if transport doesn't provide it.
+        download (:class:`float`) : Seconds from response header until body is loaded.
+            None if transport doesn't provide it.
+        total (:class:`float`) : Seconds from sending request until response (or error).
+    """
+
+    __slots__ = ['method', 'url', 'params', 'endpoint', 'attempt', 'cached', 'status_code', 'bytes', 'error',
+                 'wait', 'ttfb', 'download', 'total']
+
+    def __init__(
+            self,
+            method: str,
+            url: str,
+            params: Optional[dict] = None,
+            endpoint: str = None,
+            attempt: int = 1
+    ):
+        self.method = method.upper()
+        self.url = url
+        self.params = params
+        self.endpoint = endpoint
+        self.attempt = attempt
+        self.cached = False
+        self.status_code = None
+        self.bytes = None
+        self.error = None
+        self.wait = 0.0
+        self.ttfb = None
+        self.download = None
+        self.total = None
+
+    def __repr__(self):
+        return "<RequestInfo [%s %s #%s]>" % (self.method, self.endpoint or self.url, self.attempt)
+
+    def set_response(
+            self,
+            response,
+            total: float
+    ) -> None:
+        """Fill response fields and timings from response.
+
+        Arguments:
+            response (:class:`requests.Response`) : Received response. :class:`httpx.Response` is also supported.
+            total (:class:`float`) : Seconds from sending request until response.
+        """
+        self.status_code = response.status_code
+        self.bytes = len(response.content)
+        self.total = total
+
+        try:
+            ttfb = response.elapsed.total_seconds()
+        except (AttributeError, RuntimeError):
+            # httpx raises RuntimeError before its stream is closed
+            ttfb = 0
+        if 0 < ttfb <= total:
+            self.ttfb = ttfb
+            self.download = total - ttfb
+
+
+_hook_lock = Lock()
+_hooks: Dict[str, Tuple[Callable[[RequestInfo], None], ...]] = {event: () for event in HookEvents}
+
+
+def addHook(
+        event: str,
+        func: Callable[[RequestInfo], None] = None
+):
+    """Register hook function for request event. It can be used as decorator.
+
+    Events:
+        ``before_request`` : Called before each attempt is sent.
+        ``after_response`` : Called when response is received (any status) or served from cache.
+        ``on_error`` : Called when sending request raised exception.
+
+    .. code-block:: python
+
+        @addHook("after_response")
+        def log_latency(info):
+            print(info.endpoint, info.status_code, info.total, info.bytes)
+
+    Arguments:
+        event (:class:`str`) : Event name.
+        func (:class:`Callable[[RequestInfo], None]`, optional) : Hook function receiving :class:`RequestInfo`.
+            Decorator is returned if it is None. Defaults to None.
+
+    Returns:
+        The hook function.
+    """
+    if event not in _hooks:
+        raise ValueError("Unknown hook event: %s" % event)
+
+    if func is None:
+        return lambda decorated: addHook(event, decorated)
+
+    with _hook_lock:
+        _hooks[event] = _hooks[event] + (func,)
+
+    return func
+
+
+def removeHook(
+        event: str,
+        func: Callable[[RequestInfo], None]
+) -> None:
+    """Unregister hook function. Unregistered function is ignored.
+
+    Arguments:
+        event (:class:`str`) : Event name.
+        func (:class:`Callable[[RequestInfo], None]`) : Hook function to remove.
+    """
+    with _hook_lock:
+        _hooks[event] = tuple(item for item in _hooks[event] if item is not func)
+
+
+def clearHooks(
+        event: str = None
+) -> None:
+    """Unregister every hook function of the event.
+
+    Arguments:
+        event (:class:`str`, optional) : Event name. Every event is cleared if it is None. Defaults to None.
+    """
+    with _hook_lock:
+        for key in _hooks:
+            if event is None or key == event:
+                _hooks[key] = ()
+
+
+def hasHooks(
+        event: str
+) -> bool:
+    """Check any hook function is registered for the event."""
+    return bool(_hooks[event])
+
+
+def dispatch(
+        event: str,
+        info: RequestInfo
+) -> None:
+    """Call hook functions of the event. Exception of hook function is warned instead of raised."""
+    for func in _hooks[event]:
+        try:
+            func(info)
+        except Exception as e:
+            warn("Hook %r for %s raised %r" % (func, event, e), RuntimeWarning)
+
+
+def dispatch_cached(
+        url: str,
+        params: Optional[dict],
+        endpoint: Optional[str],
+        response
+) -> None:
+    """Call ``after_response`` hook functions for response served from cache."""
+    if not _hooks["after_response"]:
+        return
+
+    info = RequestInfo("get", url, params, endpoint)
+    info.cached = True
+    info.set_response(response, 0.0)
+    dispatch("after_response", info)
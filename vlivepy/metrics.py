@@ -0,0 +1,358 @@
+# -*- coding: utf-8 -*-
+
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from threading import Lock, Thread
+from typing import (
+    Dict,
+    Iterable,
+    List,
+    Tuple,
+)
+
+from .cache import getCache
+from .hooks import RequestInfo, addHook, removeHook
+
+# Default buckets(seconds) of latency histogram
+DefaultBuckets = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+def _escape(value) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(labelnames: Tuple[str, ...], values: Tuple, extra: str = None) -> str:
+    items = ['%s="%s"' % (name, _escape(value)) for name, value in zip(labelnames, values)]
+    if extra:
+        items.append(extra)
+    return "{%s}" % ",".join(items) if items else ""
+
+
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class Counter(object):
+    """Monotonic counter with labels.
+
+    Arguments:
+        name (:class:`str`) : Metric name.
+        documentation (:class:`str`) : Help text.
+        labelnames (:class:`Iterable[str]`, optional) : Label names, defaults to no label.
+    """
+
+    __slots__ = ['name', 'documentation', 'labelnames', '__values', '__lock']
+
+    type = "counter"
+
+    def __init__(
+            self,
+            name: str,
+            documentation: str,
+            labelnames: Iterable[str] = ()
+    ):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self.__values: Dict[Tuple, float] = {}
+        self.__lock = Lock()
+
+    def __repr__(self):
+        return "<Counter [%s]>" % self.name
+
+    def inc(
+            self,
+            *labels,
+            amount: float = 1
+    ) -> None:
+        """Increase counter of the label values."""
+        with self.__lock:
+            self.__values[labels] = self.__values.get(labels, 0) + amount
+
+    def get(self, *labels) -> float:
+        """Get value of the label values."""
+        return self.__values.get(labels, 0)
+
+    def samples(self) -> List[str]:
+        with self.__lock:
+            values = list(self.__values.items())
+        return [
+            "%s%s %s" % (self.name, _format_labels(self.labelnames, labels), _format_value(value))
+            for labels, value in sorted(values)
+        ]
+
+    def clear(self) -> None:
+        with self.__lock:
+            self.__values.clear()
+
+
+class Histogram(object):
+    """Histogram with labels. Observed values are counted into cumulative buckets.
+
+    Arguments:
+        name (:class:`str`) : Metric name.
+        documentation (:class:`str`) : Help text.
+        labelnames (:class:`Iterable[str]`, optional) : Label names, defaults to no label.
+        buckets (:class:`Iterable[float]`, optional) : Upper bounds of buckets, defaults to :obj:`DefaultBuckets`.
+    """
+
+    __slots__ = ['name', 'documentation', 'labelnames', 'buckets', '__values', '__lock']
+
+    type = "histogram"
+
+    def __init__(
+            self,
+            name: str,
+            documentation: str,
+            labelnames: Iterable[str] = (),
+            buckets: Iterable[float] = DefaultBuckets
+    ):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self.buckets = tuple(sorted(buckets)) + (float("inf"),)
+        self.__values: Dict[Tuple, list] = {}
+        self.__lock = Lock()
+
+    def __repr__(self):
+        return "<Histogram [%s]>" % self.name
+
+    def observe(
+            self,
+            value: float,
+            *labels
+    ) -> None:
+        """Observe value of the label values."""
+        with self.__lock:
+            data = self.__values.get(labels)
+            if data is None:
+                # bucket counts, sum, count
+                data = [[0] * len(self.buckets), 0.0, 0]
+                self.__values[labels] = data
+            for i, bound in enumerate(self.buckets):
+                if value <= bound:
+                    data[0][i] += 1
+                    break
+            data[1] += value
+            data[2] += 1
+
+    def samples(self) -> List[str]:
+        with self.__lock:
+            values = [(labels, (list(data[0]), data[1], data[2])) for labels, data in self.__values.items()]
+
+        lines = []
+        for labels, (counts, total, count) in sorted(values):
+            cumulative = 0
+            for bound, bucket_count in zip(self.buckets, counts):
+                cumulative += bucket_count
+                le = 'le="%s"' % _format_value(bound)
+                lines.append("%s_bucket%s %d" % (self.name, _format_labels(self.labelnames, labels, le), cumulative))
+            lines.append("%s_sum%s %s" % (self.name, _format_labels(self.labelnames, labels), repr(total)))
+            lines.append("%s_count%s %d" % (self.name, _format_labels(self.labelnames, labels), count))
+        return lines
+
+    def clear(self) -> None:
+        with self.__lock:
+            self.__values.clear()
+
+
+class MetricsRegistry(object):
+    """Registry of metrics which renders Prometheus text exposition format."""
+
+    __slots__ = ['__metrics']
+
+    def __init__(self):
+        self.__metrics = []
+
+    def __repr__(self):
+        return "<MetricsRegistry [%d metrics]>" % len(self.__metrics)
+
+    def register(self, metric):
+        """Register metric and return it."""
+        self.__metrics.append(metric)
+        return metric
+
+    def exposition(self) -> str:
+        """Render every metric as Prometheus text exposition format.
+
+        :rtype: :class:`str`
+        """
+        lines = []
+        for metric in self.__metrics:
+            lines.append("# HELP %s %s" % (metric.name, metric.documentation))
+            lines.append("# TYPE %s %s" % (metric.name, metric.type))
+            lines.extend(metric.samples())
+        lines.extend(_cache_samples())
+
+        return "\n".join(lines) + "\n"
+
+    def clear(self) -> None:
+        """Reset value of every metric."""
+        for metric in self.__metrics:
+            metric.clear()
+
+
+registry = MetricsRegistry()
+
+requests_total = registry.register(Counter(
+    "vlivepy_requests_total", "Responses received by endpoint and status code.", ("endpoint", "status")
+))
+request_errors_total = registry.register(Counter(
+    "vlivepy_request_errors_total", "Requests failed with exception by endpoint.", ("endpoint", "error")
+))
+retries_total = registry.register(Counter(
+    "vlivepy_retries_total", "Retried attempts by endpoint.", ("endpoint",)
+))
+request_duration_seconds = registry.register(Histogram(
+    "vlivepy_request_duration_seconds", "Latency of request by endpoint.", ("endpoint",)
+))
+response_bytes_total = registry.register(Counter(
+    "vlivepy_response_bytes_total", "Bytes of response body by endpoint.", ("endpoint",)
+))
+ratelimit_wait_seconds_total = registry.register(Counter(
+    "vlivepy_ratelimit_wait_seconds_total", "Seconds waited for rate limiter by endpoint.", ("endpoint",)
+))
+cache_served_total = registry.register(Counter(
+    "vlivepy_cache_served_total", "Responses served from response cache by endpoint.", ("endpoint",)
+))
+iterator_pages_total = registry.register(Counter(
+    "vlivepy_iterator_pages_total", "Pages loaded by get*Iter functions.", ("iterator",)
+))
+iterator_items_total = registry.register(Counter(
+    "vlivepy_iterator_items_total", "Items loaded by get*Iter functions.", ("iterator",)
+))
+
+
+def _cache_samples() -> List[str]:
+    cache = getCache()
+    if cache is None:
+        return []
+
+    stats = cache.stats()
+    lines = [
+        "# HELP vlivepy_cache_lookups_total Lookups of response cache by endpoint and result.",
+        "# TYPE vlivepy_cache_lookups_total counter",
+    ]
+    for endpoint, item in sorted(stats['endpoints'].items()):
+        for result, field in (("hit", "hits"), ("miss", "misses")):
+            lines.append('vlivepy_cache_lookups_total{endpoint="%s",result="%s"} %d' % (
+                _escape(endpoint), result, item[field]
+            ))
+    lines.extend([
+        "# HELP vlivepy_cache_size_bytes Total bytes of cached response bodies.",
+        "# TYPE vlivepy_cache_size_bytes gauge",
+        "vlivepy_cache_size_bytes %d" % stats['size'],
+    ])
+
+    return lines
+
+
+def _before_request(info: RequestInfo) -> None:
+    endpoint = info.endpoint or ""
+    if info.attempt > 1:
+        retries_total.inc(endpoint)
+    if info.wait:
+        ratelimit_wait_seconds_total.inc(endpoint, amount=info.wait)
+
+
+def _after_response(info: RequestInfo) -> None:
+    endpoint = info.endpoint or ""
+    if info.cached:
+        cache_served_total.inc(endpoint)
+        return
+
+    requests_total.inc(endpoint, str(info.status_code))
+    request_duration_seconds.observe(info.total, endpoint)
+    response_bytes_total.inc(endpoint, amount=info.bytes)
+
+
+def _on_error(info: RequestInfo) -> None:
+    request_errors_total.inc(info.endpoint or "", type(info.error).__name__)
+    request_duration_seconds.observe(info.total, info.endpoint or "")
+
+
+_enabled = False
+
+
+def enableMetrics() -> None:
+    """Start collecting metrics of every request."""
+    global _enabled
+
+    if not _enabled:
+        _enabled = True
+        addHook("before_request", _before_request)
+        addHook("after_response", _after_response)
+        addHook("on_error", _on_error)
+
+
+def disableMetrics() -> None:
+    """Stop collecting metrics. Collected values are kept."""
+    global _enabled
+
+    if _enabled:
+        _enabled = False
+        removeHook("before_request", _before_request)
+        removeHook("after_response", _after_response)
+        removeHook("on_error", _on_error)
+
+
+def count_page(
+        iterator: str,
+        items: int
+) -> None:
+    """Count a page loaded by get*Iter function.
+
+    Arguments:
+        iterator (:class:`str`) : Name of iterator function (e.g. getBoardPostsIter).
+        items (:class:`int`) : Count of items in the page.
+    """
+    if _enabled:
+        iterator_pages_total.inc(iterator)
+        iterator_items_total.inc(iterator, amount=items)
+
+
+def exposition() -> str:
+    """Render collected metrics as Prometheus text exposition format.
+
+    :rtype: :class:`str`
+    """
+    return registry.exposition()
+
+
+class _MetricsHandler(BaseHTTPRequestHandler):
+
+    def do_GET(self):
+        if self.path.split("?")[0] != "/metrics":
+            self.send_error(404)
+            return
+
+        body = exposition().encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+def serveMetrics(
+        port: int = 9108,
+        addr: str = "127.0.0.1"
+) -> ThreadingHTTPServer:
+    """Enable metrics and serve ``/metrics`` endpoint for Prometheus scraping in background thread.
+
+    Arguments:
+        port (:class:`int`, optional) : Port to listen, defaults to 9108.
+        addr (:class:`str`, optional) : Address to listen, defaults to 127.0.0.1.
+
+    Returns:
+        :class:`http.server.ThreadingHTTPServer`. Call ``shutdown()`` to stop it.
+    """
+    enableMetrics()
+    server = ThreadingHTTPServer((addr, port), _MetricsHandler)
+    Thread(target=server.serve_forever, daemon=True).start()
+
+    return server
@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
-from copy import deepcopy
+from concurrent.futures import ThreadPoolExecutor, wait
+from contextvars import copy_context
+from functools import partial
 from time import time
 from typing import (
     Callable,
@@ -18,6 +20,7 @@ from bs4 import (
     element,
 )
 
+from . import variables as gv
 from .channel import (
     getChannelInfo,
     getGroupedBoards,
@@ -38,6 +41,11 @@ from .exception import (
     ModelInitError,
     ModelInitWarning,
 )
+from .frozen import (
+    FrozenDict,
+    FrozenList,
+    freeze,
+)
 from .html_template import (
     formatted_body_template,
     video_box_template
@@ -50,6 +58,7 @@ from .parser import (
 from .post import getFVideoPlayInfo
 from .schedule import getScheduleData
 from .session import UserSession
+from .tracing import span
 from .upcoming import (
     getUpcomingList,
     UpcomingVideo
@@ -73,35 +82,52 @@ class DataModel(object):
     Note:
         This is the base object for other object without independent usage.
 
+    With `lazy`, data isn't loaded on init. It is loaded when any property is accessed first,
+    and :func:`loadModels` loads many lazy objects concurrently.
+
     Arguments:
         method (:class:`typing.Callable`) : function for loading data.
         target_id (:class:`str`) : argument for `method`.
         session (:class:`UserSession`, optional) : session for `method`, defaults to None.
         init_data (:class:`dict`, optional) : set initial data instead of loading data, defaults to None.
+        lazy (:class:`bool`, optional) : Defer loading data until first access, defaults to False.
 
     Attributes:
         session (:class:`UserSession`) : session for method
 
     """
 
-    __slots__ = ['_data_cache', '_target_id', 'session', '_method']
+    __slots__ = ['_data_cache', '_target_id', 'session', '_method', '_lazy']
 
     def __init__(
             self,
             method: Callable,
             target_id: str,
             session: Optional[UserSession] = None,
-            init_data: Optional[dict] = None
+            init_data: Optional[dict] = None,
+            lazy: bool = False
     ):
         self._method = method
         self._target_id = target_id
         self.session = session
+        self._lazy = lazy and not init_data
 
         if init_data:
-            self._data_cache = init_data
-        else:
+            self._data_cache = freeze(init_data)
+        elif not lazy:
             self.refresh()
 
+    def __getattr__(self, name):
+        # Unset _data_cache slot of lazy object, or object failed to load
+        if name != "_data_cache":
+            raise AttributeError("%r object has no attribute %r" % (type(self).__name__, name))
+        if self._lazy:
+            self.load()
+        try:
+            return object.__getattribute__(self, "_data_cache")
+        except AttributeError:
+            raise ModelInitError("Failed to load %s" % self._target_id) from None
+
     def __eq__(self, other):
         if type(self) == type(other):
             if self.target_id == other.target_id:
@@ -110,19 +136,46 @@ class DataModel(object):
 
     def refresh(self) -> None:
         """Reload self data."""
-        res = self._method(self._target_id, session=self.session, silent=True)
+        with span("%s.refresh" % type(self).__name__, **{"vlivepy.target_id": self.target_id}):
+            res = self._method(self._target_id, session=self.session, silent=True)
         if res:
-            self._data_cache = res
+            self._data_cache = freeze(res)
         else:
-            warn("Failed to refresh %s" % self, ModelRefreshWarning)
+            # repr of unloaded object may load again
+            warn("Failed to refresh <%s [%s]>" % (type(self).__name__, self._target_id), ModelRefreshWarning)
+
+    @property
+    def loaded(self) -> bool:
+        """True if data is loaded. Only lazy object can be False.
+
+        :rtype: :class:`bool`
+        """
+        try:
+            object.__getattribute__(self, "_data_cache")
+        except AttributeError:
+            return False
+        return True
+
+    def load(self) -> None:
+        """Load data of lazy object if it isn't loaded yet.
+        Lazy object loads itself only once. After it failed, properties raise :class:`ModelInitError`.
+        """
+        if not self.loaded:
+            self._lazy = False
+            self.refresh()
+            if self.loaded:
+                self._check_data()
+
+    def _check_data(self) -> None:
+        pass
 
     @property
     def raw(self) -> dict:
-        """Get full data as deep-copied dict.
+        """Get full data as read-only dict. Use :func:`vlivepy.frozen.thaw` for mutable copy.
 
-        :rtype: :class:`dict`
+        :rtype: :class:`vlivepy.frozen.FrozenDict`
         """
-        return deepcopy(self._data_cache)
+        return self._data_cache
 
     @property
     def target_id(self):
@@ -170,7 +223,7 @@ class Comment(DataModel):
 
         :rtype: :class:`dict`
         """
-        return deepcopy(self._data_cache['author'])
+        return self._data_cache['author']
 
     @property
     def author_nickname(self) -> str:
@@ -202,7 +255,7 @@ class Comment(DataModel):
 
         :rtype: :class:`list`
         """
-        return deepcopy(self._data_cache['sticker'])
+        return self._data_cache['sticker']
 
     @property
     def created_at(self) -> float:
@@ -239,7 +292,7 @@ class Comment(DataModel):
 
         :rtype: :class:`dict`
         """
-        return deepcopy(self._data_cache['parent'])
+        return self._data_cache['parent']
 
     @property
     def root(self) -> dict:
@@ -247,7 +300,7 @@ class Comment(DataModel):
 
         :rtype: :class:`dict`
         """
-        return deepcopy(self._data_cache['root'])
+        return self._data_cache['root']
 
     @property
     def written_in(self) -> str:
@@ -338,7 +391,7 @@ class OfficialVideoModel(DataModel):
 
         :rtype: :class:`List[dict]`
         """
-        return deepcopy(self._data_cache['multinationalTitles'])
+        return self._data_cache['multinationalTitles']
 
     def multinational_title_locales(self) -> list:
         """Get locales from multinational title.
@@ -733,7 +786,7 @@ class OfficialVideoVOD(OfficialVideoModel):
 
             return video_list
         else:
-            return deepcopy(self._data_cache['recommendedVideos'])
+            return self._data_cache['recommendedVideos']
 
     def getInkeyData(
             self,
@@ -776,6 +829,9 @@ class PostModel(DataModel):
     Arguments:
         post_id (:class:`str`) : Unique id of post to load.
         session (:class:`UserSession`, optional) : Session for loading data with permission, defaults to None.
+        fields (:class:`str`, optional) : Field profile of :func:`vlivepy.connections.getPostInfo`, defaults to "full".
+            Properties of fields out of the profile raise :class:`KeyError`.
+        lazy (:class:`bool`, optional) : Defer loading data until first access, defaults to False.
 
     Attributes:
         session (:class:`UserSession`) : Optional. Session for loading data with permission.
@@ -785,9 +841,11 @@ class PostModel(DataModel):
     def __init__(
             self,
             post_id: str,
-            session: Optional[UserSession] = None
+            session: Optional[UserSession] = None,
+            fields: str = "full",
+            lazy: bool = False
     ):
-        super().__init__(getPostInfo, post_id, session=session)
+        super().__init__(partial(getPostInfo, fields=fields), post_id, session=session, lazy=lazy)
 
     @property
     def attachments(self) -> dict:
@@ -795,7 +853,7 @@ class PostModel(DataModel):
 
         :rtype: :class:`dict`
         """
-        return deepcopy(self._data_cache['attachments'])
+        return self._data_cache['attachments']
 
     @property
     def attachments_photo(self) -> dict:
@@ -804,9 +862,9 @@ class PostModel(DataModel):
         :rtype: :class:`dict`
         """
         if 'photo' in self._data_cache['attachments']:
-            return deepcopy(self._data_cache['attachments']['photo'])
+            return self._data_cache['attachments']['photo']
         else:
-            return {}
+            return FrozenDict()
 
     @property
     def attachments_video(self) -> dict:
@@ -815,9 +873,9 @@ class PostModel(DataModel):
         :rtype: :class:`dict`
         """
         if 'video' in self._data_cache['attachments']:
-            return deepcopy(self._data_cache['attachments']['video'])
+            return self._data_cache['attachments']['video']
         else:
-            return {}
+            return FrozenDict()
 
     @property
     def author(self) -> dict:
@@ -825,7 +883,7 @@ class PostModel(DataModel):
 
         :rtype: :class:`dict`
         """
-        return deepcopy(self._data_cache['author'])
+        return self._data_cache['author']
 
     @property
     def author_nickname(self) -> str:
@@ -971,6 +1029,9 @@ class Post(PostModel):
     Arguments:
         post_id (:class:`str`) : Unique id of post to load.
         session (:class:`UserSession`, optional) : Session for loading data with permission, defaults to None.
+        fields (:class:`str`, optional) : Field profile of :func:`vlivepy.connections.getPostInfo`, defaults to "full".
+            Properties of fields out of the profile raise :class:`KeyError`.
+        lazy (:class:`bool`, optional) : Defer loading data until first access, defaults to False.
 
     Attributes:
         session (:class:`UserSession`) : Optional. Session for loading data with permission.
@@ -979,9 +1040,15 @@ class Post(PostModel):
     def __init__(
             self,
             post_id: str,
-            session: Optional[UserSession] = None
+            session: Optional[UserSession] = None,
+            fields: str = "full",
+            lazy: bool = False
     ):
-        super().__init__(post_id, session)
+        super().__init__(post_id, session, fields, lazy)
+        if not lazy:
+            self._check_data()
+
+    def _check_data(self) -> None:
         if self.content_type != "POST":
             warn(ModelInitWarning("Post-%s may be a OfficialVideoPost, not a Post." % self.target_id))
 
@@ -1017,10 +1084,20 @@ class Post(PostModel):
 
         :rtype: :class:`str`
         """
-        # load Template
-        video_template = video_box_template
-        doc_template = formatted_body_template
+        soup = self._body_soup()
+
+        # load play info of video attachments
+        play_infos = {}
+        for at_id, at_data in self._body_video_attachments(soup):
+            play_infos[at_id] = getFVideoPlayInfo(
+                f_video_id=at_data['videoId'],
+                f_vod_id=at_data['uploadInfo']['videoId'],
+                session=self.session
+            )
+
+        return self._render_body(soup, play_infos)
 
+    def _body_soup(self) -> BeautifulSoup:
         soup = BeautifulSoup(self.body, 'html.parser')
         for item in soup.children:
             if type(item) == element.NavigableString:
@@ -1031,10 +1108,28 @@ class Post(PostModel):
             sub_soup = BeautifulSoup(br_text, 'html.parser')
             item.replace_with(sub_soup)
 
+        return soup
+
+    def _body_video_attachments(self, soup: BeautifulSoup) -> List[tuple]:
+        attachments = self.attachments
+        video_list = []
+        for item in soup.find_all("v:attachment"):
+            if item.get("type") == "video":
+                at_id = item.get("id")
+                video_list.append((at_id, attachments['video'][at_id]))
+
+        return video_list
+
+    def _render_body(self, soup: BeautifulSoup, play_infos: dict) -> str:
+        # load Template
+        video_template = video_box_template
+        doc_template = formatted_body_template
+
+        attachments = self.attachments
         for item in soup.find_all("v:attachment"):
             at_id = item.get("id")
             at_type = item.get("type")
-            at_data = self.attachments[at_type][at_id]
+            at_data = attachments[at_type][at_id]
 
             if at_type == 'photo':
                 dom_obj = soup.new_tag("img")
@@ -1043,13 +1138,7 @@ class Post(PostModel):
                 dom_obj.attrs['style'] = "display: block;margin-bottom:10px;width:100%"
 
             elif at_type == "video":
-
-                play_info = getFVideoPlayInfo(
-                    f_video_id=at_data['videoId'],
-                    f_vod_id=at_data['uploadInfo']['videoId'],
-                    session=self.session
-                )
-                video = max_res_from_play_info(play_info)
+                video = max_res_from_play_info(play_infos[at_id])
                 dom_obj = soup.new_tag("video")
                 dom_obj.attrs['src'] = video['source']
                 dom_obj.attrs['type'] = "video/mp4"
@@ -1078,6 +1167,9 @@ class OfficialVideoPost(PostModel):
         init_id (:class:`Union[str, int]`) : Unique id of post to load.
             Also, the object can be initialized by video_seq.
         session (:class:`UserSession`, optional) : Session for loading data with permission, defaults to None.
+        fields (:class:`str`, optional) : Field profile of :func:`vlivepy.connections.getPostInfo`, defaults to "full".
+            Properties of fields out of the profile raise :class:`KeyError`.
+        lazy (:class:`bool`, optional) : Defer loading data until first access, defaults to False.
 
     Attributes:
         session (:class:`UserSession`) : Optional. Session for loading data with permission.
@@ -1086,23 +1178,66 @@ class OfficialVideoPost(PostModel):
     def __init__(
             self, 
             init_id: Union[str, int],
-            session: Optional[UserSession] = None
+            session: Optional[UserSession] = None,
+            fields: str = "full",
+            lazy: bool = False
     ):
         # interpret number
         if type(init_id) == int:
             init_id = str(init_id)
 
-        # Case <videoSeq>
-        if "-" not in init_id:
-            init_id = videoSeqToPostId(init_id)
-        super().__init__(init_id, session)
+        super().__init__(init_id, session, fields, lazy)
+        if not lazy:
+            self._check_data()
+
+    def __repr__(self):
+        return "<VLIVE OfficialVideoPost [%s]>" % (self.video_seq if self.loaded else self._target_id)
+
+    def _resolve_post_id(self) -> bool:
+        # Case <videoSeq>, post id is found before it is used. video_seq is kept if it isn't found
+        if "-" not in self._target_id:
+            post_id = videoSeqToPostId(self._target_id)
+            if post_id is None:
+                return False
+            self._target_id = post_id
+        return True
+
+    def _post_id(self) -> str:
+        # Lazy object finds post id only once, same as loading data
+        if self._lazy and not self._resolve_post_id():
+            self._lazy = False
+        if "-" not in self._target_id:
+            raise ModelInitError("Failed to find post of video %s" % self._target_id)
+        return self._target_id
+
+    def refresh(self) -> None:
+        if self._resolve_post_id():
+            super().refresh()
+        else:
+            warn("Failed to refresh <%s [%s]>" % (type(self).__name__, self._target_id), ModelRefreshWarning)
 
+    @property
+    def target_id(self):
+        """Get internal target id. Lazy object initialized by video_seq finds post id first.
+        Raises :class:`ModelInitError` if post of the video_seq isn't found.
+
+        :rtype: :class:`str`
+        """
+        return self._post_id()
+
+    @property
+    def post_id(self) -> str:
+        """Unique id of the post. Lazy object initialized by video_seq finds post id first.
+        Raises :class:`ModelInitError` if post of the video_seq isn't found.
+
+        :rtype: :class:`str`
+        """
+        return self._post_id()
+
+    def _check_data(self) -> None:
         if self.content_type != "VIDEO":
             warn(ModelInitWarning("Post-%s may be a Post, not a OfficialVideoPost." % self.target_id))
 
-    def __repr__(self):
-        return "<VLIVE OfficialVideoPost [%s]>" % self.video_seq
-
     @property
     def official_video_type(self) -> str:
         """Type of video.
@@ -1142,6 +1277,9 @@ class Schedule(DataModel):
    Arguments:
        schedule_id (:class:`Union[str, int]`) : Unique id of schedule to load.
        session (:class:`UserSession`) : Session for loading data with permission.
+       fields (:class:`str`, optional) : Field profile of :func:`vlivepy.schedule.getScheduleData`,
+           defaults to "full". Properties of fields out of the profile raise :class:`KeyError`.
+       lazy (:class:`bool`, optional) : Defer loading data until first access, defaults to False.
 
    Attributes:
        session (:class:`UserSession`) : Session for loading data with permission.
@@ -1150,9 +1288,11 @@ class Schedule(DataModel):
     def __init__(
             self,
             schedule_id: str,
-            session: UserSession
+            session: UserSession,
+            fields: str = "full",
+            lazy: bool = False
     ):
-        super().__init__(getScheduleData, schedule_id, session=session)
+        super().__init__(partial(getScheduleData, fields=fields), schedule_id, session=session, lazy=lazy)
 
     def __repr__(self):
         return "<VLIVE Schedule [%s]>" % self._target_id
@@ -1171,7 +1311,7 @@ class Schedule(DataModel):
 
         :rtype: :class:`dict`
         """
-        return deepcopy(self._data_cache['author'])
+        return self._data_cache['author']
 
     @property
     def author_nickname(self) -> str:
@@ -1377,19 +1517,7 @@ class Upcoming(object):
         upcomings = getUpcomingList(date=date, silent=silent)
 
         if upcomings is not None:
-            data_list = []
-            for item in upcomings:
-                item: UpcomingVideo
-                if item.type == "VOD" and show_vod:
-                    data_list.append(item)
-                elif item.type == "LIVE" and show_live:
-                    data_list.append(item)
-                elif item.type == "UPCOMING_VOD" and show_upcoming_vod:
-                    data_list.append(item)
-                elif item.type == "UPCOMING_LIVE" and show_upcoming_live:
-                    data_list.append(item)
-
-            return data_list
+            return self._filter(upcomings, show_vod, show_upcoming_vod, show_upcoming_live, show_live)
         return None
 
     def upcoming(
@@ -1426,8 +1554,18 @@ class Upcoming(object):
         if show_upcoming_live is None:
             show_upcoming_live = self.show_upcoming_live
 
+        return self._filter(self.__cached_data, show_vod, show_upcoming_vod, show_upcoming_live, show_live)
+
+    @staticmethod
+    def _filter(
+            upcomings: List[UpcomingVideo],
+            show_vod: bool,
+            show_upcoming_vod: bool,
+            show_upcoming_live: bool,
+            show_live: bool
+    ) -> List[UpcomingVideo]:
         data_list = []
-        for item in self.__cached_data:
+        for item in upcomings:
             item: UpcomingVideo
             if item.type == "VOD" and show_vod:
                 data_list.append(item)
@@ -1482,7 +1620,7 @@ class GroupedBoards(DataModel):
             for board in item['boards']:
                 board_list.append(board)
 
-        return deepcopy(board_list)
+        return FrozenList(board_list)
 
     def board_names(self) -> List[str]:
         """Get name of the boards
@@ -1579,7 +1717,7 @@ class Channel(DataModel):
 
         :rtype: :class:`str`
         """
-        return deepcopy(self._data_cache['prohibitedWordLikeList'])
+        return self._data_cache['prohibitedWordLikeList']
 
     @property
     def prohibited_word_exact_list(self) -> list:
@@ -1587,7 +1725,7 @@ class Channel(DataModel):
 
         :rtype: :class:`str`
         """
-        return deepcopy(self._data_cache['prohibitedWordExactList'])
+        return self._data_cache['prohibitedWordExactList']
 
     @property
     def sns_share_img(self) -> str:
@@ -1690,3 +1828,37 @@ class Channel(DataModel):
         :rtype: :class:`GroupedBoards`
         """
         return GroupedBoards(self.channel_code, self.session)
+
+
+def loadModels(
+        models: List[DataModel],
+        workers: int = None
+) -> List[DataModel]:
+    """Load data of many lazy objects concurrently by thread pool. Loaded objects are skipped.
+
+    .. code-block:: python
+
+        posts = [item.to_object(lazy=True) for item in getBoardPostsIter("FD53B", 3140)]
+        loadModels(posts)
+
+    Arguments:
+        models (:class:`List[DataModel]`) : Objects to load.
+        workers (:class:`int`, optional) : Max objects loading at once,
+            defaults to :obj:`vlivepy.variables.override_load_workers`.
+
+    Returns:
+        :class:`List[DataModel]`. `models` as list. Objects failed to load stay unloaded without raising exception.
+    """
+    models = list(models)
+    pending = [item for item in models if not item.loaded]
+    if not pending:
+        return models
+
+    workers = gv.override_load_workers if workers is None else workers
+    with ThreadPoolExecutor(max(1, min(workers, len(pending))), thread_name_prefix="vlivepy-load") as executor:
+        # Every task needs its own copy of context
+        futures = [executor.submit(copy_context().run, item.load) for item in pending]
+        # Failure of each object is left to the object
+        wait(futures)
+
+    return models
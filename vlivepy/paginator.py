@@ -0,0 +1,328 @@
+# -*- coding: utf-8 -*-
+
+from contextvars import copy_context
+from queue import Full, Queue
+from threading import Event, Lock, Thread
+from typing import (
+    Any,
+    Callable,
+    Iterator,
+    List,
+    Optional,
+    Union,
+)
+
+from . import variables as gv
+from .exception import APIBadRequestError
+from .metrics import count_page
+from .parser import next_page_checker
+
+# Largest page size accepted by server for each get*Iter function, found by adaptive mode.
+# None means server default, when every larger size is rejected
+_accepted_sizes = {}
+# Size of full page server answers without page size for each get*Iter function
+_default_sizes = {}
+_accepted_sizes_lock = Lock()
+
+
+def adaptive_page_sizes(iterator: str) -> List[Optional[int]]:
+    """Get page sizes adaptive mode tries for get*Iter function, from largest. None is server default, tried last.
+    Sizes not larger than the page of server default, and sizes larger than the size server accepted before
+    are skipped.
+
+    Arguments:
+        iterator (:class:`str`) : Name of get*Iter function.
+
+    Returns:
+        :class:`List[Optional[int]]`. Subset of :obj:`vlivepy.variables.override_adaptive_page_sizes`, and None.
+    """
+    sizes = sorted(gv.override_adaptive_page_sizes, reverse=True)
+    if not sizes:
+        raise ValueError("override_adaptive_page_sizes is empty")
+    with _accepted_sizes_lock:
+        accepted = _accepted_sizes.get(iterator, 0)
+        default = _default_sizes.get(iterator, 0)
+    if accepted is None:
+        return [None]
+    if accepted:
+        sizes = [size for size in sizes if size <= accepted]
+    return [size for size in sizes if size > default] + [None]
+
+
+def accept_page_size(iterator: str, size: Optional[int]) -> None:
+    """Remember page size server accepted for get*Iter function. None is server default."""
+    with _accepted_sizes_lock:
+        _accepted_sizes[iterator] = size
+
+
+def default_page_size(iterator: str) -> Optional[int]:
+    """Get size of full page server answers without page size for get*Iter function. None if it isn't found yet."""
+    with _accepted_sizes_lock:
+        return _default_sizes.get(iterator)
+
+
+def accept_default_page(iterator: str, data: dict) -> None:
+    """Remember size of page server answered without page size. Last page is ignored, since it may be short."""
+    if next_page_checker(data):
+        with _accepted_sizes_lock:
+            _default_sizes[iterator] = len(data['data'])
+
+
+def resetAdaptivePageSizes() -> None:
+    """Forget page sizes found by adaptive mode, so next paginators probe from largest size again."""
+    with _accepted_sizes_lock:
+        _accepted_sizes.clear()
+        _default_sizes.clear()
+
+
+class Paginator(object):
+    """This is the iterator of pages chained with ``nextParams`` cursor. Every get*Iter function returns it.
+
+    Position is kept as :attr:`cursor` of the page being consumed and :attr:`offset` of items consumed from it,
+    so long crawl can be saved with :meth:`state` and resumed exactly with :meth:`restore`.
+
+    .. code-block:: python
+
+        pager = getPostCommentsIter("0-18396482")
+        for comment in pager:
+            process(comment)
+            save(pager.state())
+
+        # after restart
+        pager = getPostCommentsIter("0-18396482").restore(load())
+
+    With adaptive `page_size`, first page is requested with server default to find its size.
+    Next pages are requested with largest size of :func:`adaptive_page_sizes` larger than that,
+    and smaller size or server default is tried for same cursor when server rejects it with
+    :class:`vlivepy.exception.APIBadRequestError` (status 400). Other errors are raised as is.
+    So adaptive mode doesn't load smaller pages than server default. Each rejected size costs one request,
+    only once since accepted size is shared by later paginators of same get*Iter function.
+
+    With prefetch, next pages are loaded by background thread while items of current page are yielded.
+    At most `prefetch` loaded pages wait for consumer, so slow consumer doesn't make pages pile up.
+    The thread runs with copy of current context, so :func:`vlivepy.retry.usePolicy`,
+    :func:`vlivepy.transport.useTransport` and tracing spans apply to it.
+
+    Arguments:
+        iterator (:class:`str`) : Name of get*Iter function for metrics and state.
+        fetch (:class:`Callable[[Optional[str], Optional[int]], dict]`) : Function loading a page of the cursor
+            with page size. Cursor is None for first page, and page size is None for server default.
+        after (:class:`str`, optional) : Cursor of page to start, defaults to None (first page).
+        prefetch (:class:`int`, optional) : Max pages loaded ahead of consumer. 0 disables prefetch,
+            defaults to :obj:`vlivepy.variables.override_prefetch_pages`.
+        page_size (:class:`Union[int, str]`, optional) : Items per page or :code:`"adaptive"`,
+            defaults to :obj:`vlivepy.variables.override_page_size`.
+    """
+
+    __slots__ = ['iterator', 'prefetch', 'page_size', '_fetch', '_cursor', '_next_cursor', '_offset', '_skip',
+                 '_items', '_done', '_pages']
+
+    def __init__(
+            self,
+            iterator: str,
+            fetch: Callable[[Optional[str], Optional[int]], Any],
+            after: str = None,
+            prefetch: int = None,
+            page_size: Union[int, str] = None
+    ):
+        self.iterator = iterator
+        self.prefetch = gv.override_prefetch_pages if prefetch is None else prefetch
+        self.page_size = gv.override_page_size if page_size is None else page_size
+        self._fetch = fetch
+        self._cursor = after
+        self._next_cursor = None
+        self._offset = 0
+        self._skip = 0
+        self._items = 0
+        self._done = False
+        self._pages = None
+
+    def __repr__(self):
+        return "<Paginator [%s %s+%d]>" % (self.iterator, self._cursor, self._offset)
+
+    @property
+    def cursor(self) -> Optional[str]:
+        """Cursor of the page being consumed. None for first page.
+
+        :rtype: :class:`str`
+        """
+        return self._cursor
+
+    @property
+    def next_cursor(self) -> Optional[str]:
+        """Cursor of the next page. None if the page being consumed is last page.
+
+        :rtype: :class:`str`
+        """
+        return self._next_cursor
+
+    @property
+    def offset(self) -> int:
+        """Count of items yielded from the page being consumed.
+
+        :rtype: :class:`int`
+        """
+        return self._offset
+
+    @property
+    def items(self) -> int:
+        """Count of items yielded by this paginator.
+
+        :rtype: :class:`int`
+        """
+        return self._items
+
+    @property
+    def done(self) -> bool:
+        """True if every item is yielded.
+
+        :rtype: :class:`bool`
+        """
+        return self._done
+
+    def state(self) -> dict:
+        """Get json serializable position. Yielded items are considered consumed.
+
+        :rtype: :class:`dict`
+        """
+        return {
+            "iterator": self.iterator,
+            "cursor": self._cursor,
+            "offset": self._offset,
+            "items": self._items,
+            "done": self._done,
+        }
+
+    def restore(
+            self,
+            state: dict
+    ) -> "Paginator":
+        """Restore position from :meth:`state`. Items before the position are skipped.
+        It must be called before iteration.
+
+        Arguments:
+            state (:class:`dict`) : Position saved by :meth:`state`.
+
+        Returns:
+            :class:`Paginator`. This paginator.
+        """
+        if self._pages is not None:
+            raise RuntimeError("Paginator is already started")
+        if state['iterator'] != self.iterator:
+            raise ValueError("State of %s can't be restored to %s" % (state['iterator'], self.iterator))
+
+        self._cursor = state['cursor']
+        self._skip = state['offset']
+        self._offset = state['offset']
+        self._items = state.get('items', 0)
+        self._done = state.get('done', False)
+        return self
+
+    def _page(self, after: Optional[str], data: dict):
+        next_cursor = next_page_checker(data)
+        count_page(self.iterator, len(data['data']))
+        return after, data['data'], next_cursor
+
+    def _load(self, after: Optional[str]):
+        if self.page_size != "adaptive":
+            return self._page(after, self._fetch(after, self.page_size))
+
+        sizes = adaptive_page_sizes(self.iterator)
+        if default_page_size(self.iterator) is None:
+            # Larger sizes are tried only after size of server default is found
+            data = self._fetch(after, None)
+            accept_default_page(self.iterator, data)
+            return self._page(after, data)
+
+        for size in sizes:
+            try:
+                data = self._fetch(after, size)
+            except APIBadRequestError:
+                if size is None:
+                    raise
+                continue
+            accept_page_size(self.iterator, size)
+            return self._page(after, data)
+
+    def _consume(self, page):
+        self._cursor, items, self._next_cursor = page
+        self._offset = self._skip
+        start, self._skip = self._skip, 0
+        if start > len(items):
+            # Restored with smaller page size than saved, skip rest in next page
+            self._skip = start - len(items)
+        for i in range(start, len(items)):
+            self._offset = i + 1
+            self._items += 1
+            yield items[i]
+
+    def _serial(self):
+        after = self._cursor
+        while True:
+            page = self._load(after)
+            yield from self._consume(page)
+            after = page[2]
+            if not after:
+                break
+
+    def _prefetched(self):
+        # Each entry is (page, exception). None marks the end.
+        pages = Queue(maxsize=self.prefetch)
+        stop = Event()
+
+        def put(entry):
+            while not stop.is_set():
+                try:
+                    pages.put(entry, timeout=0.1)
+                    return
+                except Full:
+                    continue
+
+        def produce():
+            after = self._cursor
+            try:
+                while not stop.is_set():
+                    page = self._load(after)
+                    put((page, None))
+                    after = page[2]
+                    if not after:
+                        break
+            except Exception as e:
+                put((None, e))
+            put(None)
+
+        Thread(target=copy_context().run, args=(produce,), name="vlivepy-prefetch-%s" % self.iterator,
+               daemon=True).start()
+        try:
+            while True:
+                entry = pages.get()
+                if entry is None:
+                    return
+                page, error = entry
+                if error is not None:
+                    raise error
+                yield from self._consume(page)
+        finally:
+            stop.set()
+
+    def _generate(self):
+        if self._done:
+            return
+        if self.prefetch > 0:
+            yield from self._prefetched()
+        else:
+            yield from self._serial()
+        self._done = True
+
+    def __iter__(self) -> Iterator:
+        return self
+
+    def __next__(self):
+        if self._pages is None:
+            self._pages = self._generate()
+        return next(self._pages)
+
+    def close(self) -> None:
+        """Stop iteration and background thread of prefetch."""
+        if self._pages is not None:
+            self._pages.close()
@@ -1,15 +1,58 @@
 # -*- coding: utf-8 -*-
 
+import json
 from datetime import datetime
 from typing import (
+    Any,
     Optional,
     Union
 )
 from warnings import warn
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+from . import variables as gv
 from .exception import auto_raise, APIServerResponseWarning, APIServerResponseError
 
 
+def json_loads(
+        data: Union[bytes, str]
+) -> Any:
+    """Decode json with backend of :obj:`vlivepy.variables.override_json_backend`.
+    orjson is used when it is installed, and stdlib json is used for data orjson can't decode (e.g. big integer).
+
+    Arguments:
+        data (:class:`Union[bytes, str]`) : Json document.
+
+    Returns:
+        Decoded object.
+    """
+    if orjson is not None and gv.override_json_backend != "json":
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            pass
+
+    return json.loads(data)
+
+
+def response_json_loader(
+        response
+) -> Any:
+    """Decode json body of response. Every response of vlivepy is decoded by this function.
+
+    Arguments:
+        response (:class:`requests.Response`) : Response to decode. :class:`httpx.Response` is also supported.
+
+    Returns:
+        Decoded object.
+    """
+    return json_loads(response.content)
+
+
 def response_json_stripper(
         parsed_json_dict: dict,
         silent: bool = False,
@@ -0,0 +1,104 @@
+# -*- coding: utf-8 -*-
+
+from http.cookiejar import DefaultCookiePolicy
+from threading import Lock
+from typing import (
+    Optional
+)
+
+from requests import Session
+from requests.adapters import HTTPAdapter
+
+from . import variables as gv
+
+# Hosts that have dedicated connection pool
+PooledHosts = (
+    "https://www.vlive.tv",
+    "https://apis.naver.com",
+    "http://api.vfan.vlive.tv",
+)
+
+
+class _RejectCookiePolicy(DefaultCookiePolicy):
+    """Cookie policy that keeps anonymous session stateless"""
+
+    def set_ok(self, cookie, request):
+        return False
+
+
+_pool_lock = Lock()
+_pool_session: Optional[Session] = None
+
+
+def _create_session(
+        pool_size: int,
+        keep_alive: bool
+) -> Session:
+    session = Session()
+    session.cookies.set_policy(_RejectCookiePolicy())
+    if not keep_alive:
+        session.headers['Connection'] = "close"
+
+    for prefix in PooledHosts:
+        session.mount(prefix, HTTPAdapter(pool_connections=1, pool_maxsize=pool_size))
+
+    return session
+
+
+def getPoolSession() -> Session:
+    """Get process-wide pooled session for anonymous requests.
+    Connections to VLIVE hosts are kept alive and reused by every function called without :class:`UserSession`.
+
+    The pool is created at first use with :obj:`vlivepy.variables.override_pool_size` and
+    :obj:`vlivepy.variables.override_pool_keep_alive`. Use :func:`configurePool` to change it.
+
+    Returns:
+        :class:`requests.Session`. Shared session which doesn't store cookies.
+    """
+    global _pool_session
+
+    if _pool_session is None:
+        with _pool_lock:
+            if _pool_session is None:
+                _pool_session = _create_session(gv.override_pool_size, gv.override_pool_keep_alive)
+
+    return _pool_session
+
+
+def configurePool(
+        pool_size: int = None,
+        keep_alive: bool = None
+) -> None:
+    """Re-create pooled session with new options.
+
+    Arguments:
+        pool_size (:class:`int`, optional) : Max connections kept for each host,
+            defaults to :obj:`vlivepy.variables.override_pool_size`.
+        keep_alive (:class:`bool`, optional) : Reuse connections between requests,
+            defaults to :obj:`vlivepy.variables.override_pool_keep_alive`.
+    """
+    global _pool_session
+
+    if pool_size is not None:
+        gv.override_pool_size = pool_size
+    if keep_alive is not None:
+        gv.override_pool_keep_alive = keep_alive
+
+    with _pool_lock:
+        old_session = _pool_session
+        _pool_session = _create_session(gv.override_pool_size, gv.override_pool_keep_alive)
+
+    if old_session is not None:
+        old_session.close()
+
+
+def closePool() -> None:
+    """Close pooled session and its connections. New pool is created at next request."""
+    global _pool_session
+
+    with _pool_lock:
+        old_session = _pool_session
+        _pool_session = None
+
+    if old_session is not None:
+        old_session.close()
@@ -6,11 +6,13 @@ from typing import (
 
 from . import variables as gv
 from .exception import auto_raise, APINetworkError
-from .parser import response_json_stripper
+from .parser import response_json_loader, response_json_stripper
 from .router import rew_get
 from .session import UserSession
+from .tracing import traced
 
 
+@traced
 def getFVideoInkeyData(
         f_video_id: str,
         session: UserSession = None,
@@ -28,17 +30,18 @@ def getFVideoInkeyData(
     """
 
     # Make request
-    sr = rew_get(**gv.endpoint_fvideo_inkey(f_video_id),
-                 wait=0.5, session=session, status=[200])
+    sr = rew_get(**gv.endpoint_fvideo_inkey(f_video_id), endpoint="endpoint_fvideo_inkey",
+                 session=session, status=[200])
 
     if sr.success:
-        return response_json_stripper(sr.response.json(), silent=silent)['inKey']
+        return response_json_stripper(response_json_loader(sr.response), silent=silent)['inKey']
     else:
         auto_raise(APINetworkError, silent)
 
     return None
 
 
+@traced
 def getFVideoPlayInfo(
         f_video_id: str,
         f_vod_id: str,
@@ -58,11 +61,11 @@ def getFVideoPlayInfo(
     """
 
     inkey = getFVideoInkeyData(f_video_id=f_video_id, session=session)
-    sr = rew_get(**gv.endpoint_vod_play_info(f_vod_id, inkey),
-                 session=session, wait=0.3, status=[200, 403])
+    sr = rew_get(**gv.endpoint_vod_play_info(f_vod_id, inkey), endpoint="endpoint_vod_play_info",
+                 session=session, status=[200, 403])
 
     if sr.success:
-        return response_json_stripper(sr.response.json(), silent=silent)
+        return response_json_stripper(response_json_loader(sr.response), silent=silent)
     else:
         auto_raise(APINetworkError, silent=silent)
 
@@ -0,0 +1,218 @@
+# -*- coding: utf-8 -*-
+
+from threading import Lock
+from time import monotonic, sleep
+from typing import (
+    Dict,
+    Optional,
+    Tuple,
+)
+from urllib.parse import urlparse
+
+from . import variables as gv
+
+
+class TokenBucket(object):
+    """Thread-safe token bucket.
+    Tokens are refilled by :obj:`rate` per second up to :obj:`burst`.
+    When the bucket is empty, callers reserve future tokens and wait in arrival order.
+
+    Arguments:
+        rate (:class:`float`) : Steady rate of requests per second.
+        burst (:class:`int`) : Max requests sent without waiting.
+
+    Attributes:
+        rate (:class:`float`) : Steady rate of requests per second.
+        burst (:class:`int`) : Max requests sent without waiting.
+    """
+
+    __slots__ = ['rate', 'burst', '__tokens', '__updated', '__lock']
+
+    def __init__(
+            self,
+            rate: float,
+            burst: int
+    ):
+        self.rate = rate
+        self.burst = burst
+        self.__tokens = float(burst)
+        self.__updated = monotonic()
+        self.__lock = Lock()
+
+    def __repr__(self):
+        return "<TokenBucket [%s/s, burst %s]>" % (self.rate, self.burst)
+
+    def reserve(self) -> float:
+        """Take one token.
+
+        Returns:
+            :class:`float`. Seconds to wait before sending request. 0 if token was available.
+        """
+        with self.__lock:
+            now = monotonic()
+            self.__tokens = min(self.burst, self.__tokens + (now - self.__updated) * self.rate)
+            self.__updated = now
+            self.__tokens -= 1
+
+            if self.__tokens >= 0:
+                return 0.0
+            else:
+                return -self.__tokens / self.rate
+
+    def acquire(self) -> float:
+        """Take one token and wait until it is available.
+
+        Returns:
+            :class:`float`. Waited seconds.
+        """
+        delay = self.reserve()
+        if delay > 0:
+            sleep(delay)
+
+        return delay
+
+
+def endpoint_family(
+        url: str
+) -> Tuple[str, str]:
+    """Split url into host and endpoint family.
+    Family is the api name after ``vam-web`` (e.g. post, comment, video), or first path of the url.
+
+    Arguments:
+        url (:class:`str`) : Request url.
+
+    Returns:
+        :class:`tuple`. (host, family)
+    """
+    parsed = urlparse(url)
+    paths = parsed.path.strip("/").split("/")
+    if len(paths) > 2 and paths[1] == "vam-web":
+        family = paths[2]
+    else:
+        family = paths[0]
+
+    return parsed.hostname, family
+
+
+class RateLimiter(object):
+    """Shared rate limiter keyed by host and endpoint family.
+
+    Limits are dict of ``{key: (rate, burst)}``. Key is ``"host/family"``, ``"host"`` or ``"*"``,
+    and the most specific key is used. Requests that match same key share one bucket.
+    Requests that match no key are not limited.
+
+    Arguments:
+        limits (:class:`dict`) : Rate limits by key.
+    """
+
+    __slots__ = ['limits', '__buckets', '__lock']
+
+    def __init__(
+            self,
+            limits: Dict[str, Tuple[float, int]]
+    ):
+        self.limits = dict(limits)
+        self.__buckets: Dict[str, TokenBucket] = {}
+        self.__lock = Lock()
+
+    def __repr__(self):
+        return "<RateLimiter %s>" % self.limits
+
+    def bucket(
+            self,
+            url: str
+    ) -> Optional[TokenBucket]:
+        """Get bucket for the url.
+
+        Arguments:
+            url (:class:`str`) : Request url.
+
+        Returns:
+            :class:`TokenBucket`. None if the url is not limited.
+        """
+        host, family = endpoint_family(url)
+        for key in ("%s/%s" % (host, family), host, "*"):
+            if key in self.limits:
+                break
+        else:
+            return None
+
+        bucket = self.__buckets.get(key)
+        if bucket is None:
+            with self.__lock:
+                bucket = self.__buckets.get(key)
+                if bucket is None:
+                    rate, burst = self.limits[key]
+                    bucket = TokenBucket(rate, burst)
+                    self.__buckets[key] = bucket
+
+        return bucket
+
+    def reserve(
+            self,
+            url: str
+    ) -> float:
+        """Take one token for the url.
+
+        Returns:
+            :class:`float`. Seconds to wait before sending request.
+        """
+        bucket = self.bucket(url)
+        if bucket is None:
+            return 0.0
+
+        return bucket.reserve()
+
+    def acquire(
+            self,
+            url: str
+    ) -> float:
+        """Take one token for the url and wait until it is available.
+
+        Returns:
+            :class:`float`. Waited seconds.
+        """
+        delay = self.reserve(url)
+        if delay > 0:
+            sleep(delay)
+
+        return delay
+
+
+_limiter_lock = Lock()
+_limiter: Optional[RateLimiter] = None
+
+
+def getRateLimiter() -> RateLimiter:
+    """Get process-wide rate limiter used by every request.
+    It is created at first use with :obj:`vlivepy.variables.override_rate_limits`.
+
+    Returns:
+        :class:`RateLimiter`
+    """
+    global _limiter
+
+    if _limiter is None:
+        with _limiter_lock:
+            if _limiter is None:
+                _limiter = RateLimiter(gv.override_rate_limits)
+
+    return _limiter
+
+
+def configureRateLimit(
+        limits: Dict[str, Tuple[float, int]] = None
+) -> None:
+    """Replace process-wide rate limiter.
+
+    Arguments:
+        limits (:class:`dict`, optional) : Rate limits by key. See :class:`RateLimiter`,
+            defaults to :obj:`vlivepy.variables.override_rate_limits`.
+    """
+    global _limiter
+
+    if limits is not None:
+        gv.override_rate_limits = limits
+
+    with _limiter_lock:
+        _limiter = RateLimiter(gv.override_rate_limits)
@@ -0,0 +1,293 @@
+# -*- coding: utf-8 -*-
+
+from contextlib import contextmanager
+from contextvars import ContextVar
+from random import uniform
+from threading import Lock
+from time import monotonic
+from typing import (
+    Dict,
+    Iterable,
+    Optional,
+    Tuple,
+)
+
+from requests.exceptions import (
+    ChunkedEncodingError,
+    ConnectionError,
+    Timeout,
+)
+
+from . import variables as gv
+
+
+class RetryPolicy(object):
+    """This is the object decides whether a failed request is retried and how long to wait.
+
+    Failures are classified by status code and exception type. Response with status in :obj:`retry_status`
+    and exception in :obj:`retry_exceptions` are retried. Other failures (e.g 404) fail immediately.
+    Only requests of :obj:`retry_methods` are retried, so non-idempotent request like sign in is sent once.
+    Delay grows exponentially from :obj:`backoff` up to :obj:`backoff_max`, with full jitter.
+    ``Retry-After`` header of response is respected.
+
+    Arguments:
+        max_attempts (:class:`int`, optional) : Max attempts including first request,
+            defaults to :obj:`vlivepy.variables.override_retry_attempts`.
+        backoff (:class:`float`, optional) : Base delay(seconds) of first retry,
+            defaults to :obj:`vlivepy.variables.override_retry_backoff`.
+        backoff_max (:class:`float`, optional) : Max delay(seconds) between retries,
+            defaults to :obj:`vlivepy.variables.override_retry_backoff_max`.
+        jitter (:class:`bool`, optional) : Randomize delay between 0 and backoff, defaults to True.
+        retry_status (:class:`Iterable[int]`, optional) : Status codes to retry,
+            defaults to 429, 500, 502, 503, 504.
+        retry_exceptions (:class:`tuple`, optional) : Exception types to retry,
+            defaults to connection error, timeout and broken response.
+        retry_methods (:class:`Iterable[str]`, optional) : Idempotent HTTP methods to retry,
+            defaults to GET, HEAD and OPTIONS.
+    """
+
+    __slots__ = ['max_attempts', 'backoff', 'backoff_max', 'jitter', 'retry_status', 'retry_exceptions',
+                 'retry_methods']
+
+    def __init__(
+            self,
+            max_attempts: int = None,
+            backoff: float = None,
+            backoff_max: float = None,
+            jitter: bool = True,
+            retry_status: Iterable[int] = (429, 500, 502, 503, 504),
+            retry_exceptions: Tuple[type, ...] = (ConnectionError, Timeout, ChunkedEncodingError),
+            retry_methods: Iterable[str] = ("GET", "HEAD", "OPTIONS")
+    ):
+        self.max_attempts = gv.override_retry_attempts if max_attempts is None else max_attempts
+        self.backoff = gv.override_retry_backoff if backoff is None else backoff
+        self.backoff_max = gv.override_retry_backoff_max if backoff_max is None else backoff_max
+        self.jitter = jitter
+        self.retry_status = frozenset(retry_status)
+        self.retry_exceptions = tuple(retry_exceptions)
+        self.retry_methods = frozenset(method.upper() for method in retry_methods)
+
+    def __repr__(self):
+        return "<RetryPolicy [%s attempts, %ss~%ss]>" % (self.max_attempts, self.backoff, self.backoff_max)
+
+    def attempts_for(
+            self,
+            method: str
+    ) -> int:
+        """Get max attempts of request with the HTTP method. Method out of :obj:`retry_methods` is sent once."""
+        return self.max_attempts if method.upper() in self.retry_methods else min(self.max_attempts, 1)
+
+    def is_retryable_status(
+            self,
+            status_code: int
+    ) -> bool:
+        """Check the status code is transient failure."""
+        return status_code in self.retry_status
+
+    def is_retryable_exception(
+            self,
+            exception: BaseException
+    ) -> bool:
+        """Check the exception is transient failure."""
+        return isinstance(exception, self.retry_exceptions)
+
+    def delay(
+            self,
+            attempt: int,
+            retry_after: Optional[str] = None
+    ) -> float:
+        """Get delay before next attempt.
+
+        Arguments:
+            attempt (:class:`int`) : Count of failed attempts.
+            retry_after (:class:`str`, optional) : ``Retry-After`` header of failed response, defaults to None.
+
+        Returns:
+            :class:`float`. Seconds to wait.
+        """
+        if retry_after is not None and retry_after.isdigit():
+            return min(float(retry_after), self.backoff_max)
+
+        delay = min(self.backoff * (2 ** (attempt - 1)), self.backoff_max)
+        if self.jitter:
+            delay = uniform(0, delay)
+
+        return delay
+
+
+class CircuitBreaker(object):
+    """Circuit breaker of an endpoint.
+
+    After :obj:`failure_threshold` consecutive failed requests, the circuit is opened and requests fail
+    immediately without network. Router records a request once after its retries, so one failed request
+    with every retry counts as one failure. After :obj:`reset_timeout` seconds, one trial request is allowed.
+    The circuit is closed if the trial succeeds, or opened again if it fails.
+
+    Arguments:
+        failure_threshold (:class:`int`) : Consecutive failed requests to open circuit.
+        reset_timeout (:class:`float`) : Seconds to wait before trial request.
+    """
+
+    __slots__ = ['failure_threshold', 'reset_timeout', '__failures', '__opened_at', '__trial', '__lock']
+
+    def __init__(
+            self,
+            failure_threshold: int,
+            reset_timeout: float
+    ):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.__failures = 0
+        self.__opened_at = None
+        self.__trial = False
+        self.__lock = Lock()
+
+    def __repr__(self):
+        return "<CircuitBreaker [%s]>" % self.state
+
+    @property
+    def state(self) -> str:
+        """State of circuit.
+
+        Returns:
+            "CLOSED" if requests are allowed.
+            "OPEN" if requests fail immediately.
+            "HALF_OPEN" if trial request is allowed.
+
+        :rtype: :class:`str`
+        """
+        if self.__opened_at is None:
+            return "CLOSED"
+        elif monotonic() - self.__opened_at >= self.reset_timeout:
+            return "HALF_OPEN"
+        else:
+            return "OPEN"
+
+    def allow(self) -> bool:
+        """Check request is allowed. Only one trial request is allowed while half-open."""
+        with self.__lock:
+            state = self.state
+            if state == "CLOSED":
+                return True
+            elif state == "HALF_OPEN" and not self.__trial:
+                self.__trial = True
+                return True
+            else:
+                return False
+
+    def record_success(self) -> None:
+        """Close circuit."""
+        with self.__lock:
+            self.__failures = 0
+            self.__opened_at = None
+            self.__trial = False
+
+    def record_failure(self) -> None:
+        """Count failure and open circuit when it reaches threshold."""
+        with self.__lock:
+            self.__failures += 1
+            if self.__trial or self.__failures >= self.failure_threshold:
+                self.__opened_at = monotonic()
+                self.__trial = False
+
+    def release(self) -> None:
+        """Finish request without judging health of endpoint."""
+        with self.__lock:
+            if self.__trial:
+                self.__trial = False
+                self.__opened_at = monotonic() - self.reset_timeout
+
+    def reset(self) -> None:
+        """Close circuit and clear failures."""
+        self.record_success()
+
+
+_policy_lock = Lock()
+_policy: Optional[RetryPolicy] = None
+_scoped_policy: ContextVar[Optional[RetryPolicy]] = ContextVar("vlivepy_retry_policy", default=None)
+_breakers: Dict[str, CircuitBreaker] = {}
+
+
+def getRetryPolicy() -> RetryPolicy:
+    """Get retry policy of current context.
+    This is the policy of innermost :func:`usePolicy` block, or process-wide policy.
+
+    Returns:
+        :class:`RetryPolicy`
+    """
+    global _policy
+
+    scoped = _scoped_policy.get()
+    if scoped is not None:
+        return scoped
+
+    if _policy is None:
+        with _policy_lock:
+            if _policy is None:
+                _policy = RetryPolicy()
+
+    return _policy
+
+
+def configureRetry(
+        policy: RetryPolicy = None
+) -> None:
+    """Replace process-wide retry policy.
+
+    Arguments:
+        policy (:class:`RetryPolicy`, optional) : New policy, defaults to policy from override variables.
+    """
+    global _policy
+
+    with _policy_lock:
+        _policy = policy if policy is not None else RetryPolicy()
+
+
+@contextmanager
+def usePolicy(
+        policy: RetryPolicy
+):
+    """Use retry policy for every request inside `with` block of current thread(or task).
+
+    .. code-block:: python
+
+        with usePolicy(RetryPolicy(max_attempts=10, backoff_max=60)):
+            for comment in getPostCommentsIter("0-12345678"):
+                ...
+
+    Arguments:
+        policy (:class:`RetryPolicy`) : Policy to use.
+    """
+    token = _scoped_policy.set(policy)
+    try:
+        yield policy
+    finally:
+        _scoped_policy.reset(token)
+
+
+def getCircuitBreaker(
+        key: str
+) -> CircuitBreaker:
+    """Get circuit breaker of the endpoint.
+
+    Arguments:
+        key (:class:`str`) : Endpoint name (e.g endpoint_vod_play_info) or host.
+
+    Returns:
+        :class:`CircuitBreaker`
+    """
+    breaker = _breakers.get(key)
+    if breaker is None:
+        with _policy_lock:
+            breaker = _breakers.get(key)
+            if breaker is None:
+                breaker = CircuitBreaker(gv.override_breaker_threshold, gv.override_breaker_reset_timeout)
+                _breakers[key] = breaker
+
+    return breaker
+
+
+def resetCircuitBreakers() -> None:
+    """Close every circuit breaker."""
+    for breaker in list(_breakers.values()):
+        breaker.reset()
@@ -1,12 +1,148 @@
 # -*- coding: utf-8 -*-
 
+from time import perf_counter, sleep
+from urllib.parse import urlparse
+
 import reqWrapper
+from requests import Session
+
+from . import variables as gv
+from .cache import ResponseCache, getCache, session_identity
+from .exception import APIBadRequestError, APINetworkError
+from .hooks import RequestInfo, dispatch, dispatch_cached
+from .pool import getPoolSession
+from .ratelimit import getRateLimiter
+from .retry import RetryPolicy, getCircuitBreaker, getRetryPolicy
+from .singleflight import SingleFlight
+from .transport import getTransport
+
+_flight = SingleFlight()
+
+
+class FailedResponse(reqWrapper.SafeResponse):
+    """Failed :class:`reqWrapper.SafeResponse` keeping status code of the last response.
+
+    Attributes:
+        last_status (:class:`int`) : Status code of the last response. None if no response was received.
+    """
+
+    def __init__(self, last_status: int = None):
+        super().__init__(success=False)
+        self.last_status = last_status
+
+
+def network_error(sr: reqWrapper.SafeResponse) -> APINetworkError:
+    """Get exception for failed response to raise with :func:`vlivepy.exception.auto_raise`.
+
+    Returns:
+        :class:`vlivepy.exception.APIBadRequestError` if server rejected request with status 400,
+        else :class:`vlivepy.exception.APINetworkError`.
+    """
+    if getattr(sr, "last_status", None) == 400:
+        return APIBadRequestError("Server rejected request with status 400")
+    return APINetworkError()
+
+
+def request(
+        method,
+        url,
+        session: Session,
+        status=None,
+        endpoint: str = None,
+        retry_policy: RetryPolicy = None,
+        identity: str = "",
+        **kwargs
+) -> reqWrapper.SafeResponse:
+    if status is None:
+        status = []
+    elif type(status) == int:
+        status = [status]
+    status = reqWrapper.StatusFilter(status)
+
+    if retry_policy is None:
+        retry_policy = getRetryPolicy()
+    breaker = getCircuitBreaker(endpoint or urlparse(url).hostname)
+    limiter = getRateLimiter()
+    transport = getTransport()
+
+    if not breaker.allow():
+        return FailedResponse()
+
+    max_attempts = retry_policy.attempts_for(method)
+    attempt = 0
+    last_status = None
+    # Circuit breaker judges the call once after retries, not each attempt
+    healthy = None
+    while attempt < max_attempts:
+        attempt += 1
+        info = RequestInfo(method, url, kwargs.get('params'), endpoint, attempt)
+        if transport.uses_network:
+            info.wait = limiter.acquire(url)
+        dispatch("before_request", info)
+        retry_after = None
+        started = perf_counter()
+        try:
+            res = transport.request(method, url, session, endpoint=endpoint, identity=identity, **kwargs)
+        except Exception as e:
+            last_status = None
+            info.error = e
+            info.total = perf_counter() - started
+            dispatch("on_error", info)
+            if not retry_policy.is_retryable_exception(e):
+                healthy = None
+                break
+            healthy = False
+        else:
+            last_status = res.status_code
+            info.set_response(res, perf_counter() - started)
+            dispatch("after_response", info)
+            if status.check(res.status_code):
+                breaker.record_success()
+                return reqWrapper.SafeResponse(success=True, response=res, session=session)
+            elif not retry_policy.is_retryable_status(res.status_code):
+                healthy = True
+                break
+            healthy = False
+            retry_after = res.headers.get("Retry-After")
+
+        if attempt < max_attempts:
+            sleep(retry_policy.delay(attempt, retry_after))
+
+    if healthy is None:
+        breaker.release()
+    elif healthy:
+        breaker.record_success()
+    else:
+        breaker.record_failure()
+
+    return FailedResponse(last_status)
 
 
 def rew_get(url, session=None, **kwargs) -> reqWrapper.SafeResponse:
     if session:
         local_session = session.session
     else:
-        local_session = None
+        local_session = getPoolSession()
+
+    kwargs.setdefault('allow_redirects', True)
+    params = kwargs.get('params')
+    endpoint = kwargs.get('endpoint')
+
+    cache = getCache()
+    if cache is not None:
+        res = cache.get("get", url, params, session, endpoint)
+        if res is not None:
+            dispatch_cached(url, params, endpoint, res)
+            return reqWrapper.SafeResponse(success=True, response=res, session=local_session)
 
-    return reqWrapper.get(url=url, session=local_session, **kwargs)
+    def fetch():
+        sr = request("get", url, session=local_session, identity=session_identity(session), **kwargs)
+        if cache is not None and sr.success:
+            cache.set("get", url, sr.response, params, session, endpoint)
+        return sr
+
+    if gv.override_single_flight:
+        key = (ResponseCache.make_key("get", url, params, session), endpoint, repr(kwargs.get('status')))
+        return _flight.do(key, fetch)
+    else:
+        return fetch()
@@ -6,15 +6,18 @@ from typing import (
 
 from . import variables as gv
 from .exception import auto_raise, APINetworkError
-from .parser import response_json_stripper
+from .parser import response_json_loader, response_json_stripper
 from .router import rew_get
 from .session import UserSession
+from .tracing import traced
 
 
+@traced
 def getScheduleData(
         schedule_id: str,
         session: UserSession,
-        silent: bool = False
+        silent: bool = False,
+        fields: str = "full"
 ) -> Optional[dict]:
     """Get detailed schedule data.
 
@@ -22,16 +25,18 @@ def getScheduleData(
         schedule_id (:class:`str`) : Unique id of the schedule to load data.
         session (:class:`vlivepy.UserSession`) : Session for loading data with permission.
         silent (:class:`bool`, optional) : Return None instead of raising exception, defaults to False.
+        fields (:class:`str`, optional) : Field profile ("minimal", "listing" or "full") or comma separated fields,
+            defaults to "full".
 
     Returns:
         :class:`dict`. Parsed json data
     """
 
-    sr = rew_get(**gv.endpoint_schedule_data(schedule_id),
-                 wait=0.5, session=session, status=[200, 403])
+    sr = rew_get(**gv.endpoint_schedule_data(schedule_id, fields), endpoint="endpoint_schedule_data",
+                 session=session, status=[200, 403])
 
     if sr.success:
-        return response_json_stripper(sr.response.json(), silent=silent)
+        return response_json_stripper(response_json_loader(sr.response), silent=silent)
     else:
         auto_raise(APINetworkError, silent)
 
@@ -13,6 +13,7 @@ from .exception import (
     APINetworkError,
 )
 from . import variables as gv
+from .router import request
 
 
 def getUserSession(
@@ -32,8 +33,8 @@ def getUserSession(
     """
 
     # Make request
-    sr = reqWrapper.post(**gv.endpoint_auth(email, pwd),
-                         wait=0.5, status=[200])
+    sr = request("post", **gv.endpoint_auth(email, pwd), session=reqWrapper.Session(),
+                 status=[200], endpoint="endpoint_auth")
 
     if sr.success:
         # Case <Sign-in Failed (Exception)>
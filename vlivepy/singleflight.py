@@ -0,0 +1,139 @@
+# -*- coding: utf-8 -*-
+
+import asyncio
+from threading import Event, Lock
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    Hashable,
+)
+
+
+class _Call(object):
+    __slots__ = ['event', 'result', 'error']
+
+    def __init__(self):
+        self.event = Event()
+        self.result = None
+        self.error = None
+
+
+class SingleFlight(object):
+    """Coalesce concurrent identical calls of threads.
+
+    While a call with a key is running, other calls with same key wait for it and get its result
+    instead of running again. Results are not kept after the call is finished.
+    """
+
+    __slots__ = ['__calls', '__lock']
+
+    def __init__(self):
+        self.__calls: Dict[Hashable, _Call] = {}
+        self.__lock = Lock()
+
+    def __repr__(self):
+        return "<SingleFlight [%d in flight]>" % len(self.__calls)
+
+    def do(
+            self,
+            key: Hashable,
+            fn: Callable[[], Any]
+    ) -> Any:
+        """Run :obj:`fn` or wait for running call of same key.
+
+        Arguments:
+            key (:class:`Hashable`) : Key of call.
+            fn (:class:`Callable`) : Function to run.
+
+        Returns:
+            Result of :obj:`fn`. Exception of :obj:`fn` is raised to every waiting caller.
+        """
+        with self.__lock:
+            call = self.__calls.get(key)
+            if call is None:
+                call = _Call()
+                self.__calls[key] = call
+                leader = True
+            else:
+                leader = False
+
+        if not leader:
+            call.event.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = fn()
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self.__lock:
+                del self.__calls[key]
+            call.event.set()
+
+        return call.result
+
+
+class AsyncSingleFlight(object):
+    """Coalesce concurrent identical calls of coroutines.
+    Coroutine version of :class:`SingleFlight`. Calls are coalesced only within same event loop.
+    """
+
+    __slots__ = ['__calls']
+
+    def __init__(self):
+        self.__calls: Dict[Hashable, asyncio.Future] = {}
+
+    def __repr__(self):
+        return "<AsyncSingleFlight [%d in flight]>" % len(self.__calls)
+
+    async def do(
+            self,
+            key: Hashable,
+            fn: Callable[[], Awaitable[Any]]
+    ) -> Any:
+        """Await :obj:`fn` or wait for running call of same key.
+
+        Arguments:
+            key (:class:`Hashable`) : Key of call.
+            fn (:class:`Callable`) : Coroutine function to await.
+
+        Returns:
+            Result of :obj:`fn`. Exception of :obj:`fn` is raised to every waiting caller.
+        """
+        loop = asyncio.get_running_loop()
+        key = (id(loop), key)
+
+        while True:
+            future = self.__calls.get(key)
+            if future is None:
+                break
+
+            try:
+                return await asyncio.shield(future)
+            except asyncio.CancelledError:
+                # Leader was cancelled. Run again unless this task is cancelled too.
+                if not future.cancelled():
+                    raise
+
+        future = loop.create_future()
+        self.__calls[key] = future
+        try:
+            result = await fn()
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except BaseException as e:
+            future.set_exception(e)
+            # Mark retrieved so unawaited future doesn't log the exception
+            future.exception()
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            del self.__calls[key]
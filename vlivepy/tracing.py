@@ -0,0 +1,346 @@
+# -*- coding: utf-8 -*-
+
+import json
+from collections import deque
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import wraps
+from inspect import iscoroutinefunction
+from random import getrandbits
+from threading import Lock
+from time import time_ns
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    List,
+    Optional,
+)
+
+from .hooks import RequestInfo, addHook, removeHook
+
+# Span kinds of OpenTelemetry
+SpanKindInternal = 1
+SpanKindClient = 3
+
+
+class Span(object):
+    """This is the object for one traced operation.
+
+    Attributes:
+        name (:class:`str`) : Name of operation.
+        trace_id (:class:`str`) : 32 hex digits id shared by spans of one trace.
+        span_id (:class:`str`) : 16 hex digits id of this span.
+        parent_id (:class:`str`) : Span id of parent span. None for root span.
+        kind (:class:`int`) : OpenTelemetry span kind. 1 for function, 3 for HTTP request.
+        start (:class:`int`) : Start time in epoch nanoseconds.
+        end (:class:`int`) : End time in epoch nanoseconds. None while running.
+        attributes (:class:`dict`) : Attributes of span.
+        error (:class:`str`) : Error message if the operation raised exception.
+    """
+
+    __slots__ = ['name', 'trace_id', 'span_id', 'parent_id', 'kind', 'start', 'end', 'attributes', 'error']
+
+    def __init__(
+            self,
+            name: str,
+            parent: Optional["Span"] = None,
+            kind: int = SpanKindInternal,
+            attributes: Dict[str, Any] = None
+    ):
+        self.name = name
+        self.trace_id = parent.trace_id if parent is not None else "%032x" % getrandbits(128)
+        self.span_id = "%016x" % getrandbits(64)
+        self.parent_id = parent.span_id if parent is not None else None
+        self.kind = kind
+        self.start = time_ns()
+        self.end = None
+        self.attributes = dict(attributes) if attributes else {}
+        self.error = None
+
+    def __repr__(self):
+        return "<Span [%s %s]>" % (self.name, self.span_id)
+
+    @property
+    def duration(self) -> Optional[float]:
+        """Duration in seconds. None while running.
+
+        :rtype: :class:`float`
+        """
+        if self.end is None:
+            return None
+        return (self.end - self.start) / 1e9
+
+    def set_attribute(
+            self,
+            key: str,
+            value: Any
+    ) -> None:
+        """Set attribute of span."""
+        self.attributes[key] = value
+
+    def finish(
+            self,
+            error: BaseException = None
+    ) -> None:
+        """End span and store it to finished spans."""
+        self.end = time_ns()
+        if error is not None:
+            self.error = "%s: %s" % (type(error).__name__, error)
+        _store(self)
+
+    def to_otlp(self) -> dict:
+        """Convert span to OpenTelemetry(OTLP) JSON span.
+
+        :rtype: :class:`dict`
+        """
+        data = {
+            "traceId": self.trace_id,
+            "spanId": self.span_id,
+            "name": self.name,
+            "kind": self.kind,
+            "startTimeUnixNano": str(self.start),
+            "endTimeUnixNano": str(self.end),
+            "attributes": [{"key": key, "value": _otlp_value(value)} for key, value in self.attributes.items()],
+            "status": {"code": 2, "message": self.error} if self.error else {"code": 1},
+        }
+        if self.parent_id is not None:
+            data["parentSpanId"] = self.parent_id
+
+        return data
+
+
+def _otlp_value(value) -> dict:
+    if isinstance(value, bool):
+        return {"boolValue": value}
+    elif isinstance(value, int):
+        return {"intValue": str(value)}
+    elif isinstance(value, float):
+        return {"doubleValue": value}
+    else:
+        return {"stringValue": str(value)}
+
+
+_enabled = False
+_current: ContextVar[Optional[Span]] = ContextVar("vlivepy_span", default=None)
+_spans_lock = Lock()
+_spans: deque = deque(maxlen=100000)
+_request_spans: Dict[int, Span] = {}
+
+
+def _store(span: Span) -> None:
+    with _spans_lock:
+        _spans.append(span)
+
+
+def currentSpan() -> Optional[Span]:
+    """Get running span of current context.
+
+    Returns:
+        :class:`Span`. None if tracing is disabled or no span is running.
+    """
+    return _current.get()
+
+
+@contextmanager
+def span(
+        name: str,
+        kind: int = SpanKindInternal,
+        **attributes
+):
+    """Trace the `with` block as child span of current span. Nothing is done while tracing is disabled.
+
+    .. code-block:: python
+
+        with span("crawl", channel="FD53B"):
+            ...
+
+    Arguments:
+        name (:class:`str`) : Name of span.
+        kind (:class:`int`, optional) : OpenTelemetry span kind, defaults to internal.
+        **attributes : Attributes of span.
+
+    Yields:
+        :class:`Span`. None if tracing is disabled.
+    """
+    if not _enabled:
+        yield None
+        return
+
+    item = Span(name, _current.get(), kind, attributes)
+    token = _current.set(item)
+    try:
+        yield item
+    except BaseException as e:
+        item.finish(e)
+        raise
+    else:
+        item.finish()
+    finally:
+        _current.reset(token)
+
+
+def _span_name(func: Callable) -> str:
+    module = func.__module__
+    if module.startswith("vlivepy."):
+        module = module[len("vlivepy."):]
+    return "%s.%s" % (module, func.__qualname__)
+
+
+def _args_repr(args, kwargs) -> str:
+    items = [repr(arg) for arg in args]
+    items.extend("%s=%r" % (key, value) for key, value in kwargs.items() if key != "session")
+    text = ", ".join(items)
+    return text if len(text) <= 200 else text[:197] + "..."
+
+
+def traced(
+        func: Callable = None,
+        name: str = None
+):
+    """Decorator tracing every call of the function (or coroutine function) as span.
+    Arguments of the call are recorded as ``vlivepy.args`` attribute.
+
+    .. code-block:: python
+
+        @traced
+        def crawl(channel_code):
+            ...
+
+    Arguments:
+        func (:class:`Callable`) : Function to trace.
+        name (:class:`str`, optional) : Name of span, defaults to module and name of the function.
+    """
+    if func is None:
+        return lambda decorated: traced(decorated, name=name)
+
+    span_name = name or _span_name(func)
+
+    if iscoroutinefunction(func):
+        @wraps(func)
+        async def async_wrapper(*args, **kwargs):
+            if not _enabled:
+                return await func(*args, **kwargs)
+            with span(span_name, **{"vlivepy.args": _args_repr(args, kwargs)}):
+                return await func(*args, **kwargs)
+
+        return async_wrapper
+
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        if not _enabled:
+            return func(*args, **kwargs)
+        with span(span_name, **{"vlivepy.args": _args_repr(args, kwargs)}):
+            return func(*args, **kwargs)
+
+    return wrapper
+
+
+def _before_request(info: RequestInfo) -> None:
+    item = Span("%s %s" % (info.method, info.endpoint or info.url), _current.get(), SpanKindClient, {
+        "http.method": info.method,
+        "http.url": info.url,
+        "vlivepy.endpoint": info.endpoint or "",
+        "vlivepy.attempt": info.attempt,
+        "vlivepy.ratelimit_wait": info.wait,
+    })
+    _request_spans[id(info)] = item
+
+
+def _after_response(info: RequestInfo) -> None:
+    item = _request_spans.pop(id(info), None)
+    if item is None:
+        # Served from cache
+        item = Span("%s %s" % (info.method, info.endpoint or info.url), _current.get(), SpanKindClient, {
+            "http.method": info.method,
+            "http.url": info.url,
+            "vlivepy.endpoint": info.endpoint or "",
+        })
+    item.set_attribute("http.status_code", info.status_code)
+    item.set_attribute("http.response_content_length", info.bytes)
+    item.set_attribute("vlivepy.cached", info.cached)
+    item.finish()
+
+
+def _on_error(info: RequestInfo) -> None:
+    item = _request_spans.pop(id(info), None)
+    if item is not None:
+        item.finish(info.error)
+
+
+def enableTracing(
+        max_spans: int = 100000
+) -> None:
+    """Start tracing get* functions, model refresh and HTTP requests.
+
+    Arguments:
+        max_spans (:class:`int`, optional) : Max finished spans to keep. Oldest spans are dropped, defaults to 100000.
+    """
+    global _enabled, _spans
+
+    with _spans_lock:
+        _spans = deque(_spans, maxlen=max_spans)
+
+    if not _enabled:
+        _enabled = True
+        addHook("before_request", _before_request)
+        addHook("after_response", _after_response)
+        addHook("on_error", _on_error)
+
+
+def disableTracing() -> None:
+    """Stop tracing. Finished spans are kept."""
+    global _enabled
+
+    if _enabled:
+        _enabled = False
+        removeHook("before_request", _before_request)
+        removeHook("after_response", _after_response)
+        removeHook("on_error", _on_error)
+
+
+def getSpans() -> List[Span]:
+    """Get finished spans in finished order.
+
+    Returns:
+        :class:`List[Span]`
+    """
+    with _spans_lock:
+        return list(_spans)
+
+
+def clearSpans() -> None:
+    """Drop finished spans."""
+    with _spans_lock:
+        _spans.clear()
+
+
+def exportSpans() -> dict:
+    """Export finished spans as OpenTelemetry(OTLP) JSON.
+    The result can be sent to OTLP/HTTP collector (``/v1/traces``) or loaded by trace viewers.
+
+    Returns:
+        :class:`dict`
+    """
+    from . import __version__
+
+    return {
+        "resourceSpans": [{
+            "resource": {"attributes": [{"key": "service.name", "value": {"stringValue": "vlivepy"}}]},
+            "scopeSpans": [{
+                "scope": {"name": "vlivepy", "version": __version__},
+                "spans": [item.to_otlp() for item in getSpans()],
+            }],
+        }]
+    }
+
+
+def dumpSpans(
+        fp
+) -> None:
+    """Write finished spans as OpenTelemetry(OTLP) JSON.
+
+    Arguments:
+        fp (Any) : TextIOWrapper to write json.
+    """
+    json.dump(exportSpans(), fp)
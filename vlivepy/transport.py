@@ -0,0 +1,376 @@
+# -*- coding: utf-8 -*-
+
+import base64
+import json
+import os
+import ssl
+from contextlib import contextmanager
+from contextvars import ContextVar
+from hashlib import sha1
+from threading import Lock
+from typing import (
+    Dict,
+    Optional,
+)
+
+from http.cookiejar import CookieJar
+
+from requests import Response, Session
+from requests.exceptions import ConnectionError, Timeout
+
+from . import variables as gv
+from .cache import build_response
+from .exception import ReplayMissError
+from .pool import _RejectCookiePolicy
+
+
+def identity_hash(
+        identity: str
+) -> str:
+    """Hash identity of session for records, not to write email of :class:`vlivepy.UserSession` to file.
+    Empty string for anonymous request."""
+    if identity:
+        return sha1(identity.encode()).hexdigest()
+    else:
+        return ""
+
+
+def request_key(
+        method: str,
+        url: str,
+        params: Optional[dict] = None,
+        identity: str = ""
+) -> str:
+    """Make key of request for recording and replay. Body of request is not used.
+    Requests of :class:`vlivepy.UserSession` are keyed with `identity`, so they aren't mixed with anonymous requests.
+    """
+    raw = [method.upper(), url, sorted((params or {}).items())]
+    if identity:
+        raw.append(identity)
+    return sha1(json.dumps(raw, default=str).encode()).hexdigest()
+
+
+class Transport(object):
+    """Base class of transport which sends request and returns response.
+    Every request of vlivepy is sent by transport from :func:`getTransport` at call time.
+
+    Subclass should override :meth:`request`.
+    Requests of transport whose :obj:`uses_network` is False are not rate limited.
+    """
+
+    __slots__ = []
+
+    uses_network = True
+
+    def request(
+            self,
+            method: str,
+            url: str,
+            session: Session,
+            endpoint: str = None,
+            identity: str = "",
+            **kwargs
+    ) -> Response:
+        """Send request.
+
+        Arguments:
+            method (:class:`str`) : HTTP method.
+            url (:class:`str`) : Request url.
+            session (:class:`requests.Session`) : Session of request (pool session or session of UserSession).
+            endpoint (:class:`str`, optional) : Name of endpoint, defaults to None.
+            identity (:class:`str`, optional) : Identity of :class:`vlivepy.UserSession`
+                (:func:`vlivepy.cache.session_identity`), defaults to empty string for anonymous request.
+            **kwargs : Arguments of :meth:`requests.Session.request`
+
+        Returns:
+            :class:`requests.Response`
+        """
+        raise NotImplementedError
+
+
+class SessionTransport(Transport):
+    """Default transport. Send request with the session."""
+
+    __slots__ = []
+
+    def __repr__(self):
+        return "<SessionTransport>"
+
+    def request(self, method, url, session, endpoint=None, identity="", **kwargs) -> Response:
+        return session.request(method=method, url=url, **kwargs)
+
+
+class OfflineTransport(Transport):
+    """Transport which never touches network. Every request raises :class:`vlivepy.exception.ReplayMissError`,
+    so only responses from :mod:`vlivepy.cache` are served.
+    """
+
+    __slots__ = []
+
+    uses_network = False
+
+    def __repr__(self):
+        return "<OfflineTransport>"
+
+    def request(self, method, url, session, endpoint=None, identity="", **kwargs) -> Response:
+        raise ReplayMissError("Offline: %s %s" % (method.upper(), url))
+
+
+class RecordingTransport(Transport):
+    """Transport which writes every request/response pair to directory as JSON file.
+    Recorded directory can be served by :class:`ReplayTransport`.
+
+    Body of request (e.g. password of sign-in) and ``Set-Cookie`` header are not recorded.
+    Requests of :class:`vlivepy.UserSession` are recorded with hash of its identity, apart from anonymous requests.
+
+    Arguments:
+        directory (:class:`str`) : Directory to write records.
+        transport (:class:`Transport`, optional) : Transport sending actual request,
+            defaults to :class:`SessionTransport`.
+    """
+
+    __slots__ = ['directory', 'transport']
+
+    def __init__(
+            self,
+            directory: str,
+            transport: Transport = None
+    ):
+        self.directory = directory
+        self.transport = transport if transport is not None else SessionTransport()
+        os.makedirs(directory, exist_ok=True)
+
+    def __repr__(self):
+        return "<RecordingTransport [%s]>" % self.directory
+
+    @property
+    def uses_network(self) -> bool:
+        return self.transport.uses_network
+
+    def request(self, method, url, session, endpoint=None, identity="", **kwargs) -> Response:
+        res = self.transport.request(method, url, session, endpoint=endpoint, identity=identity, **kwargs)
+
+        params = kwargs.get('params')
+        identity = identity_hash(identity)
+        key = request_key(method, url, params, identity)
+        headers = {k: v for k, v in res.headers.items() if k.lower() != "set-cookie"}
+        record = {
+            "endpoint": endpoint,
+            "method": method.upper(),
+            "url": url,
+            "params": params,
+            "identity": identity,
+            "status": res.status_code,
+            "headers": headers,
+            "response_url": str(res.url),
+            "encoding": res.encoding,
+            "body": base64.b64encode(res.content).decode(),
+        }
+        path = os.path.join(self.directory, "%s-%s.json" % (endpoint or "request", key))
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(record, f, ensure_ascii=False, indent=1, default=str)
+
+        return res
+
+
+class ReplayTransport(Transport):
+    """Transport which serves responses recorded by :class:`RecordingTransport` without network.
+    Requests are matched by method, url, params and identity of session.
+
+    Arguments:
+        directory (:class:`str`) : Directory of records.
+        fallback (:class:`Transport`, optional) : Transport for requests not recorded.
+            If it is None, :class:`vlivepy.exception.ReplayMissError` is raised. Defaults to None.
+    """
+
+    __slots__ = ['directory', 'fallback', '__records']
+
+    def __init__(
+            self,
+            directory: str,
+            fallback: Transport = None
+    ):
+        self.directory = directory
+        self.fallback = fallback
+        self.__records: Dict[str, dict] = {}
+
+        for name in sorted(os.listdir(directory)):
+            if not name.endswith(".json"):
+                continue
+            with open(os.path.join(directory, name), encoding="utf-8") as f:
+                record = json.load(f)
+            record['content'] = base64.b64decode(record.pop('body'))
+            key = request_key(record['method'], record['url'], record['params'], record.get('identity', ""))
+            self.__records[key] = record
+
+    def __repr__(self):
+        return "<ReplayTransport [%s, %d records]>" % (self.directory, len(self.__records))
+
+    def __len__(self):
+        return len(self.__records)
+
+    @property
+    def uses_network(self) -> bool:
+        return self.fallback is not None and self.fallback.uses_network
+
+    def request(self, method, url, session, endpoint=None, identity="", **kwargs) -> Response:
+        record = self.__records.get(request_key(method, url, kwargs.get('params'), identity_hash(identity)))
+        if record is None:
+            if self.fallback is not None:
+                return self.fallback.request(method, url, session, endpoint=endpoint, identity=identity, **kwargs)
+            raise ReplayMissError("%s %s" % (method.upper(), url))
+
+        return build_response(
+            record['status'], record['headers'], record['response_url'], record['content'], record['encoding']
+        )
+
+
+class HTTP2Transport(Transport):
+    """Transport which sends requests over HTTP/2 with :class:`httpx.Client`.
+    Concurrent requests to same host are multiplexed as streams over one connection,
+    instead of taking one HTTP/1.1 connection per request.
+
+    Cookies of the session are sent and cookies of response are stored to the session,
+    so :class:`vlivepy.UserSession` works same as :class:`SessionTransport`.
+
+    Caution:
+        This requires httpx with http2 support. Install it with ``pip install vlivepy[http2]``
+
+    Arguments:
+        max_connections (:class:`int`, optional) : Max connections of client, defaults to 10.
+        timeout (:class:`float`, optional) : Timeout(seconds) of request, defaults to 10.
+        verify (:class:`Union[bool, str]`, optional) : Verify TLS certificate, or path of CA bundle.
+            Defaults to True.
+    """
+
+    __slots__ = ['client', '__httpx']
+
+    def __init__(
+            self,
+            max_connections: int = 10,
+            timeout: float = 10,
+            verify=True
+    ):
+        try:
+            import httpx
+        except ImportError:
+            raise ImportError("HTTP2Transport requires httpx. Install it with `pip install vlivepy[http2]`")
+
+        self.__httpx = httpx
+        if isinstance(verify, str):
+            verify = ssl.create_default_context(cafile=verify)
+        self.client = httpx.Client(
+            http2=True,
+            limits=httpx.Limits(max_connections=max_connections),
+            timeout=timeout,
+            verify=verify,
+            cookies=CookieJar(policy=_RejectCookiePolicy()),
+        )
+
+    def __repr__(self):
+        return "<HTTP2Transport>"
+
+    def request(self, method, url, session, endpoint=None, identity="", **kwargs) -> Response:
+        httpx = self.__httpx
+        jar = httpx.Cookies(session.cookies)
+        allow_redirects = kwargs.get('allow_redirects', True)
+        options = {key: kwargs[key] for key in ('params', 'headers', 'data', 'timeout') if key in kwargs}
+        req = self.client.build_request(method, url, **options)
+
+        try:
+            while True:
+                jar.set_cookie_header(req)
+                res = self.client.send(req)
+                jar.extract_cookies(res)
+                if not (allow_redirects and res.next_request is not None):
+                    break
+                req = res.next_request
+        except httpx.TimeoutException as e:
+            raise Timeout(e)
+        except httpx.TransportError as e:
+            raise ConnectionError(e)
+
+        return build_response(res.status_code, dict(res.headers), str(res.url), res.content, res.encoding)
+
+    def close(self) -> None:
+        """Close client and its connections."""
+        self.client.close()
+
+
+_transport_lock = Lock()
+_default_transport = SessionTransport()
+_http2_transport: Optional[HTTP2Transport] = None
+_transport: Optional[Transport] = None
+_scoped_transport: ContextVar[Optional[Transport]] = ContextVar("vlivepy_transport", default=None)
+
+
+def getTransport() -> Transport:
+    """Get transport used by every request.
+
+    Returns:
+        :class:`Transport`. This is the transport of innermost :func:`useTransport` block, or process-wide transport.
+        If transport is not set, :class:`HTTP2Transport` when :obj:`vlivepy.variables.override_http2` is True,
+        otherwise :class:`SessionTransport`.
+    """
+    global _http2_transport
+
+    transport = _scoped_transport.get()
+    if transport is not None:
+        return transport
+
+    transport = _transport
+    if transport is not None:
+        return transport
+
+    if gv.override_http2:
+        if _http2_transport is None:
+            with _transport_lock:
+                if _http2_transport is None:
+                    _http2_transport = HTTP2Transport()
+        return _http2_transport
+
+    return _default_transport
+
+
+def setTransport(
+        transport: Transport = None
+) -> None:
+    """Replace transport used by every request.
+
+    .. code-block:: python
+
+        from vlivepy.transport import RecordingTransport, ReplayTransport, setTransport
+
+        setTransport(RecordingTransport("records"))  # record with live VLIVE
+        ...
+        setTransport(ReplayTransport("records"))  # replay offline
+
+    Arguments:
+        transport (:class:`Transport`, optional) : New transport, defaults to transport by
+            :obj:`vlivepy.variables.override_http2`.
+    """
+    global _transport
+
+    with _transport_lock:
+        _transport = transport
+
+
+@contextmanager
+def useTransport(
+        transport: Transport
+):
+    """Use transport for every request inside `with` block of current thread(or task).
+
+    .. code-block:: python
+
+        with useTransport(ReplayTransport("records")):
+            post = Post("0-18396482")
+
+    Arguments:
+        transport (:class:`Transport`) : Transport to use.
+    """
+    token = _scoped_transport.set(transport)
+    try:
+        yield transport
+    finally:
+        _scoped_transport.reset(token)
@@ -7,10 +7,11 @@ from typing import (
 )
 
 from bs4 import BeautifulSoup
-import reqWrapper
 
 from . import variables as gv
 from .exception import auto_raise, APINetworkError
+from .router import rew_get
+from .tracing import traced
 
 
 class UpcomingVideo(object):
@@ -121,6 +122,58 @@ class UpcomingVideo(object):
         return self.__product
 
 
+def upcoming_list_parser(
+        html: str
+) -> List[UpcomingVideo]:
+    """Parse each item of upcoming webpage to :class:`UpcomingVideo` object.
+
+    Arguments:
+        html (:class:`str`) : Html text of upcoming webpage.
+
+    Returns:
+        List of :class:`UpcomingVideo`
+    """
+    upcoming = []
+
+    soup = BeautifulSoup(html, 'html.parser')
+    soup_upcoming_list = soup.find("ul", {"class": "upcoming_list"})
+    for item in soup_upcoming_list.find_all("li"):
+        item_type_vod = False
+
+        # find replay class in <li> tag
+        soup_item_class_tag = item.get("class")
+        if soup_item_class_tag is not None:
+            if soup_item_class_tag[0] == "replay":
+                item_type_vod = True
+
+        soup_time = item.find("span", {"class": "time"})
+        release_time = soup_time.get_text()
+
+        # get title <a> tag
+        soup_info_tag = item.find("a", {"class": "_title"})
+
+        # parse upcoming data
+        ga_name = soup_info_tag.get("data-ga-name")
+        ga_type = soup_info_tag.get("data-ga-type")
+        ga_seq = soup_info_tag.get("data-ga-seq")
+        ga_cseq = soup_info_tag.get("data-ga-cseq")
+        ga_cname = soup_info_tag.get("data-ga-cname")
+        ga_ctype = soup_info_tag.get("data-ga-ctype")
+        ga_product = soup_info_tag.get("data-ga-product")
+        if ga_type == "UPCOMING":
+            if item_type_vod:
+                ga_type += "_VOD"
+            else:
+                ga_type += "_LIVE"
+
+        # create item and append
+        upcoming.append(UpcomingVideo(seq=ga_seq, time=release_time, cseq=ga_cseq, cname=ga_cname,
+                                      ctype=ga_ctype, name=ga_name, product=ga_product, type=ga_type))
+
+    return upcoming
+
+
+@traced
 def getUpcomingList(
         date: Union[str, int] = None,
         silent: bool = False
@@ -134,53 +187,11 @@ def getUpcomingList(
     Returns:
         List of :class:`UpcomingVideo`
     """
-    params = dict()
-    if date is not None:
-        params.update({"d": date})
-
     # make request
-    url = "https://www.vlive.tv/upcoming"
-    sr = reqWrapper.get(url, params=params, headers=gv.HeaderCommon)
+    sr = rew_get(**gv.endpoint_upcoming(date), endpoint="endpoint_upcoming")
 
     if sr.success:
-        upcoming = []
-
-        soup = BeautifulSoup(sr.response.text, 'html.parser')
-        soup_upcoming_list = soup.find("ul", {"class": "upcoming_list"})
-        for item in soup_upcoming_list.find_all("li"):
-            item_type_vod = False
-
-            # find replay class in <li> tag
-            soup_item_class_tag = item.get("class")
-            if soup_item_class_tag is not None:
-                if soup_item_class_tag[0] == "replay":
-                    item_type_vod = True
-
-            soup_time = item.find("span", {"class": "time"})
-            release_time = soup_time.get_text()
-
-            # get title <a> tag
-            soup_info_tag = item.find("a", {"class": "_title"})
-
-            # parse upcoming data
-            ga_name = soup_info_tag.get("data-ga-name")
-            ga_type = soup_info_tag.get("data-ga-type")
-            ga_seq = soup_info_tag.get("data-ga-seq")
-            ga_cseq = soup_info_tag.get("data-ga-cseq")
-            ga_cname = soup_info_tag.get("data-ga-cname")
-            ga_ctype = soup_info_tag.get("data-ga-ctype")
-            ga_product = soup_info_tag.get("data-ga-product")
-            if ga_type == "UPCOMING":
-                if item_type_vod:
-                    ga_type += "_VOD"
-                else:
-                    ga_type += "_LIVE"
-
-            # create item and append
-            upcoming.append(UpcomingVideo(seq=ga_seq, time=release_time, cseq=ga_cseq, cname=ga_cname,
-                                          ctype=ga_ctype, name=ga_name, product=ga_product, type=ga_type))
-
-        return upcoming
+        return upcoming_list_parser(sr.response.text)
     else:
         auto_raise(APINetworkError, silent=silent)
 
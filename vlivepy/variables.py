@@ -10,6 +10,48 @@ override_user_agent = (
     "Safari/537.36"
 )
 override_accept_language = "ko-KR,ko;q=0.9,en-US;q=0.8,en;q=0.7"
+override_pool_size = 10
+override_pool_keep_alive = True
+override_rate_limits = {
+    "www.vlive.tv": (10, 10),
+    "apis.naver.com": (5, 5),
+    "api.vfan.vlive.tv": (5, 5),
+}
+override_retry_attempts = 5
+override_retry_backoff = 0.5
+override_retry_backoff_max = 30
+override_breaker_threshold = 5
+override_breaker_reset_timeout = 30
+override_http2 = False
+override_single_flight = True
+override_json_backend = "auto"
+override_prefetch_pages = 0
+override_comment_workers = 4
+override_load_workers = 8
+override_page_size = None
+override_adaptive_page_sizes = [100, 50, 20]
+override_cache_path = "~/.cache/vlivepy/responses.sqlite"
+override_cache_max_size = 256 * 1024 * 1024
+override_cache_ttl = {
+    "endpoint_decode_channel_code": 30 * 24 * 3600,
+    "endpoint_channel_webpage": 3600,
+    "endpoint_channel_grouped_boards": 3600,
+    "endpoint_post": 600,
+    "endpoint_official_video_post": 600,
+    "endpoint_schedule_data": 600,
+    "endpoint_comment_data": 600,
+    "endpoint_board_posts": 60,
+    "endpoint_post_comments": 60,
+    "endpoint_post_star_comments": 60,
+    "endpoint_comment_nested": 60,
+    "endpoint_upcoming": 60,
+    "endpoint_live_status": 5,
+    "endpoint_vod_inkey": 0,
+    "endpoint_fvideo_inkey": 0,
+    "endpoint_vod_play_info": 0,
+    "endpoint_live_play_info": 0,
+    "*": 0,
+}
 
 
 # VLive React App ID
@@ -27,6 +69,35 @@ HeaderCommon = {
     "Accept-Language": override_accept_language
 }
 
+# Field profiles of post and schedule endpoints. "full" is every field models use.
+PostFieldProfiles = {
+    "minimal": "postId,contentType,channelCode,boardId,officialVideo{videoSeq,vodId,type}",
+    "listing": "author,authorId,board{boardId,title,boardType},boardId,channel{channelName,channelCode},"
+               "channelCode,commentCount,contentType,createdAt,emotionCount,officialVideo,postId,thumbnail,"
+               "title,url,writtenIn",
+    "full": "attachments,author,authorId,availableActions,board{boardId,title,boardType,"
+            "readAllowedLabel,payRequired,includedCountries,excludedCountries},boardId,"
+            "body,channel{channelName,channelCode},channelCode,commentCount,contentType,"
+            "createdAt,emotionCount,excludedCountries,includedCountries,isViewerBookmarked,"
+            "isCommentEnabled,isHiddenFromStar,lastModifierMember,notice,officialVideo,"
+            "originPost,plainBody,postId,postVersion,reservation,starReactions,targetMember,"
+            "targetMemberId,thumbnail,title,url,smartEditorAsHtml,viewerEmotionId,writtenIn",
+}
+
+ScheduleFieldProfiles = {
+    "minimal": "scheduleId,type,startAt,postId,videoSeq",
+    "listing": "scheduleId,title,type,startAt,timezoneId,postId,videoSeq,author,channel{channelCode,channelName},"
+               "commentCount,emotionCount,writtenIn",
+    "full": "scheduleId,title,description,alarm,location,postId,videoSeq,officialVideo,photos,author,"
+            "timezoneId,type,startAt,commentCount,emotionCount,commentWritable,availableActions,writtenIn,"
+            "url,viewerEmotionId,channel{channelCode,channelName},post{url},timeUsing,lastModifierMember",
+}
+
+
+def field_projection(profiles, fields):
+    # Name of profile, or comma separated fields as is
+    return profiles.get(fields, fields)
+
 
 # Referer
 def referer_post(post):
@@ -49,20 +120,15 @@ def referer_channel(channel_code):
 
 
 # Endpoint
-def endpoint_post(post):
+def endpoint_post(post, fields="full"):
     url = "https://www.vlive.tv/globalv-web/vam-web/post/v1.0/post-%s" % post
     params = {
-        "fields": "attachments,author,authorId,availableActions,board{boardId,title,boardType,"
-                  "readAllowedLabel,payRequired,includedCountries,excludedCountries},boardId,"
-                  "body,channel{channelName,channelCode},channelCode,commentCount,contentType,"
-                  "createdAt,emotionCount,excludedCountries,includedCountries,isViewerBookmarked,"
-                  "isCommentEnabled,isHiddenFromStar,lastModifierMember,notice,officialVideo,"
-                  "originPost,plainBody,postId,postVersion,reservation,starReactions,targetMember,"
-                  "targetMemberId,thumbnail,title,url,smartEditorAsHtml,viewerEmotionId,writtenIn,"
-                  "playlist.limit(30)",
+        "fields": field_projection(PostFieldProfiles, fields),
         **AppId,
         **LocaleParam
     }
+    if fields == "full":
+        params["fields"] += ",playlist.limit(30)"
     headers = {
         **referer_post(post),
         **HeaderCommon
@@ -114,18 +180,12 @@ def endpoint_fvideo_inkey(fvideo):
     return {"url": url, "params": params, "headers": headers}
 
 
-def endpoint_official_video_post(videoSeq):
+def endpoint_official_video_post(videoSeq, fields="full"):
     url = "https://www.vlive.tv/globalv-web/vam-web/post/v1.0/officialVideoPost-%s" % videoSeq
     params = {
         **AppId,
         **LocaleParam,
-        "fields": "attachments,author,authorId,availableActions,board{boardId,title,boardType,"
-                  "readAllowedLabel,payRequired,includedCountries,excludedCountries},boardId,"
-                  "body,channel{channelName,channelCode},channelCode,commentCount,contentType,"
-                  "createdAt,emotionCount,excludedCountries,includedCountries,isViewerBookmarked,"
-                  "isCommentEnabled,isHiddenFromStar,lastModifierMember,notice,officialVideo,"
-                  "originPost,plainBody,postId,postVersion,reservation,starReactions,targetMember,"
-                  "targetMemberId,thumbnail,title,url,smartEditorAsHtml,viewerEmotionId,writtenIn"
+        "fields": field_projection(PostFieldProfiles, fields)
     }
     headers = {
         **HeaderCommon,
@@ -192,7 +252,7 @@ def endpoint_vod_play_info(vodId, inkey):
     return {"url": url, "params": params, "headers": headers}
 
 
-def endpoint_post_comment_template(prefix, srl, postfix=None, after=None, field: list = None):
+def endpoint_post_comment_template(prefix, srl, postfix=None, after=None, field: list = None, limit=None):
     if field is None:
         field = []
 
@@ -210,6 +270,9 @@ def endpoint_post_comment_template(prefix, srl, postfix=None, after=None, field:
     if after:
         params.update({"after": after})
 
+    if limit:
+        params.update({"limit": limit})
+
     for item in field:
         params["fields"] += ",%s" % item
 
@@ -221,15 +284,15 @@ def endpoint_post_comment_template(prefix, srl, postfix=None, after=None, field:
     return {"url": url, "params": params, "headers": headers}
 
 
-def endpoint_post_comments(post, after=None):
+def endpoint_post_comments(post, after=None, limit=None):
     return endpoint_post_comment_template(
-        "post", post, postfix="comments", after=after, field=["latestComments"]
+        "post", post, postfix="comments", after=after, field=["latestComments"], limit=limit
     )
 
 
-def endpoint_post_star_comments(post, after=None):
+def endpoint_post_star_comments(post, after=None, limit=None):
     return endpoint_post_comment_template(
-        "post", post, postfix="starComments", after=after
+        "post", post, postfix="starComments", after=after, limit=limit
     )
 
 
@@ -239,20 +302,18 @@ def endpoint_comment_data(post):
     )
 
 
-def endpoint_comment_nested(post, after=None):
+def endpoint_comment_nested(post, after=None, limit=None):
     return endpoint_post_comment_template(
-        "comment", post, postfix="comments", after=after
+        "comment", post, postfix="comments", after=after, limit=limit
     )
 
 
-def endpoint_schedule_data(schedule):
+def endpoint_schedule_data(schedule, fields="full"):
     url = "https://www.vlive.tv/globalv-web/vam-web/schedule/v1.0/schedule-%s" % schedule
     params = {
         **AppId,
         **LocaleParam,
-        "fields": "scheduleId,title,description,alarm,location,postId,videoSeq,officialVideo,photos,author,"
-                  "timezoneId,type,startAt,commentCount,emotionCount,commentWritable,availableActions,writtenIn,"
-                  "url,viewerEmotionId,channel{channelCode,channelName},post{url},timeUsing,lastModifierMember"
+        "fields": field_projection(ScheduleFieldProfiles, fields)
     }
     headers = {
         **HeaderCommon,
@@ -303,13 +364,13 @@ def endpoint_channel_grouped_boards(channel_code):
     return {"url": url, "headers": headers, "params": params}
 
 
-def endpoint_board_posts(channel_code, board, after=None, latest=False):
+def endpoint_board_posts(channel_code, board, after=None, latest=False, limit=None):
     url = "https://www.vlive.tv/globalv-web/vam-web/post/v1.0/board-%s/posts" % board
     params = {
         **AppId,
         **LocaleParam,
         "fields": "postId,title,author{nickname},createdAt,contentType",
-        "limit": 20,
+        "limit": limit or 20,
     }
     headers = {
         **HeaderCommon,
@@ -326,3 +387,15 @@ def endpoint_board_posts(channel_code, board, after=None, latest=False):
         params.update({'sortType': "OLDEST"})
 
     return {"url": url, "headers": headers, "params": params}
+
+
+def endpoint_upcoming(date=None):
+    url = "https://www.vlive.tv/upcoming"
+    params = dict()
+    if date is not None:
+        params.update({"d": date})
+    headers = {
+        **HeaderCommon
+    }
+
+    return {"url": url, "params": params, "headers": headers}
@@ -7,15 +7,18 @@ from typing import (
 
 from . import variables as gv
 from .exception import auto_raise, APINetworkError, APIJSONParesError, APIServerResponseError
-from .parser import response_json_stripper
+from .parser import response_json_loader, response_json_stripper
 from .router import rew_get
 from .session import UserSession
+from .tracing import traced
 
 
+@traced
 def getOfficialVideoPost(
         video_seq: Union[str, int],
         session: UserSession = None,
-        silent: bool = False
+        silent: bool = False,
+        fields: str = "full"
 ) -> Optional[dict]:
     """Get detailed official video post data.
 
@@ -23,22 +26,25 @@ def getOfficialVideoPost(
         video_seq (:class:`str`) : Unique seq id of the video post to load data.
         session (:class:`vlivepy.UserSession`, optional) : Session for loading data with permission, defaults to None.
         silent (:class:`bool`, optional) : Return None instead of raising exception, defaults to False.
+        fields (:class:`str`, optional) : Field profile ("minimal", "listing" or "full") or comma separated fields,
+            defaults to "full".
 
     Returns:
         :class:`dict`. Parsed json data
     """
 
-    sr = rew_get(**gv.endpoint_official_video_post(video_seq),
-                 session=session, wait=0.5, status=[200, 403])
+    sr = rew_get(**gv.endpoint_official_video_post(video_seq, fields), endpoint="endpoint_official_video_post",
+                 session=session, status=[200, 403])
 
     if sr.success:
-        return response_json_stripper(sr.response.json(), silent=silent)
+        return response_json_stripper(response_json_loader(sr.response), silent=silent)
     else:
         auto_raise(APINetworkError, silent)
 
     return None
 
 
+@traced
 def getLivePlayInfo(
         video_seq: Union[str, int],
         session: UserSession = None,
@@ -63,11 +69,11 @@ def getLivePlayInfo(
         vpdid2 = getVpdid2(session, silent=silent)
 
     # Make request
-    sr = rew_get(**gv.endpoint_live_play_info(video_seq, vpdid2),
+    sr = rew_get(**gv.endpoint_live_play_info(video_seq, vpdid2), endpoint="endpoint_live_play_info",
                  session=session, status=[200, 403])
 
     if sr.success:
-        json_response = sr.response.json()
+        json_response = response_json_loader(sr.response)
         if json_response['code'] != 1000:
             auto_raise(
                 APIServerResponseError("Video-%s is not live or reserved live. It may be a VOD" % video_seq),
@@ -81,6 +87,7 @@ def getLivePlayInfo(
     return None
 
 
+@traced
 def getLiveStatus(
         video_seq: Union[str, int],
         silent: bool = False
@@ -96,11 +103,11 @@ def getLiveStatus(
     """
 
     # Make request
-    sr = rew_get(**gv.endpoint_live_status(video_seq),
-                 wait=0.2, status=[200])
+    sr = rew_get(**gv.endpoint_live_status(video_seq), endpoint="endpoint_live_status",
+                 status=[200])
 
     if sr.success:
-        json_response = sr.response.json()
+        json_response = response_json_loader(sr.response)
         if json_response['code'] != 1000:
             auto_raise(
                 APIServerResponseError("Video-%s is not live or reserved live. It may be a VOD" % video_seq),
@@ -114,6 +121,7 @@ def getLiveStatus(
     return None
 
 
+@traced
 def getVodId(
         video_seq: Union[str, int],
         silent: bool = False
@@ -129,7 +137,7 @@ def getVodId(
         :class:`str`. Parsed VOD id
     """
 
-    data = getOfficialVideoPost(video_seq, silent=silent)
+    data = getOfficialVideoPost(video_seq, silent=silent, fields="minimal")
 
     if data is not None:
         if 'officialVideo' in data:
@@ -143,6 +151,7 @@ def getVodId(
     return None
 
 
+@traced
 def getInkeyData(
         video_seq: Union[str, int],
         session: UserSession = None,
@@ -160,20 +169,21 @@ def getInkeyData(
     """
 
     # Make request
-    sr = rew_get(**gv.endpoint_vod_inkey(video_seq),
-                 wait=0.5, session=session, status=[200, 403])
+    sr = rew_get(**gv.endpoint_vod_inkey(video_seq), endpoint="endpoint_vod_inkey",
+                 session=session, status=[200, 403])
 
     if sr.success:
         if sr.status_code == 403:
             auto_raise(APIServerResponseError("Video %s is not VOD" % video_seq), silent)
         else:
-            return response_json_stripper(sr.response.json(), silent=silent)
+            return response_json_stripper(response_json_loader(sr.response), silent=silent)
     else:
         auto_raise(APINetworkError, silent)
 
     return None
 
 
+@traced
 def getVpdid2(
         session: UserSession,
         silent: bool = False
@@ -198,6 +208,7 @@ def getVpdid2(
         return inkey['vpdid2']
 
 
+@traced
 def getVodPlayInfo(
         video_seq: Union[str, int],
         vod_id: str = None,
@@ -222,15 +233,16 @@ def getVodPlayInfo(
         vod_id = getVodId(video_seq)
 
     # make request
-    sr = rew_get(**gv.endpoint_vod_play_info(vod_id, inkey),
-                 session=session, wait=0.3, status=[200, 403])
+    sr = rew_get(**gv.endpoint_vod_play_info(vod_id, inkey), endpoint="endpoint_vod_play_info",
+                 session=session, status=[200, 403])
 
     if sr.success:
-        return response_json_stripper(sr.response.json(), silent=silent)
+        return response_json_stripper(response_json_loader(sr.response), silent=silent)
     else:
         auto_raise(APINetworkError, silent=silent)
 
 
+@traced
 def getOfficialVideoData(
         video_seq: Union[str, int],
         session: UserSession = None,